@@ -1,10 +1,19 @@
 from .dice_game import DiceGame
-from .models import BetDecision, BetResult, BetType, GameConfig, GameState, VaultConfig
+from .models import (
+    BetDecision,
+    BetResult,
+    BetResultBatch,
+    BetType,
+    GameConfig,
+    GameState,
+    VaultConfig,
+)
 
 __all__ = [
     "GameConfig",
     "VaultConfig",
     "BetResult",
+    "BetResultBatch",
     "BetType",
     "GameState",
     "BetDecision",
@@ -1,11 +1,33 @@
 import random
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+
 from .constants import MAX_MULTIPLIER, MIN_MULTIPLIER
-from .models import BetResult, BetType, GameConfig
+from .models import BetResult, BetResultBatch, BetType, GameConfig
 from .provably_fair import ProvablyFairGenerator
 
+# Decimal immuable : une seule instance pour tous les payouts et mises nuls
+_ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=1024)
+def _decimal_multiplier(multiplier: float) -> Decimal:
+    """Multiplicateur en Decimal, converti une fois par valeur (les targets se répètent)."""
+    return Decimal(str(multiplier))
+
+
+def _float_to_decimal(value: float) -> Decimal:
+    """
+    Convertit un résultat de calcul float en Decimal, arrondi à 12 chiffres significatifs.
+
+    L'arrondi retire le bruit binaire des derniers chiffres (ex. -0.010000000000000009
+    donne -0.01) pour ne pas le propager dans l'API Decimal.
+    """
+    return Decimal(f"{value:.12g}")
+
 
 class DiceGame:
     config: GameConfig
@@ -43,8 +65,13 @@ class DiceGame:
             self.rng = random.Random(seed)
             self.provably_fair = None
 
-    def calculate_win_chance(self, target: float, bet_type: BetType) -> float:
-        """Calcule la probabilité de gagner selon le target et le type de pari."""
+    def _dice_math(self, target: float, bet_type: BetType) -> tuple[float, float, float]:
+        """
+        Calcule en une passe les grandeurs d'un pari OVER/UNDER.
+
+        Returns:
+            (win_chance en %, multiplicateur, valeur attendue par unité misée)
+        """
         if target < 0.01 or target > 99.99:
             raise ValueError("Target must be between 0.01 and 99.99")
 
@@ -56,8 +83,22 @@ class DiceGame:
             raw_chance = 100.0 - target
 
         # Apply house edge
-        actual_chance = raw_chance * (1 - self.house_edge)
-        return actual_chance
+        edge_factor = 1 - self.house_edge
+        win_chance = raw_chance * edge_factor
+
+        if win_chance <= 0:
+            multiplier = MAX_MULTIPLIER
+        else:
+            # Multiplier = 100 / win_chance_raw
+            multiplier = max(
+                MIN_MULTIPLIER, min(MAX_MULTIPLIER, 100.0 / (win_chance / edge_factor))
+            )
+
+        return win_chance, multiplier, multiplier * (win_chance / 100) - 1.0
+
+    def calculate_win_chance(self, target: float, bet_type: BetType) -> float:
+        """Calcule la probabilité de gagner selon le target et le type de pari."""
+        return self._dice_math(target, bet_type)[0]
 
     def calculate_win_chance_from_multiplier(self, multiplier: float) -> float:
         """Méthode legacy pour compatibilité - calcule via multiplier."""
@@ -89,16 +130,7 @@ class DiceGame:
 
     def multiplier_from_target(self, target: float, bet_type: BetType) -> float:
         """Convertit un target en multiplicateur selon le type de pari."""
-        win_chance = self.calculate_win_chance(target, bet_type)
-
-        if win_chance <= 0:
-            return MAX_MULTIPLIER
-
-        # Multiplier = 100 / win_chance_raw
-        win_chance_raw = win_chance / (1 - self.house_edge)
-        multiplier = 100.0 / win_chance_raw
-
-        return max(MIN_MULTIPLIER, min(MAX_MULTIPLIER, multiplier))
+        return self._dice_math(target, bet_type)[1]
 
     def calculate_threshold(self, target: float, bet_type: BetType) -> float:
         """Calcule le seuil de victoire - pour compatibilité, retourne le target."""
@@ -118,23 +150,22 @@ class DiceGame:
         Returns:
             Résultat du pari avec informations provably fair et OVER/UNDER
         """
-        if bet_amount < self.config.min_bet_ltc:
-            raise ValueError(f"Minimum bet is {self.config.min_bet_ltc} LTC")
-
-        if bet_amount > self.config.max_bet_ltc:
-            raise ValueError(f"Maximum bet is {self.config.max_bet_ltc} LTC")
+        self._check_bet_amount(bet_amount)
 
         if target < 0.01 or target > 99.99:
             raise ValueError("Target must be between 0.01 and 99.99")
 
         # Calculer le multiplicateur et la condition de victoire
-        multiplier = self.multiplier_from_target(target, bet_type)
+        multiplier = self._dice_math(target, bet_type)[1]
         threshold = self.calculate_threshold(target, bet_type)
 
         # Générer le résultat selon le mode
         if self.provably_fair:
             # Mode provably fair (normal)
-            seed_info = self.provably_fair.get_current_seed_info()
+            seeds = self.provably_fair.current_seeds
+            server_seed_hash = seeds.server_seed_hash
+            client_seed = seeds.client_seed
+            nonce = seeds.nonce
             roll_value = self.provably_fair.generate_dice_result()
 
             # Déterminer la victoire selon le type de pari
@@ -149,14 +180,13 @@ class DiceGame:
                 won=won,
                 threshold=threshold,
                 amount=bet_amount,
-                payout=bet_amount * Decimal(str(multiplier)) if won else Decimal("0"),
+                payout=bet_amount * _decimal_multiplier(multiplier) if won else _ZERO,
                 multiplier=multiplier,
                 bet_type=bet_type,
                 target=target,
-                server_seed_hash=str(seed_info["server_seed_hash"]),
-                client_seed=str(seed_info["client_seed"]),
-                nonce=int(seed_info["nonce"])
-                - 1,  # Le nonce a été incrémenté dans generate_dice_result
+                server_seed_hash=server_seed_hash,
+                client_seed=client_seed,
+                nonce=nonce - 1,  # Le nonce a été incrémenté dans generate_dice_result
             )
         else:
             # Mode legacy pour tests
@@ -174,7 +204,7 @@ class DiceGame:
                 won=won,
                 threshold=threshold,
                 amount=bet_amount,
-                payout=bet_amount * Decimal(str(multiplier)) if won else Decimal("0"),
+                payout=bet_amount * _decimal_multiplier(multiplier) if won else _ZERO,
                 multiplier=multiplier,
                 bet_type=bet_type,
                 target=target,
@@ -182,6 +212,113 @@ class DiceGame:
 
         return result
 
+    def roll_scalar(
+        self, bet_amount: Decimal, target: float, bet_type: BetType = BetType.UNDER
+    ) -> tuple[float, bool, Decimal]:
+        """
+        Lance un dé comme ``roll`` sans construire de BetResult.
+
+        Consomme le même tirage que ``roll`` : avec le même seed, les deux
+        méthodes donnent la même suite de rolls.
+
+        Args:
+            bet_amount: Montant du pari
+            target: Nombre cible (0.01-99.99)
+            bet_type: Type de pari (UNDER ou OVER)
+
+        Returns:
+            (roll, won, payout)
+        """
+        self._check_bet_amount(bet_amount)
+        multiplier = self._dice_math(target, bet_type)[1]
+
+        if self.provably_fair:
+            roll_value = self.provably_fair.generate_dice_result()
+        else:
+            assert self.rng is not None
+            roll_value = self.rng.random() * 100
+
+        won = roll_value < target if bet_type == BetType.UNDER else roll_value > target
+        return roll_value, won, bet_amount * _decimal_multiplier(multiplier) if won else _ZERO
+
+    def _check_bet_amount(self, bet_amount: Decimal) -> None:
+        """Vérifie que la mise respecte les limites de la configuration."""
+        if bet_amount < self.config.min_bet_ltc:
+            raise ValueError(f"Minimum bet is {self.config.min_bet_ltc} LTC")
+
+        if bet_amount > self.config.max_bet_ltc:
+            raise ValueError(f"Maximum bet is {self.config.max_bet_ltc} LTC")
+
+    def roll_batch(
+        self,
+        amounts: Any,
+        targets: Any,
+        bet_types: Any = BetType.UNDER,
+        n: int | None = None,
+    ) -> BetResultBatch:
+        """
+        Lance un lot de dés en une passe vectorisée.
+
+        Les arguments sont diffusés (broadcast) entre eux : un scalaire s'applique à
+        tout le lot. Les montants sont traités en float, ce lot sert aux simulations
+        statistiques ; ``roll`` reste la référence pour les montants exacts.
+
+        Args:
+            amounts: Montant(s) des paris
+            targets: Nombre(s) cible(s) (0.01-99.99)
+            bet_types: Type(s) de pari (UNDER ou OVER)
+            n: Taille du lot (par défaut celle des arguments diffusés)
+
+        Returns:
+            Résultats du lot, un tableau par champ
+        """
+        amounts_arr = np.asarray(amounts, dtype=np.float64)
+        targets_arr = np.asarray(targets, dtype=np.float64)
+        under = np.asarray(bet_types) == BetType.UNDER
+        if n is not None:
+            shape: tuple[int, ...] = (n,)
+        else:
+            shape = np.broadcast_shapes(amounts_arr.shape, targets_arr.shape, under.shape)
+        amounts_arr = np.broadcast_to(amounts_arr, shape)
+        targets_arr = np.broadcast_to(targets_arr, shape)
+        under = np.broadcast_to(under, shape)
+
+        if (amounts_arr < float(self.config.min_bet_ltc)).any():
+            raise ValueError(f"Minimum bet is {self.config.min_bet_ltc} LTC")
+
+        if (amounts_arr > float(self.config.max_bet_ltc)).any():
+            raise ValueError(f"Maximum bet is {self.config.max_bet_ltc} LTC")
+
+        if ((targets_arr < 0.01) | (targets_arr > 99.99)).any():
+            raise ValueError("Target must be between 0.01 and 99.99")
+
+        # Même calcul que _dice_math, élément par élément
+        edge_factor = 1 - self.house_edge
+        win_chances = np.where(under, targets_arr, 100.0 - targets_arr) * edge_factor
+        multipliers = np.clip(100.0 / (win_chances / edge_factor), MIN_MULTIPLIER, MAX_MULTIPLIER)
+
+        size = int(np.prod(shape))
+        if self.provably_fair:
+            # Un roll par nonce, générés en un seul lot
+            rolls = np.array(self.provably_fair.generate_dice_results(size), dtype=np.float64)
+        else:
+            assert self.rng is not None
+            # Générateur NumPy dérivé du RNG legacy : reproductible avec le même seed
+            generator = np.random.default_rng(self.rng.getrandbits(64))
+            rolls = generator.random(size) * 100
+        rolls = rolls.reshape(shape)
+
+        won = np.where(under, rolls < targets_arr, rolls > targets_arr)
+        return BetResultBatch(
+            rolls=rolls,
+            won=won,
+            targets=targets_arr,
+            under=under,
+            amounts=amounts_arr,
+            payouts=np.where(won, amounts_arr * multipliers, 0.0),
+            multipliers=multipliers,
+        )
+
     def roll_legacy(self, bet_amount: Decimal, multiplier: float) -> BetResult:
         """
         Méthode legacy pour compatibilité avec l'ancien système basé sur multiplicateur.
@@ -192,22 +329,19 @@ class DiceGame:
 
     def expected_value(self, bet_amount: Decimal, target: float, bet_type: BetType) -> Decimal:
         """Calcule la valeur attendue d'un pari OVER/UNDER."""
-        win_chance = self.calculate_win_chance(target, bet_type) / 100
-        multiplier = self.multiplier_from_target(target, bet_type)
-        expected_win = bet_amount * Decimal(str(multiplier)) * Decimal(str(win_chance))
-        return expected_win - bet_amount
+        # Calcul en float (les probabilités le sont déjà), Decimal en sortie seulement
+        return _float_to_decimal(float(bet_amount) * self._dice_math(target, bet_type)[2])
 
     def expected_value_legacy(self, bet_amount: Decimal, multiplier: float) -> Decimal:
         """Méthode legacy pour compatibilité."""
         win_chance = self.calculate_win_chance_from_multiplier(multiplier) / 100
-        expected_win = bet_amount * Decimal(str(multiplier)) * Decimal(str(win_chance))
-        return expected_win - bet_amount
+        return _float_to_decimal(float(bet_amount) * (multiplier * win_chance - 1.0))
 
     def kelly_criterion(self, bankroll: Decimal, target: float, bet_type: BetType) -> Decimal:
         """Calcule le critère de Kelly pour un pari OVER/UNDER."""
-        win_prob = self.calculate_win_chance(target, bet_type) / 100
+        win_chance, multiplier, _ = self._dice_math(target, bet_type)
+        win_prob = win_chance / 100
         lose_prob = 1 - win_prob
-        multiplier = self.multiplier_from_target(target, bet_type)
 
         b = multiplier - 1  # Net odds received on the bet
 
@@ -218,7 +352,7 @@ class DiceGame:
 
         # Kelly can be negative (don't bet) or > 1 (impossible)
         if kelly_fraction <= 0:
-            return Decimal("0")
+            return _ZERO
 
         # Apply Kelly fraction to bankroll
         # Usually we use fractional Kelly (e.g., 0.25 * kelly) for safety
@@ -240,7 +374,7 @@ class DiceGame:
 
         # Kelly can be negative (don't bet) or > 1 (impossible)
         if kelly_fraction <= 0:
-            return Decimal("0")
+            return _ZERO
 
         # Apply Kelly fraction to bankroll
         # Usually we use fractional Kelly (e.g., 0.25 * kelly) for safety
@@ -4,6 +4,8 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 from .constants import MIN_BET_LTC
 
 
@@ -38,7 +40,7 @@ class VaultConfig:
         return self.total_capital - self.vault_amount
 
 
-@dataclass
+@dataclass(slots=True)
 class BetResult:
     roll: float
     won: bool
@@ -86,6 +88,27 @@ class BetResult:
         }
 
 
+@dataclass
+class BetResultBatch:
+    """Résultats d'un lot de paris, stockés par colonnes (un tableau par champ)."""
+
+    rolls: np.ndarray
+    won: np.ndarray
+    targets: np.ndarray
+    under: np.ndarray
+    amounts: np.ndarray
+    payouts: np.ndarray
+    multipliers: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rolls)
+
+    @property
+    def profits(self) -> np.ndarray:
+        """Profit de chaque pari (payout - amount)."""
+        return self.payouts - self.amounts
+
+
 @dataclass
 class GameState:
     balance: Decimal
@@ -150,8 +173,9 @@ class GameState:
             self.wins_count += 1
             self.consecutive_wins += 1
             self.consecutive_losses = 0
-            self.balance += result.payout - result.amount
-            self.total_profit += result.payout - result.amount
+            profit = result.payout - result.amount
+            self.balance += profit
+            self.total_profit += profit
             # Mettre à jour le max de gains consécutifs
             self.max_consecutive_wins = max(self.max_consecutive_wins, self.consecutive_wins)
         else:
@@ -242,7 +266,7 @@ class GameState:
         return float(profit / self.session_start_balance)
 
 
-@dataclass
+@dataclass(slots=True)
 class BetDecision:
     amount: Decimal
     multiplier: float
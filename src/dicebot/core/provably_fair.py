@@ -6,13 +6,90 @@ vérifiables et transparents dans les jeux de dés.
 """
 
 import hashlib
-import hmac
 import secrets
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 
-@dataclass
+# Taille de bloc de SHA-512 et tables de masquage HMAC (RFC 2104)
+_SHA512_BLOCK_SIZE = 128
+_IPAD = bytes(x ^ 0x36 for x in range(256))
+_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+# Décalages des 25 chunks de 5 hex (20 bits) d'un digest SHA-512 de 512 bits
+_CHUNK_SHIFTS = tuple(range(512 - 20, 0, -20))
+_CHUNK_MASK = 0xFFFFF
+
+
+@lru_cache(maxsize=128)
+def _hmac_sha512_states(key: bytes) -> tuple[Any, Any]:
+    """
+    Prépare les états SHA-512 internes et externes d'un HMAC pour une clé.
+
+    Ces états ne dépendent que de la clé : les copier puis y ajouter le message
+    évite de refaire la compression des blocs clé ⊕ ipad/opad à chaque nonce.
+    Mis en cache par clé pour les vérifications répétées d'un même server seed ;
+    les états ne doivent jamais être modifiés, seulement copiés.
+    """
+    if len(key) > _SHA512_BLOCK_SIZE:
+        key = hashlib.sha512(key).digest()
+    key = key.ljust(_SHA512_BLOCK_SIZE, b"\0")
+    return hashlib.sha512(key.translate(_IPAD)), hashlib.sha512(key.translate(_OPAD))
+
+
+def _hmac_sha512_digest(states: tuple[Any, Any], message: bytes) -> bytes:
+    """HMAC-SHA512 d'un message à partir des états préparés par ``_hmac_sha512_states``."""
+    inner_state, outer_state = states
+    inner = inner_state.copy()
+    inner.update(message)
+    outer = outer_state.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+
+def _extract_bitsler_number(digest: bytes) -> int:
+    """
+    Extrait le nombre Bitsler (<= 999999) directement du digest binaire.
+
+    Équivalent à ``ProvablyFairGenerator._extract_valid_number`` sur le hash
+    hexadécimal : chaque chunk de 5 hex est un champ de 20 bits du digest, lu
+    par décalage sans passer par la chaîne hexadécimale.
+    """
+    # Premier chunk (accepté dans ~95% des cas) : 3 octets, 4 bits de trop
+    number = int.from_bytes(digest[:3], "big") >> 4
+    if number <= 999999:
+        return number
+
+    value = int.from_bytes(digest, "big")
+    for shift in _CHUNK_SHIFTS[1:]:
+        number = (value >> shift) & _CHUNK_MASK
+        if number <= 999999:
+            return number
+
+    # Fallback : aucun chunk valide, premier chunk modulo
+    return (value >> _CHUNK_SHIFTS[0]) % 1000000
+
+
+@lru_cache(maxsize=8192)
+def _compute_bitsler_roll(server_seed: str, client_seed: str, nonce: int) -> tuple[bytes, int]:
+    """
+    Recalcule le digest HMAC-SHA512 et le nombre Bitsler d'un pari.
+
+    Fonction pure des seeds et du nonce : mise en cache pour les vérifications
+    répétées d'un même pari (audits, re-vérifications de l'historique).
+
+    Returns:
+        (digest HMAC-SHA512, nombre extrait entre 0 et 999999)
+    """
+    message = f"{client_seed},{nonce}".encode()
+    digest = _hmac_sha512_digest(_hmac_sha512_states(server_seed.encode()), message)
+    return digest, _extract_bitsler_number(digest)
+
+
+@dataclass(slots=True)
 class SeedData:
     """Données de seed pour un système provably fair."""
 
@@ -23,7 +100,13 @@ class SeedData:
     @property
     def server_seed_hash(self) -> str:
         """Hash du server seed (visible publiquement)."""
-        return hashlib.sha256(self.server_seed.encode()).hexdigest()
+        return _server_seed_hash(self.server_seed)
+
+
+@lru_cache(maxsize=128)
+def _server_seed_hash(server_seed: str) -> str:
+    """SHA-256 du server seed, calculé une fois par seed et non à chaque pari."""
+    return hashlib.sha256(server_seed.encode()).hexdigest()
 
 
 class ProvablyFairGenerator:
@@ -53,6 +136,10 @@ class ProvablyFairGenerator:
         # Historique des seeds pour vérification
         self.seed_history: list[SeedData] = []
 
+        # États HMAC du server seed courant, recalculés quand il change
+        self._hmac_seed: str | None = None
+        self._hmac_states: tuple[Any, Any] = (None, None)
+
     def _generate_server_seed(self) -> str:
         """Génère un server seed cryptographiquement sécurisé."""
         return secrets.token_hex(32)  # 64 caractères hex
@@ -109,12 +196,10 @@ class ProvablyFairGenerator:
         """
         # Algorithme exact de Bitsler
         message = f"{self.current_seeds.client_seed},{self.current_seeds.nonce}"
-        seed_hash = hmac.new(
-            self.current_seeds.server_seed.encode(), message.encode(), hashlib.sha512
-        ).hexdigest()
+        digest = _hmac_sha512_digest(self._server_seed_states(), message.encode())
 
         # Extraire un nombre <= 999999
-        number = self._extract_valid_number(seed_hash)
+        number = _extract_bitsler_number(digest)
 
         # Calculer le résultat dice : (number % 10000) / 100
         dice_result = (number % 10000) / 100
@@ -124,6 +209,41 @@ class ProvablyFairGenerator:
 
         return dice_result
 
+    def generate_dice_results(self, count: int) -> list[float]:
+        """
+        Génère ``count`` résultats consécutifs en une seule passe.
+
+        Produit la même séquence que ``count`` appels à ``generate_dice_result``,
+        avec un préfixe de message préparé une fois pour le lot.
+
+        Args:
+            count: Nombre de résultats à générer
+
+        Returns:
+            Résultats entre 0.00 et 99.99, dans l'ordre des nonces
+        """
+        seeds = self.current_seeds
+        states = self._server_seed_states()
+        prefix = f"{seeds.client_seed},"
+
+        results = []
+        for nonce in range(seeds.nonce, seeds.nonce + count):
+            digest = _hmac_sha512_digest(states, f"{prefix}{nonce}".encode())
+            results.append((_extract_bitsler_number(digest) % 10000) / 100)
+
+        # Les nonces consommés par le lot
+        seeds.nonce += count
+
+        return results
+
+    def _server_seed_states(self) -> tuple[Any, Any]:
+        """États HMAC du server seed courant, préparés une fois par seed."""
+        server_seed = self.current_seeds.server_seed
+        if server_seed != self._hmac_seed:
+            self._hmac_states = _hmac_sha512_states(server_seed.encode())
+            self._hmac_seed = server_seed
+        return self._hmac_states
+
     def _extract_valid_number(self, seed_hash: str) -> int:
         """
         Extrait un nombre valide (<= 999999) du hash selon l'algorithme Bitsler.
@@ -165,10 +285,7 @@ class ProvablyFairGenerator:
         Returns:
             True si le résultat est correct
         """
-        message = f"{client_seed},{nonce}"
-        seed_hash = hmac.new(server_seed.encode(), message.encode(), hashlib.sha512).hexdigest()
-
-        number = self._extract_valid_number(seed_hash)
+        number = _compute_bitsler_roll(server_seed, client_seed, nonce)[1]
         calculated_result = (number % 10000) / 100
 
         # Tolérance pour les erreurs de floating point
@@ -226,12 +343,7 @@ class BitslerVerifier:
         """
         # Recalculer le résultat
         message = f"{client_seed},{nonce}"
-        seed_hash = hmac.new(server_seed.encode(), message.encode(), hashlib.sha512).hexdigest()
-
-        # Extraire le nombre valide
-        generator = ProvablyFairGenerator()
-        # Access private method for verification
-        number = generator._extract_valid_number(seed_hash)  # type: ignore[misc]  # noqa: SLF001
+        digest, number = _compute_bitsler_roll(server_seed, client_seed, nonce)
         calculated_result = (number % 10000) / 100
 
         # Vérifier
@@ -242,7 +354,7 @@ class BitslerVerifier:
             "client_seed": client_seed,
             "nonce": nonce,
             "message": message,
-            "hmac_sha512": seed_hash,
+            "hmac_sha512": digest.hex(),
             "extracted_number": number,
             "calculated_result": calculated_result,
             "expected_result": expected_result,
@@ -262,21 +374,37 @@ class BitslerVerifier:
             Statistiques de vérification
         """
         total = len(results)
-        valid = 0
-        invalid_results: list[dict[str, Any]] = []
 
+        # Regrouper par paire de seeds : états HMAC et préfixe préparés une fois
+        groups: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
         for i, result in enumerate(results):
-            verification = BitslerVerifier.verify_dice_result(
-                result["server_seed"],
-                result["client_seed"],
-                result["nonce"],
-                result["result"],
-            )
-
-            if verification["is_valid"]:
-                valid += 1
-            else:
-                invalid_results.append({"index": i, "verification": verification})
+            groups[(result["server_seed"], result["client_seed"])].append(i)
+
+        calculated = np.empty(total)
+        for (server_seed, client_seed), indices in groups.items():
+            states = _hmac_sha512_states(server_seed.encode())
+            prefix = f"{client_seed},"
+            for i in indices:
+                digest = _hmac_sha512_digest(states, f"{prefix}{results[i]['nonce']}".encode())
+                calculated[i] = (_extract_bitsler_number(digest) % 10000) / 100
+
+        actual = np.fromiter((result["result"] for result in results), np.float64, total)
+        is_valid = np.abs(calculated - actual) < 0.005
+        valid = int(is_valid.sum())
+
+        # Détails complets uniquement pour les résultats invalides
+        invalid_results: list[dict[str, Any]] = [
+            {
+                "index": int(i),
+                "verification": BitslerVerifier.verify_dice_result(
+                    results[i]["server_seed"],
+                    results[i]["client_seed"],
+                    results[i]["nonce"],
+                    results[i]["result"],
+                ),
+            }
+            for i in np.flatnonzero(~is_valid)
+        ]
 
         return {
             "total_results": total,
@@ -46,6 +46,11 @@ class GitHubClient:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
+        # One HTTP session per client: headers set once, connections reused
+        # across commands instead of a new TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
     def create_issue(self, issue: GitHubIssue) -> dict[str, Any]:
         """Create a new GitHub issue.
 
@@ -67,7 +72,7 @@ class GitHubClient:
             if issue.milestone:
                 payload["milestone"] = issue.milestone
 
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+            response = self.session.post(url, json=payload, timeout=30)
             response.raise_for_status()
 
             created_issue = response.json()
@@ -115,7 +120,7 @@ class GitHubClient:
             if labels:
                 params["labels"] = labels
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
             issues = response.json()
@@ -151,7 +156,7 @@ class GitHubClient:
             url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}"
             payload: dict[str, str] = {"state": "closed"}
 
-            response = requests.patch(url, headers=self.headers, json=payload, timeout=30)
+            response = self.session.patch(url, json=payload, timeout=30)
             response.raise_for_status()
 
             closed_issue = response.json()
@@ -183,7 +188,7 @@ class GitHubClient:
             url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}/comments"
             payload: dict[str, str] = {"body": comment}
 
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+            response = self.session.post(url, json=payload, timeout=30)
             response.raise_for_status()
 
             comment_data = response.json()
@@ -208,7 +213,7 @@ class GitHubClient:
         try:
             url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}"
 
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
             issue = response.json()
@@ -241,7 +246,7 @@ class GitHubClient:
             url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}/labels"
             payload: dict[str, list[str]] = {"labels": labels}
 
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+            response = self.session.post(url, json=payload, timeout=30)
             response.raise_for_status()
 
             updated_labels = response.json()
@@ -2,6 +2,8 @@
 Slack integration for DiceBot notifications and remote control.
 """
 
+import hashlib
+import hmac
 import json
 import logging
 import os
@@ -279,9 +281,6 @@ class SlackBot:
 
     def verify_request(self, headers: dict[str, Any], body: str) -> bool:
         """Verify Slack request signature."""
-        import hashlib
-        import hmac
-
         try:
             timestamp: str = headers.get("X-Slack-Request-Timestamp", "")
             signature: str = headers.get("X-Slack-Signature", "")
@@ -4,6 +4,7 @@ Flask server for handling Slack events and slash commands.
 
 import json
 import logging
+import re
 from collections.abc import Callable
 from typing import Any
 
@@ -11,6 +12,9 @@ from flask import Flask, Response, jsonify, request
 
 from .slack_bot import SlackBot
 
+# Bot mentions in the <@BOTID> format
+_MENTION_PATTERN = re.compile(r"<@[UW][A-Z0-9]+>")
+
 
 class SlackServer:
     """Flask server for Slack integration."""
@@ -171,9 +175,7 @@ class SlackServer:
     def _clean_mention_text(self, text: str) -> str:
         """Remove bot mention from text."""
         # Remove <@BOTID> format mentions
-        import re
-
-        cleaned = re.sub(r"<@[UW][A-Z0-9]+>", "", text).strip()
+        cleaned = _MENTION_PATTERN.sub("", text).strip()
         return cleaned
 
     def _handle_slash_command(
@@ -62,6 +62,27 @@ class Session:
             initial_bankroll=config.initial_bankroll,
             game_state=GameState(balance=config.initial_bankroll),
         )
+        # Stop balances cached with the values they derive from, see _stop_balances()
+        self._stop_balances_key: tuple[Decimal, float, float] | None = None
+        self._stop_balances_cache = (Decimal("0"), Decimal("0"))
+
+    def _stop_balances(self) -> tuple[Decimal, Decimal]:
+        # should_stop() runs after every bet: comparing the balance against these
+        # thresholds avoids a Decimal division per bet. They are recomputed when
+        # the initial bankroll or the config thresholds change.
+        key = (self.state.initial_bankroll, self.config.stop_loss, self.config.take_profit)
+        if key != self._stop_balances_key:
+            initial, stop_loss, take_profit = key
+            self._stop_balances_key = key
+            self._stop_balances_cache = (
+                initial * (1 + Decimal(repr(stop_loss))),
+                initial * (1 + Decimal(repr(take_profit))),
+            )
+        return self._stop_balances_cache
+
+    def _balance_ratio(self) -> float:
+        initial = self.state.initial_bankroll
+        return float((self.state.game_state.balance - initial) / initial)
 
     def should_stop(self) -> tuple[bool, str | None]:
         if not self.state.is_active:
@@ -73,15 +94,13 @@ class Session:
 
         # Check stop loss
         current_balance = self.state.game_state.balance
-        loss_ratio = float(
-            (current_balance - self.state.initial_bankroll) / self.state.initial_bankroll
-        )
-        if loss_ratio <= self.config.stop_loss:
-            return True, f"Stop loss triggered ({loss_ratio:.2%})"
+        stop_loss_balance, take_profit_balance = self._stop_balances()
+        if current_balance <= stop_loss_balance:
+            return True, f"Stop loss triggered ({self._balance_ratio():.2%})"
 
         # Check take profit
-        if loss_ratio >= self.config.take_profit:
-            return True, f"Take profit triggered ({loss_ratio:.2%})"
+        if current_balance >= take_profit_balance:
+            return True, f"Take profit triggered ({self._balance_ratio():.2%})"
 
         # Check consecutive losses
         if (
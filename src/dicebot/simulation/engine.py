@@ -17,6 +17,9 @@ from ..money.vault import Vault
 from ..strategies.base import BaseStrategy
 from ..utils.logger import JSONLinesLogger
 
+# Actions of skipped decisions that end the iteration without rolling
+_NON_BETTING_ACTIONS = frozenset({None, "", "change_seed", "toggle_bet_type"})
+
 
 class SimulationEngine:
     """Engine for running dice game simulations."""
@@ -117,8 +120,9 @@ class SimulationEngine:
                 # Get bet decision from strategy
                 decision = strategy.decide_bet(game_state)
 
-                # Log bet decision if logger is available
-                if self.logger:
+                # Log decisions that place no bet; placed bets are logged with
+                # their result as a single event below
+                if self.logger and decision.skip and decision.action in _NON_BETTING_ACTIONS:
                     self.logger.log_bet_decision(
                         decision, game_state, strategy.get_name(), session_id
                     )
@@ -213,9 +217,11 @@ class SimulationEngine:
                 session_state.update(result)
                 strategy.update_after_result(result)
 
-                # Log bet result if logger is available
+                # Log the bet (decision and result) if logger is available
                 if self.logger:
-                    self.logger.log_bet_result(result, game_state, strategy.get_name(), session_id)
+                    self.logger.log_bet(
+                        decision, result, game_state, strategy.get_name(), session_id
+                    )
 
         except Exception as e:
             session_state.end_session(f"error: {str(e)}")
@@ -107,91 +107,92 @@ class SimulationRunner:
 
             logger = JSONLinesLogger(log_filename, log_type=log_type, base_dir=log_dir)
 
-        # Create and run simulation
-        engine = SimulationEngine(vault_config, self.game_config, logger=logger)
-
-        if show_progress:
-            description = f"Running {strategy_name} strategy"
-            with progress_manager.progress.track_simulation(
-                description, num_sessions, show_stats=True
-            ) as progress_data:
-                _task_id, update_fn = progress_data  # type: ignore[misc]
-                if parallel:
-                    # For parallel execution, we can't track individual sessions
-                    sessions = engine.run_multiple_sessions(
-                        strategy,
-                        num_sessions,
-                        session_config,
-                        parallel=parallel,
-                        max_workers=max_workers,
-                    )
-                    update_fn(advance=num_sessions)  # Update all at once
-                else:
-                    # For sequential execution, track each session
-                    sessions: list[Any] = []
-                    for i in range(num_sessions):
-                        if i > 0:
-                            strategy.reset_state()
-                        session = engine.run_session(strategy, session_config)
-                        sessions.append(session)
-                        update_fn(session, advance=1)
-
-                        if not engine.vault.can_start_session():
-                            break
-        else:
-            sessions = engine.run_multiple_sessions(
-                strategy,
-                num_sessions,
-                session_config,
-                parallel=parallel,
-                max_workers=max_workers,
-            )
-
-        # Get summary
-        summary = engine.get_simulation_summary()
-
-        # Add strategy-specific metrics
-        strategy_metrics = {
-            "strategy_config": strategy_config,
-            "strategy_genome": strategy.get_genome(),
-            "strategy_fitness": strategy.calculate_fitness(),
-            "strategy_metrics": {
-                "total_bets": strategy.metrics.total_bets,
-                "win_rate": strategy.metrics.win_rate,
-                "roi": strategy.metrics.roi,
-                "max_bet_reached": float(strategy.metrics.max_bet_reached),
-                "max_consecutive_losses": strategy.metrics.max_consecutive_losses,
-                "average_confidence": strategy.metrics.average_confidence,
-                "profit_factor": strategy.metrics.profit_factor,
-            },
-        }
-
-        # Combine results
-        results = {
-            "simulation_summary": summary,
-            "strategy_info": strategy_metrics,
-            "sessions_data": engine.export_sessions_data(),
-            "simulation_metadata": {
-                "run_timestamp": datetime.now().isoformat(),
-                "num_sessions_requested": num_sessions,
-                "num_sessions_completed": len(sessions),
-                "session_config": session_config or {},
-                "total_capital": float(self.total_capital),
-            },
-        }
-
-        # Store results
-        self.simulation_results[strategy_name] = results
-
-        # Save to file if requested
-        if save_results:
-            self._save_strategy_results(strategy_name, results)
-
-        # Close logger if it was created
-        if logger:
-            logger.close()
+        try:
+            # Create and run simulation
+            engine = SimulationEngine(vault_config, self.game_config, logger=logger)
+
+            if show_progress:
+                description = f"Running {strategy_name} strategy"
+                with progress_manager.progress.track_simulation(
+                    description, num_sessions, show_stats=True
+                ) as progress_data:
+                    _task_id, update_fn = progress_data  # type: ignore[misc]
+                    if parallel:
+                        # For parallel execution, we can't track individual sessions
+                        sessions = engine.run_multiple_sessions(
+                            strategy,
+                            num_sessions,
+                            session_config,
+                            parallel=parallel,
+                            max_workers=max_workers,
+                        )
+                        update_fn(advance=num_sessions)  # Update all at once
+                    else:
+                        # For sequential execution, track each session
+                        sessions: list[Any] = []
+                        for i in range(num_sessions):
+                            if i > 0:
+                                strategy.reset_state()
+                            session = engine.run_session(strategy, session_config)
+                            sessions.append(session)
+                            update_fn(session, advance=1)
+
+                            if not engine.vault.can_start_session():
+                                break
+            else:
+                sessions = engine.run_multiple_sessions(
+                    strategy,
+                    num_sessions,
+                    session_config,
+                    parallel=parallel,
+                    max_workers=max_workers,
+                )
 
-        return results
+            # Get summary
+            summary = engine.get_simulation_summary()
+
+            # Add strategy-specific metrics
+            strategy_metrics = {
+                "strategy_config": strategy_config,
+                "strategy_genome": strategy.get_genome(),
+                "strategy_fitness": strategy.calculate_fitness(),
+                "strategy_metrics": {
+                    "total_bets": strategy.metrics.total_bets,
+                    "win_rate": strategy.metrics.win_rate,
+                    "roi": strategy.metrics.roi,
+                    "max_bet_reached": float(strategy.metrics.max_bet_reached),
+                    "max_consecutive_losses": strategy.metrics.max_consecutive_losses,
+                    "average_confidence": strategy.metrics.average_confidence,
+                    "profit_factor": strategy.metrics.profit_factor,
+                },
+            }
+
+            # Combine results
+            results = {
+                "simulation_summary": summary,
+                "strategy_info": strategy_metrics,
+                "sessions_data": engine.export_sessions_data(),
+                "simulation_metadata": {
+                    "run_timestamp": datetime.now().isoformat(),
+                    "num_sessions_requested": num_sessions,
+                    "num_sessions_completed": len(sessions),
+                    "session_config": session_config or {},
+                    "total_capital": float(self.total_capital),
+                },
+            }
+
+            # Store results
+            self.simulation_results[strategy_name] = results
+
+            # Save to file if requested
+            if save_results:
+                self._save_strategy_results(strategy_name, results)
+
+            return results
+        finally:
+            # Close logger if it was created, even when the simulation fails
+            if logger:
+                logger.close()
 
     def run_strategy_comparison(
         self,
@@ -1,9 +1,10 @@
 """Utilities module for DiceBot."""
 
-from .logger import JSONLinesLogger, LogAnalyzer
+from .logger import BinaryBetResultLogger, JSONLinesLogger, LogAnalyzer
 from .metrics import MultiSessionAnalyzer, PerformanceMetrics, SessionAnalyzer
 
 __all__ = [
+    "BinaryBetResultLogger",
     "JSONLinesLogger",
     "LogAnalyzer",
     "PerformanceMetrics",
@@ -0,0 +1,177 @@
+"""
+Risk assessment and bet sizing shared by the validation modules.
+"""
+
+from bisect import bisect_left
+from decimal import Decimal
+from enum import Enum, auto
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+NumpyArray = Any
+
+SAFER_BET_SHARE = Decimal("0.01")  # 1% of capital
+
+
+@lru_cache(maxsize=256)
+def decimal_from_float(value: float) -> Decimal:
+    """Convert a float parameter to Decimal through its shortest repr, memoized."""
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=256)
+def safer_bet_suggestion(capital: Decimal) -> str:
+    """Suggest a 1%-of-capital base bet, formatted once per capital."""
+    return f"Consider reducing base_bet to {capital * SAFER_BET_SHARE:.6f} LTC (1% of capital)"
+
+
+def _fibonacci_table(size: int) -> tuple[int, ...]:
+    """Build the first ``size`` Fibonacci numbers, F(0) = 0 and F(1) = 1."""
+    numbers = [0, 1]
+    while len(numbers) < size:
+        numbers.append(numbers[-1] + numbers[-2])
+    return tuple(numbers[:size])
+
+
+# Covers every realistic max_losses; larger indices are extended on demand
+_FIBONACCI = _fibonacci_table(64)
+
+
+def fibonacci(n: int) -> int:
+    """Return the Fibonacci number F(n), exact at any size."""
+    if n < len(_FIBONACCI):
+        return _FIBONACCI[n]
+
+    previous, current = _FIBONACCI[-2], _FIBONACCI[-1]
+    for _ in range(n - len(_FIBONACCI) + 1):
+        previous, current = current, previous + current
+    return current
+
+
+# Parameter sweeps revisit the same (base_bet, max_losses, multiplier) tuples:
+# these pure functions are memoized (see ``cache_info()`` when tuning maxsize)
+@lru_cache(maxsize=1024)
+def martingale_max_bet(base_bet: Decimal, max_losses: int, multiplier: float) -> Decimal:
+    """Calculate the Martingale bet after ``max_losses`` consecutive losses."""
+    return base_bet * (decimal_from_float(multiplier) ** max_losses)
+
+
+@lru_cache(maxsize=1024)
+def fibonacci_max_bet(base_bet: Decimal, max_losses: int) -> Decimal:
+    """Calculate the Fibonacci bet after ``max_losses`` consecutive losses."""
+    # The bet after max_losses losses is F(max_losses) base bets
+    if max_losses <= 0:
+        return base_bet
+
+    return base_bet * fibonacci(max_losses)
+
+
+class RiskLevel(Enum):
+    """Niveaux de risque pour les configurations."""
+
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+    EXTREME = auto()
+
+
+# A ratio above the i-th threshold (base_bet / capital) maps to the (i + 1)-th level
+_RATIO_THRESHOLDS = (0.02, 0.05, 0.1)
+_RATIO_LEVELS = (None, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.EXTREME)
+
+# Per-strategy max_losses thresholds, read the same way as the ratio ones
+_STRATEGY_LOSS_LEVELS: dict[str, tuple[tuple[int, ...], tuple[RiskLevel, ...]]] = {
+    "martingale": (
+        (5, 10, 15),
+        (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.EXTREME),
+    ),
+    "fibonacci": ((15, 20), (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)),
+    "dalembert": ((15, 20), (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)),
+}
+
+
+def assess_risk_level(
+    config: dict[str, Any], capital: Decimal, capital_float: float | None = None
+) -> RiskLevel:
+    """
+    Évalue le niveau de risque d'une configuration.
+
+    Le ratio de capital est calculé en float : les seuils sont grossiers et
+    une division Decimal n'apporte rien. Les appels en série sur un même
+    capital peuvent passer ``capital_float`` pour éviter la conversion.
+
+    Args:
+        config: Configuration de la stratégie
+        capital: Capital total
+        capital_float: float(capital), si l'appelant l'a déjà calculé
+
+    Returns:
+        Niveau de risque
+    """
+    try:
+        strategy_name = config.get("strategy", "flat")
+        base_bet = Decimal(str(config.get("base_bet", "0.001")))
+        max_losses = int(config.get("max_losses", 10))
+
+        if capital <= 0:
+            return RiskLevel.EXTREME
+
+        # Risque basé sur le ratio capital : au-delà de 2 %, 5 % et 10 %
+        if capital_float is None:
+            capital_float = float(capital)
+        capital_ratio = float(base_bet) / capital_float
+        ratio_level = _RATIO_LEVELS[bisect_left(_RATIO_THRESHOLDS, capital_ratio)]
+        if ratio_level is not None:
+            return ratio_level
+
+        # Risque basé sur la stratégie
+        loss_levels = _STRATEGY_LOSS_LEVELS.get(strategy_name)
+        if loss_levels is None:
+            return RiskLevel.LOW
+
+        thresholds, levels = loss_levels
+        return levels[bisect_left(thresholds, max_losses)]
+
+    except (ValueError, TypeError):
+        return RiskLevel.EXTREME
+
+
+def assess_risk_levels(
+    strategies: list[str],
+    capital_ratios: NumpyArray,
+    max_losses: NumpyArray,
+) -> NumpyArray:
+    """Vectorized ``assess_risk_level`` over many configurations.
+
+    Applies the same threshold tables with ``np.digitize`` (``right=True``
+    keeps the strict ``>`` comparisons). Ratios are plain float64 divisions,
+    so a ratio landing exactly on a threshold may round to the other side.
+
+    Args:
+        strategies: Strategy name of each configuration
+        capital_ratios: base_bet / capital of each configuration (inf or NaN
+            when capital is not positive)
+        max_losses: max_losses of each configuration
+
+    Returns:
+        Array of ``RiskLevel`` values (int8)
+    """
+    ratios: Any = np.asarray(capital_ratios, dtype=np.float64)
+    losses: Any = np.asarray(max_losses, dtype=np.int64)
+    names: Any = np.asarray(strategies, dtype=object)
+
+    levels: Any = np.full(ratios.shape, RiskLevel.LOW.value, dtype=np.int8)
+    for strategy_name, (thresholds, loss_levels) in _STRATEGY_LOSS_LEVELS.items():
+        rows: Any = names == strategy_name
+        values: Any = np.array([level.value for level in loss_levels], dtype=np.int8)
+        levels[rows] = values[np.digitize(losses[rows], thresholds, right=True)]
+
+    # The capital ratio overrides the strategy level above 2% (index 0 is unused)
+    ratio_levels: Any = np.array(
+        [0] + [level.value for level in _RATIO_LEVELS[1:] if level is not None], dtype=np.int8
+    )
+    ratio_index: Any = np.digitize(ratios, _RATIO_THRESHOLDS, right=True)
+    ratio_index[np.isnan(ratios)] = len(_RATIO_THRESHOLDS)
+    return np.where(ratio_index > 0, ratio_levels[ratio_index], levels)
@@ -2,14 +2,241 @@
 JSON Lines logger for structured logging of dice game events and results.
 """
 
+import atexit
+import gzip
 import json
 import logging
+import mmap
+import re
+import shutil
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from ..core.models import BetDecision, BetResult, GameState, SessionState
+import numpy as np  # type: ignore[import-untyped]
+
+from ..core.models import BetDecision, BetResult, BetType, GameState, SessionState
+
+# (epoch_seconds, "YYYY-MM-DDTHH:MM:SS") cache used by _iso_now(). Kept as a
+# single tuple so concurrent readers never pair a second with another's prefix.
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """Return the current local time in ISO 8601 format.
+
+    The ``YYYY-MM-DDTHH:MM:SS`` prefix is only rebuilt once per second, so
+    high-frequency logging avoids a ``datetime`` allocation and a full
+    ``isoformat()`` call on every event. The output matches
+    ``datetime.now().isoformat()``, including the omitted fractional part
+    when microseconds are zero.
+
+    Returns:
+        Current local timestamp as an ISO 8601 string
+    """
+    global _TS_CACHE
+
+    seconds, remainder = divmod(time.time_ns(), 1_000_000_000)
+    cache = _TS_CACHE
+    if cache[0] != seconds:
+        cache = (seconds, datetime.fromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%S"))
+        _TS_CACHE = cache
+
+    microseconds = remainder // 1000
+    if microseconds:
+        return f"{cache[1]}.{microseconds:06d}"
+    return cache[1]
+
+
+# GameState fields serialized with every bet event, fetched in one C-level call
+_GS_KEYS = (
+    "balance",
+    "bets_count",
+    "wins_count",
+    "losses_count",
+    "consecutive_wins",
+    "consecutive_losses",
+    "total_profit",
+    "total_wagered",
+    "win_rate",
+    "roi",
+    "current_drawdown",
+    "max_drawdown",
+)
+_GS_GET = attrgetter(*_GS_KEYS)
+
+
+def _gamestate_to_dict(game_state: GameState) -> dict[str, Any]:
+    """Serialize the GameState snapshot attached to bet events.
+
+    Args:
+        game_state: Game state to serialize
+
+    Returns:
+        Dictionary with Decimal fields converted to strings
+    """
+    (
+        balance,
+        bets_count,
+        wins_count,
+        losses_count,
+        consecutive_wins,
+        consecutive_losses,
+        total_profit,
+        total_wagered,
+        win_rate,
+        roi,
+        current_drawdown,
+        max_drawdown,
+    ) = _GS_GET(game_state)
+    return {
+        "balance": str(balance),
+        "bets_count": bets_count,
+        "wins_count": wins_count,
+        "losses_count": losses_count,
+        "consecutive_wins": consecutive_wins,
+        "consecutive_losses": consecutive_losses,
+        "total_profit": str(total_profit),
+        "total_wagered": str(total_wagered),
+        "win_rate": win_rate,
+        "roi": roi,
+        "current_drawdown": str(current_drawdown),
+        "max_drawdown": str(max_drawdown),
+    }
+
+
+# Monetary fields of "bet" events (decision, result and game_state_after) are
+# written as integers in units of 10**-_AMOUNT_SCALE LTC (litoshi), while other
+# events keep decimal strings; session_start records the scale.
+_AMOUNT_SCALE = 8
+
+
+def _dec_to_units(amount: Decimal) -> int:
+    """Convert an LTC amount to integer litoshi, rounding half to even.
+
+    Args:
+        amount: Amount in LTC
+
+    Returns:
+        Amount in units of ``10**-_AMOUNT_SCALE`` LTC
+    """
+    return int(amount.scaleb(_AMOUNT_SCALE).to_integral_value())
+
+
+def _gamestate_to_units(game_state: GameState) -> dict[str, Any]:
+    """Serialize the GameState snapshot of a "bet" event.
+
+    Same keys as ``_gamestate_to_dict``, with the monetary fields (balance,
+    total_profit, total_wagered) in integer litoshi like the rest of the event.
+    Drawdowns are ratios, not amounts, and keep their decimal strings.
+
+    Args:
+        game_state: Game state to serialize
+
+    Returns:
+        Dictionary with amounts in units of ``10**-_AMOUNT_SCALE`` LTC
+    """
+    (
+        balance,
+        bets_count,
+        wins_count,
+        losses_count,
+        consecutive_wins,
+        consecutive_losses,
+        total_profit,
+        total_wagered,
+        win_rate,
+        roi,
+        current_drawdown,
+        max_drawdown,
+    ) = _GS_GET(game_state)
+    return {
+        "balance": _dec_to_units(balance),
+        "bets_count": bets_count,
+        "wins_count": wins_count,
+        "losses_count": losses_count,
+        "consecutive_wins": consecutive_wins,
+        "consecutive_losses": consecutive_losses,
+        "total_profit": _dec_to_units(total_profit),
+        "total_wagered": _dec_to_units(total_wagered),
+        "win_rate": win_rate,
+        "roi": roi,
+        "current_drawdown": str(current_drawdown),
+        "max_drawdown": str(max_drawdown),
+    }
+
+
+# Event type names shared by the writer and LogAnalyzer
+_EV_BET_DECISION = sys.intern("bet_decision")
+_EV_BET_RESULT = sys.intern("bet_result")
+_EV_BET = sys.intern("bet")
+_EV_SESSION_START = sys.intern("session_start")
+_EV_SESSION_END = sys.intern("session_end")
+_EV_ERROR = sys.intern("error")
+_EV_SIMULATION_SUMMARY = sys.intern("simulation_summary")
+_EV_LOG_MESSAGE = sys.intern("log_message")
+
+
+class _NativeEvent(dict[str, Any]):
+    """An event payload containing only JSON-native types.
+
+    Such payloads are encoded without the ``default=`` fallback serializer.
+    """
+
+
+class _JSONLine(str):
+    """A log message that is already a serialized JSON Lines record."""
+
+
+# Pre-serialized skeleton of a bet_result event: only the values are encoded
+# per call, which skips building the nested dict and walking it in json.dumps.
+# Key order and separators match JSONLinesFormatter's json.dumps output.
+_BET_RESULT_TEMPLATE = (
+    '{{"event_type": "' + _EV_BET_RESULT + '", "timestamp": {timestamp}, '
+    '"session_id": {session_id}, "strategy_name": {strategy_name}, '
+    '"result": {{"roll": {roll}, "won": {won}, "threshold": {threshold}, '
+    '"amount": {amount}, "payout": {payout}, "profit": {profit}, '
+    '"bet_type": {bet_type}, "target": {target}, "multiplier": {multiplier}}}, '
+    '"provably_fair": {{"server_seed_hash": {server_seed_hash}, '
+    '"client_seed": {client_seed}, "nonce": {nonce}, '
+    '"verification_data": {verification_data}}}, '
+    '"game_state_after": {game_state_after}, "level": "INFO"}}'
+)
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for values the JSON encoder does not handle natively.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Serializable representation of the object
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    elif isinstance(obj, np.generic):
+        # NumPy scalars (np.bool_, np.int64...) map to their Python equivalent
+        return obj.item()
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
+    elif hasattr(obj, "__dict__"):
+        return obj.__dict__
+    else:
+        return str(obj)
+
+
+# Encoder for the values of templated events, which may hold non-native types
+_encode_value = json.JSONEncoder(ensure_ascii=False, default=_json_default).encode
+_encode_str = json.encoder.encode_basestring  # type: ignore[attr-defined]
 
 
 class LogType:
@@ -34,6 +261,53 @@ class LogType:
     ANALYSIS_VALIDATION = "analysis_validation"
 
 
+# Directory for each explicit LogType
+_TYPE_MAPPING: dict[str, Path] = {
+    LogType.SIMULATION_SINGLE: Path("simulations/single"),
+    LogType.SIMULATION_COMPARISON: Path("simulations/comparison"),
+    LogType.SIMULATION_PARAMETER_SWEEP: Path("simulations/parameter_sweep"),
+    LogType.STRATEGY_BASIC: Path("strategies/basic"),
+    LogType.STRATEGY_COMPOSITE: Path("strategies/composite"),
+    LogType.STRATEGY_ADAPTIVE: Path("strategies/adaptive"),
+    LogType.SESSION_MANUAL: Path("sessions/manual"),
+    LogType.SESSION_AUTOMATED: Path("sessions/automated"),
+    LogType.ANALYSIS_PERFORMANCE: Path("analysis/performance"),
+    LogType.ANALYSIS_VALIDATION: Path("analysis/validation"),
+}
+_DEFAULT_LOG_DIR = Path("sessions/manual")
+
+# Filename keywords in priority order (first entry wins when several match)
+_FILENAME_KEYWORDS: tuple[tuple[str, Path], ...] = (
+    # Strategy classification (high priority)
+    ("composite", Path("strategies/composite")),
+    ("adaptive", Path("strategies/adaptive")),
+    ("martingale", Path("strategies/basic")),
+    ("fibonacci", Path("strategies/basic")),
+    ("dalembert", Path("strategies/basic")),
+    ("flat", Path("strategies/basic")),
+    ("paroli", Path("strategies/basic")),
+    # Analysis classification (before session to catch performance/benchmark/validation)
+    ("performance", Path("analysis/performance")),
+    ("benchmark", Path("analysis/performance")),
+    ("validation", Path("analysis/validation")),
+    ("debug", Path("analysis/validation")),
+    # Simulation classification
+    ("comparison", Path("simulations/comparison")),
+    ("parameter_sweep", Path("simulations/parameter_sweep")),
+    ("sweep", Path("simulations/parameter_sweep")),
+    ("simulation", Path("simulations/single")),
+    # Session classification (lower priority)
+    ("manual", Path("sessions/manual")),
+    ("test", Path("sessions/manual")),
+    ("automated", Path("sessions/automated")),
+)
+_KEYWORD_PRIORITY = {keyword: index for index, (keyword, _) in enumerate(_FILENAME_KEYWORDS)}
+# Zero-width lookahead so overlapping keywords are all reported in one pass
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword, _ in _FILENAME_KEYWORDS) + "))"
+)
+
+
 def get_log_path(base_dir: str | Path, filename: str, log_type: str | None = None) -> Path:
     """
     Determine the appropriate log path based on filename and log type.
@@ -49,59 +323,20 @@ def get_log_path(base_dir: str | Path, filename: str, log_type: str | None = Non
     base_path = Path(base_dir)
 
     # If log_type is explicitly provided, use it
-    if log_type:
-        type_mapping = {
-            LogType.SIMULATION_SINGLE: "simulations/single",
-            LogType.SIMULATION_COMPARISON: "simulations/comparison",
-            LogType.SIMULATION_PARAMETER_SWEEP: "simulations/parameter_sweep",
-            LogType.STRATEGY_BASIC: "strategies/basic",
-            LogType.STRATEGY_COMPOSITE: "strategies/composite",
-            LogType.STRATEGY_ADAPTIVE: "strategies/adaptive",
-            LogType.SESSION_MANUAL: "sessions/manual",
-            LogType.SESSION_AUTOMATED: "sessions/automated",
-            LogType.ANALYSIS_PERFORMANCE: "analysis/performance",
-            LogType.ANALYSIS_VALIDATION: "analysis/validation",
-        }
-
-        if log_type in type_mapping:
-            return base_path / type_mapping[log_type] / filename
-
-    # Auto-detect based on filename patterns
-    filename_lower = filename.lower()
-
-    # Strategy classification (high priority)
-    if "composite" in filename_lower:
-        return base_path / "strategies" / "composite" / filename
-    elif "adaptive" in filename_lower:
-        return base_path / "strategies" / "adaptive" / filename
-    elif any(
-        strategy in filename_lower
-        for strategy in ["martingale", "fibonacci", "dalembert", "flat", "paroli"]
-    ):
-        return base_path / "strategies" / "basic" / filename
-
-    # Analysis classification (before session to catch performance/benchmark/validation)
-    elif "performance" in filename_lower or "benchmark" in filename_lower:
-        return base_path / "analysis" / "performance" / filename
-    elif "validation" in filename_lower or "debug" in filename_lower:
-        return base_path / "analysis" / "validation" / filename
-
-    # Simulation classification
-    elif "comparison" in filename_lower:
-        return base_path / "simulations" / "comparison" / filename
-    elif "parameter_sweep" in filename_lower or "sweep" in filename_lower:
-        return base_path / "simulations" / "parameter_sweep" / filename
-    elif "simulation" in filename_lower:
-        return base_path / "simulations" / "single" / filename
-
-    # Session classification (lower priority)
-    elif "manual" in filename_lower or "test" in filename_lower:
-        return base_path / "sessions" / "manual" / filename
-    elif "automated" in filename_lower:
-        return base_path / "sessions" / "automated" / filename
+    if log_type and log_type in _TYPE_MAPPING:
+        return base_path / _TYPE_MAPPING[log_type] / filename
+
+    # Auto-detect based on filename patterns: a single scan collects every
+    # keyword occurrence and the highest-priority one wins.
+    priority = min(
+        (_KEYWORD_PRIORITY[match.group(1)] for match in _KEYWORD_RE.finditer(filename.lower())),
+        default=None,
+    )
+    if priority is not None:
+        return base_path / _FILENAME_KEYWORDS[priority][1] / filename
 
     # Default fallback to sessions/manual for unclassified logs
-    return base_path / "sessions" / "manual" / filename
+    return base_path / _DEFAULT_LOG_DIR / filename
 
 
 class JSONLinesLogger:
@@ -115,6 +350,7 @@ class JSONLinesLogger:
         backup_count: int = 5,
         log_type: str | None = None,
         base_dir: str | Path = "betlog",
+        compress_backups: bool = False,
     ):
         """Initialize the JSON Lines logger.
 
@@ -126,6 +362,7 @@ class JSONLinesLogger:
             backup_count: Number of backup files to keep
             log_type: Optional explicit log type for classification
             base_dir: Base directory for organized logs (default: betlog)
+            compress_backups: Gzip rotated files (``.N.gz``) in a background thread
         """
         # If log_file is just a filename, use organized path
         if "/" not in str(log_file) and "\\" not in str(log_file):
@@ -136,34 +373,121 @@ class JSONLinesLogger:
         self.level = level
         self.max_file_size = max_file_size
         self.backup_count = backup_count
+        self.compress_backups = compress_backups
 
         # Ensure log directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Setup logger
-        self.logger = logging.getLogger(f"dicebot.jsonl.{self.log_file.stem}")
-        self.logger.setLevel(level)
+        # Events are serialized and written directly: no logging.Logger, LogRecord
+        # or handler dispatch per event, only this lock around the file.
+        self._formatter = JSONLinesFormatter()
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = open(self.log_file, "ab")
+        # Size is tracked in-process so rotation checks need no syscall per event
+        self._bytes_written = self.log_file.stat().st_size
+        # Single worker compressing rotated files off the logging path
+        self._compressor: ThreadPoolExecutor | None = None
+        self._compression: Future[None] | None = None
+        self._rotations = 0
+
+    def _emit(self, data: dict[str, Any] | str, levelno: int = logging.INFO) -> None:
+        """Serialize an event and append it to the log file.
 
-        # Clear existing handlers
-        self.logger.handlers.clear()
+        Args:
+            data: Event payload, or a line already serialized by a log_* method
+            levelno: Logging level of the event
+        """
+        if levelno < self.level:
+            return
+
+        line = self._formatter.serialize(data, logging.getLevelName(levelno))
+        encoded = (line + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                return
+            if self._should_rotate(len(encoded)):
+                self._rotate()
+            self._file.write(encoded)
+            # Flushed per event, like logging's StreamHandler: readers and a
+            # crash never miss buffered events
+            self._file.flush()
+            self._bytes_written += len(encoded)
+
+    def _should_rotate(self, incoming: int) -> bool:
+        """Check whether writing ``incoming`` bytes would exceed max_file_size.
 
-        # Add rotating file handler
-        from logging.handlers import RotatingFileHandler
+        Args:
+            incoming: Size of the next line in bytes
 
-        handler = RotatingFileHandler(
-            self.log_file,
-            maxBytes=max_file_size,
-            backupCount=backup_count,
-            encoding="utf-8",
+        Returns:
+            True if the file must be rotated first
+        """
+        # Like RotatingFileHandler, rollover never occurs without backups
+        return (
+            self.max_file_size > 0
+            and self.backup_count > 0
+            and self._bytes_written + incoming >= self.max_file_size
         )
-        handler.setLevel(level)
 
-        # Custom formatter for JSON Lines
-        formatter = JSONLinesFormatter()
-        handler.setFormatter(formatter)
+    def _rotate(self) -> None:
+        """Shift backups (``.1`` -> ``.2`` ...) and start a new log file.
+
+        With ``compress_backups``, the full file is only renamed here: shifting
+        the ``.gz`` backups and compressing it into ``.1.gz`` run on the
+        compression worker, so logging threads never wait for gzip.
+        """
+        assert self._file is not None
+        self._file.close()
+
+        if self.compress_backups:
+            if self.log_file.exists():
+                self._rotations += 1
+                pending = self.log_file.replace(
+                    self.log_file.with_name(f"{self.log_file.name}.rotated-{self._rotations}")
+                )
+                if self._compressor is None:
+                    self._compressor = ThreadPoolExecutor(max_workers=1)
+                # Single worker: rotations are shifted and compressed in order
+                self._compression = self._compressor.submit(self._compress_backup, pending)
+        else:
+            self._shift_backups("")
+            if self.log_file.exists():
+                self.log_file.replace(self.log_file.with_name(f"{self.log_file.name}.1"))
 
-        self.logger.addHandler(handler)
-        self.logger.propagate = False
+        self._file = open(self.log_file, "ab")
+        self._bytes_written = 0
+
+    def _shift_backups(self, suffix: str) -> None:
+        """Rename backups ``.N`` to ``.N+1``, dropping the oldest one.
+
+        Args:
+            suffix: Backup file suffix (``""`` or ``".gz"``)
+        """
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.log_file.with_name(f"{self.log_file.name}.{index}{suffix}")
+            if source.exists():
+                source.replace(self.log_file.with_name(f"{self.log_file.name}.{index + 1}{suffix}"))
+
+    def _compress_backup(self, pending: Path) -> None:
+        """Shift compressed backups and compress a rotated file into ``.1.gz``.
+
+        Args:
+            pending: Rotated log file awaiting compression
+        """
+        self._shift_backups(".gz")
+        _gzip_compress(pending, self.log_file.with_name(f"{self.log_file.name}.1.gz"))
+
+    def _wait_for_compression(self) -> None:
+        """Block until the pending backup compression, if any, has finished."""
+        if self._compression is not None:
+            self._compression.result()
+            self._compression = None
+
+    def flush(self) -> None:
+        """Flush buffered events to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
 
     def log_bet_decision(
         self,
@@ -181,8 +505,8 @@ class JSONLinesLogger:
             session_id: Current session ID
         """
         data = {
-            "event_type": "bet_decision",
-            "timestamp": datetime.now().isoformat(),
+            "event_type": _EV_BET_DECISION,
+            "timestamp": _iso_now(),
             "session_id": session_id,
             "strategy_name": strategy_name,
             "decision": {
@@ -193,23 +517,10 @@ class JSONLinesLogger:
                 "confidence": decision.confidence,
                 "metadata": decision.metadata,
             },
-            "game_state": {
-                "balance": str(game_state.balance),
-                "bets_count": game_state.bets_count,
-                "wins_count": game_state.wins_count,
-                "losses_count": game_state.losses_count,
-                "consecutive_wins": game_state.consecutive_wins,
-                "consecutive_losses": game_state.consecutive_losses,
-                "total_profit": str(game_state.total_profit),
-                "total_wagered": str(game_state.total_wagered),
-                "win_rate": game_state.win_rate,
-                "roi": game_state.roi,
-                "current_drawdown": str(game_state.current_drawdown),
-                "max_drawdown": str(game_state.max_drawdown),
-            },
+            "game_state": _gamestate_to_dict(game_state),
         }
 
-        self.logger.info(data)
+        self._emit(data)
 
     def log_bet_result(
         self,
@@ -226,20 +537,81 @@ class JSONLinesLogger:
             strategy_name: Name of the strategy
             session_id: Current session ID
         """
+        profit = result.payout - result.amount if result.won else -result.amount
+        line = _BET_RESULT_TEMPLATE.format_map(
+            {
+                "timestamp": _encode_str(
+                    result.timestamp.isoformat() if result.timestamp else _iso_now()
+                ),
+                "session_id": _encode_str(session_id),
+                "strategy_name": _encode_str(strategy_name),
+                "roll": _encode_value(result.roll),
+                "won": "true" if result.won else "false",
+                "threshold": _encode_value(result.threshold),
+                "amount": _encode_str(str(result.amount)),
+                "payout": _encode_str(str(result.payout)),
+                "profit": _encode_str(str(profit)),
+                "bet_type": _encode_value(result.bet_type.value if result.bet_type else None),
+                "target": _encode_value(result.target),
+                "multiplier": _encode_value(result.multiplier),
+                "server_seed_hash": _encode_value(result.server_seed_hash),
+                "client_seed": _encode_value(result.client_seed),
+                "nonce": _encode_value(result.nonce),
+                "verification_data": _encode_value(
+                    result.to_verification_dict()
+                    if hasattr(result, "to_verification_dict")
+                    else None
+                ),
+                "game_state_after": _encode_value(_gamestate_to_dict(game_state)),
+            }
+        )
+
+        self._emit(_JSONLine(line))
+
+    def log_bet(
+        self,
+        decision: BetDecision,
+        result: BetResult,
+        game_state: GameState,
+        strategy_name: str,
+        session_id: str,
+    ) -> None:
+        """Log a placed bet as a single event combining decision and result.
+
+        Replaces a ``log_bet_decision`` + ``log_bet_result`` pair: the pre-bet
+        game state is not repeated since it is the ``game_state_after`` of the
+        previous bet event. Every amount of the event, including the balance,
+        profit and wagered totals of ``game_state_after``, is integer litoshi
+        (see ``_gamestate_to_units``); only drawdown ratios stay decimal strings.
+
+        Args:
+            decision: The bet decision that was executed
+            result: The bet result
+            game_state: Updated game state after the bet
+            strategy_name: Name of the strategy
+            session_id: Current session ID
+        """
+        profit = result.payout - result.amount if result.won else -result.amount
         data = {
-            "event_type": "bet_result",
-            "timestamp": result.timestamp.isoformat()
-            if result.timestamp
-            else datetime.now().isoformat(),
+            "event_type": _EV_BET,
+            "timestamp": result.timestamp.isoformat() if result.timestamp else _iso_now(),
             "session_id": session_id,
             "strategy_name": strategy_name,
+            "decision": {
+                "amount": _dec_to_units(decision.amount),
+                "multiplier": decision.multiplier,
+                "skip": decision.skip,
+                "reason": decision.reason,
+                "confidence": decision.confidence,
+                "metadata": decision.metadata,
+            },
             "result": {
                 "roll": result.roll,
                 "won": result.won,
                 "threshold": result.threshold,
-                "amount": str(result.amount),
-                "payout": str(result.payout),
-                "profit": str(result.payout - result.amount if result.won else -result.amount),
+                "amount": _dec_to_units(result.amount),
+                "payout": _dec_to_units(result.payout),
+                "profit": _dec_to_units(profit),
                 "bet_type": result.bet_type.value if result.bet_type else None,
                 "target": result.target,
                 "multiplier": result.multiplier,
@@ -248,27 +620,12 @@ class JSONLinesLogger:
                 "server_seed_hash": result.server_seed_hash,
                 "client_seed": result.client_seed,
                 "nonce": result.nonce,
-                "verification_data": result.to_verification_dict()
-                if hasattr(result, "to_verification_dict")
-                else None,
-            },
-            "game_state_after": {
-                "balance": str(game_state.balance),
-                "bets_count": game_state.bets_count,
-                "wins_count": game_state.wins_count,
-                "losses_count": game_state.losses_count,
-                "consecutive_wins": game_state.consecutive_wins,
-                "consecutive_losses": game_state.consecutive_losses,
-                "total_profit": str(game_state.total_profit),
-                "total_wagered": str(game_state.total_wagered),
-                "win_rate": game_state.win_rate,
-                "roi": game_state.roi,
-                "current_drawdown": str(game_state.current_drawdown),
-                "max_drawdown": str(game_state.max_drawdown),
+                "verification_data": result.to_verification_dict(),
             },
+            "game_state_after": _gamestate_to_units(game_state),
         }
 
-        self.logger.info(data)
+        self._emit(data)
 
     def log_session_start(self, session_state: SessionState) -> None:
         """Log session start.
@@ -276,23 +633,26 @@ class JSONLinesLogger:
         Args:
             session_state: The session state at start
         """
-        data = {
-            "event_type": "session_start",
-            "timestamp": session_state.started_at.isoformat(),
-            "session_id": session_state.session_id,
-            "bot_id": session_state.bot_id,
-            "strategy_name": session_state.strategy_name,
-            "initial_balance": str(session_state.game_state.session_start_balance),
-            "session_config": {
-                "stop_loss": str(session_state.stop_loss) if session_state.stop_loss else None,
-                "take_profit": str(session_state.take_profit)
-                if session_state.take_profit
-                else None,
-                "max_bets": session_state.max_bets,
-            },
-        }
+        data = _NativeEvent(
+            {
+                "event_type": _EV_SESSION_START,
+                "timestamp": session_state.started_at.isoformat(),
+                "session_id": session_state.session_id,
+                "bot_id": session_state.bot_id,
+                "strategy_name": session_state.strategy_name,
+                "initial_balance": str(session_state.game_state.session_start_balance),
+                "amount_scale": _AMOUNT_SCALE,
+                "session_config": {
+                    "stop_loss": str(session_state.stop_loss) if session_state.stop_loss else None,
+                    "take_profit": str(session_state.take_profit)
+                    if session_state.take_profit
+                    else None,
+                    "max_bets": session_state.max_bets,
+                },
+            }
+        )
 
-        self.logger.info(data)
+        self._emit(data)
 
     def log_session_end(self, session_state: SessionState) -> None:
         """Log session end.
@@ -300,37 +660,39 @@ class JSONLinesLogger:
         Args:
             session_state: The session state at end
         """
-        data = {
-            "event_type": "session_end",
-            "timestamp": session_state.ended_at.isoformat()
-            if session_state.ended_at
-            else datetime.now().isoformat(),
-            "session_id": session_state.session_id,
-            "bot_id": session_state.bot_id,
-            "strategy_name": session_state.strategy_name,
-            "stop_reason": session_state.stop_reason,
-            "duration_seconds": session_state.total_session_time,
-            "session_summary": {
-                "initial_balance": str(session_state.game_state.session_start_balance),
-                "final_balance": str(session_state.game_state.balance),
-                "total_profit": str(session_state.game_state.total_profit),
-                "total_wagered": str(session_state.game_state.total_wagered),
-                "roi": session_state.game_state.session_roi,
-                "bets_count": session_state.game_state.bets_count,
-                "wins_count": session_state.game_state.wins_count,
-                "losses_count": session_state.game_state.losses_count,
-                "win_rate": session_state.game_state.win_rate,
-                "max_consecutive_wins": session_state.game_state.max_consecutive_wins,
-                "max_consecutive_losses": (session_state.game_state.max_consecutive_losses),
-                "max_drawdown": str(session_state.game_state.max_drawdown),
-                "sharpe_ratio": session_state.game_state.sharpe_ratio,
-                "peak_balance": str(session_state.peak_balance),
-                "lowest_balance": str(session_state.lowest_balance),
-                "bets_per_minute": session_state.game_state.bets_per_minute,
-            },
-        }
+        data = _NativeEvent(
+            {
+                "event_type": _EV_SESSION_END,
+                "timestamp": session_state.ended_at.isoformat()
+                if session_state.ended_at
+                else _iso_now(),
+                "session_id": session_state.session_id,
+                "bot_id": session_state.bot_id,
+                "strategy_name": session_state.strategy_name,
+                "stop_reason": session_state.stop_reason,
+                "duration_seconds": session_state.total_session_time,
+                "session_summary": {
+                    "initial_balance": str(session_state.game_state.session_start_balance),
+                    "final_balance": str(session_state.game_state.balance),
+                    "total_profit": str(session_state.game_state.total_profit),
+                    "total_wagered": str(session_state.game_state.total_wagered),
+                    "roi": session_state.game_state.session_roi,
+                    "bets_count": session_state.game_state.bets_count,
+                    "wins_count": session_state.game_state.wins_count,
+                    "losses_count": session_state.game_state.losses_count,
+                    "win_rate": session_state.game_state.win_rate,
+                    "max_consecutive_wins": session_state.game_state.max_consecutive_wins,
+                    "max_consecutive_losses": (session_state.game_state.max_consecutive_losses),
+                    "max_drawdown": str(session_state.game_state.max_drawdown),
+                    "sharpe_ratio": session_state.game_state.sharpe_ratio,
+                    "peak_balance": str(session_state.peak_balance),
+                    "lowest_balance": str(session_state.lowest_balance),
+                    "bets_per_minute": session_state.game_state.bets_per_minute,
+                },
+            }
+        )
 
-        self.logger.info(data)
+        self._emit(data)
 
     def log_strategy_event(
         self, event_type: str, strategy_name: str, session_id: str, data: dict[str, Any]
@@ -345,13 +707,13 @@ class JSONLinesLogger:
         """
         log_data = {
             "event_type": f"strategy_{event_type}",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "session_id": session_id,
             "strategy_name": strategy_name,
             "data": data,
         }
 
-        self.logger.info(log_data)
+        self._emit(log_data)
 
     def log_streak_event(
         self,
@@ -370,21 +732,23 @@ class JSONLinesLogger:
             session_id: Current session ID
             game_state: Current game state
         """
-        data = {
-            "event_type": f"{streak_type}_streak",
-            "timestamp": datetime.now().isoformat(),
-            "session_id": session_id,
-            "strategy_name": strategy_name,
-            "streak": {
-                "type": streak_type,
-                "length": streak_length,
-                "current_balance": str(game_state.balance),
-                "current_drawdown": str(game_state.current_drawdown),
-                "total_profit": str(game_state.total_profit),
-            },
-        }
+        data = _NativeEvent(
+            {
+                "event_type": f"{streak_type}_streak",
+                "timestamp": _iso_now(),
+                "session_id": session_id,
+                "strategy_name": strategy_name,
+                "streak": {
+                    "type": streak_type,
+                    "length": streak_length,
+                    "current_balance": str(game_state.balance),
+                    "current_drawdown": str(game_state.current_drawdown),
+                    "total_profit": str(game_state.total_profit),
+                },
+            }
+        )
 
-        self.logger.info(data)
+        self._emit(data)
 
     def log_error(
         self,
@@ -401,19 +765,21 @@ class JSONLinesLogger:
             session_id: Current session ID (if applicable)
             strategy_name: Strategy name (if applicable)
         """
-        data = {
-            "event_type": "error",
-            "timestamp": datetime.now().isoformat(),
-            "session_id": session_id,
-            "strategy_name": strategy_name,
-            "error": {
-                "type": type(error).__name__,
-                "message": str(error),
-                "context": context,
-            },
-        }
+        data = _NativeEvent(
+            {
+                "event_type": _EV_ERROR,
+                "timestamp": _iso_now(),
+                "session_id": session_id,
+                "strategy_name": strategy_name,
+                "error": {
+                    "type": type(error).__name__,
+                    "message": str(error),
+                    "context": context,
+                },
+            }
+        )
 
-        self.logger.error(data)
+        self._emit(data, logging.ERROR)
 
     def log_simulation_summary(
         self, summary: dict[str, Any], strategy_name: str, num_sessions: int
@@ -426,25 +792,48 @@ class JSONLinesLogger:
             num_sessions: Number of sessions run
         """
         data = {
-            "event_type": "simulation_summary",
-            "timestamp": datetime.now().isoformat(),
+            "event_type": _EV_SIMULATION_SUMMARY,
+            "timestamp": _iso_now(),
             "strategy_name": strategy_name,
             "num_sessions": num_sessions,
             "summary": summary,
         }
 
-        self.logger.info(data)
+        self._emit(data)
 
     def close(self) -> None:
-        """Close the logger and all handlers."""
-        for handler in self.logger.handlers:
-            handler.close()
-        self.logger.handlers.clear()
+        """Flush and close the log file, finishing any backup compression."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._wait_for_compression()
+            if self._compressor is not None:
+                self._compressor.shutdown()
+                self._compressor = None
+
+
+def _gzip_compress(source: Path, target: Path) -> None:
+    """Compress a rotated log file to ``target`` and remove the original.
+
+    Args:
+        source: Rotated JSON Lines file
+        target: Path of the gzip backup
+    """
+    with open(source, "rb") as src, gzip.open(target, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+    source.unlink()
 
 
 class JSONLinesFormatter(logging.Formatter):
     """Custom formatter for JSON Lines output."""
 
+    def __init__(self) -> None:
+        """Initialize the formatter and its reusable JSON encoder."""
+        super().__init__()
+        # Built once: json.dumps() creates a new encoder per call when given options
+        self._encoder = json.JSONEncoder(ensure_ascii=False, default=self._json_serializer)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON.
 
@@ -455,23 +844,47 @@ class JSONLinesFormatter(logging.Formatter):
             JSON string representation of the record
         """
         if isinstance(record.msg, dict):
-            # Record message is already a dict
-            log_data: dict[str, Any] = record.msg.copy()
+            return self.serialize(record.msg, record.levelname)
+        return self.serialize(record.getMessage(), record.levelname)
+
+    def serialize(self, msg: dict[str, Any] | str, levelname: str) -> str:
+        """Serialize an event payload or plain message as one JSON line.
+
+        Args:
+            msg: Event dictionary, pre-serialized line, or plain text message
+            levelname: Name of the logging level
+
+        Returns:
+            JSON string representation of the event
+        """
+        if isinstance(msg, _JSONLine):
+            # Serialized by a specialized log_* method
+            return msg
+
+        if isinstance(msg, _NativeEvent):
+            # Built by a log_* method from JSON-native values only
+            if "level" in msg:
+                return _encode(msg)
+            return _encode({**msg, "level": levelname})
+
+        if isinstance(msg, dict):
+            # Message is already a dict
+            log_data: dict[str, Any] = msg.copy()
         else:
             # Convert string message to dict
             log_data: dict[str, Any] = {
-                "event_type": "log_message",
-                "timestamp": datetime.now().isoformat(),
-                "level": record.levelname,
-                "message": record.getMessage(),
+                "event_type": _EV_LOG_MESSAGE,
+                "timestamp": _iso_now(),
+                "level": levelname,
+                "message": msg,
             }
 
         # Add standard logging fields if not present
         if "level" not in log_data:
-            log_data["level"] = record.levelname
+            log_data["level"] = levelname
 
         # Serialize to JSON
-        return json.dumps(log_data, default=self._json_serializer, ensure_ascii=False)
+        return self._encoder.encode(log_data)
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for special types.
@@ -482,18 +895,205 @@ class JSONLinesFormatter(logging.Formatter):
         Returns:
             Serializable representation of the object
         """
-        if isinstance(obj, Decimal):
-            return str(obj)
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, "__dict__"):
-            return obj.__dict__
-        else:
-            return str(obj)
+        return _json_default(obj)
+
+
+# Fixed-width record layout of the binary bet_result stream
+BET_RESULT_DTYPE = np.dtype(
+    [
+        ("session_id", "S36"),
+        ("nonce", "<i8"),
+        ("roll", "<f8"),
+        ("won", "?"),
+        ("over", "?"),
+        ("target", "<f8"),
+        ("amount", "<f8"),
+        ("payout", "<f8"),
+        ("profit", "<f8"),
+        ("balance", "<f8"),
+        ("bets_count", "<i4"),
+        ("consecutive_losses", "<i4"),
+    ]
+)
+_SESSION_ID_SIZE = BET_RESULT_DTYPE["session_id"].itemsize
+
+
+def _encode_session_id(session_id: str) -> bytes:
+    """Encode a session ID for the fixed-width ``session_id`` field.
+
+    Args:
+        session_id: Session ID to store
+
+    Returns:
+        ASCII-encoded session ID
+
+    Raises:
+        ValueError: If the ID is not ASCII or does not fit the field, since it
+            would otherwise be truncated and could collide with another session
+    """
+    try:
+        encoded = session_id.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(
+            f"Binary bet results require an ASCII session ID, got {session_id!r}"
+        ) from None
+    if len(encoded) > _SESSION_ID_SIZE:
+        raise ValueError(
+            f"Binary bet results store at most {_SESSION_ID_SIZE} bytes of session ID, "
+            f"got {len(encoded)} for {session_id!r}"
+        )
+    return encoded
+
+
+class BinaryBetResultLogger(JSONLinesLogger):
+    """JSON Lines logger that stores bet results as fixed-width binary records.
+
+    Every event except ``bet_result`` is still written as JSON Lines. Bet results,
+    which dominate the volume of a long simulation, are buffered in memory and
+    appended to ``<log_file>.bets.bin`` as ``BET_RESULT_DTYPE`` records, which
+    ``read_bet_results`` loads back with a single ``numpy.fromfile`` call.
+    Session IDs must be ASCII and at most 36 bytes long (a UUID string).
+    Pending records are also written at interpreter exit if the logger was
+    never closed.
+    """
+
+    def __init__(self, log_file: str | Path, flush_every: int = 4096, **kwargs: Any):
+        """Initialize the binary bet result logger.
+
+        Args:
+            log_file: Path to the JSON Lines log file
+            flush_every: Number of buffered bet results before writing to disk
+            **kwargs: Additional arguments forwarded to JSONLinesLogger
+        """
+        super().__init__(log_file, **kwargs)
+        self.bets_file = self.log_file.with_name(self.log_file.name + ".bets.bin")
+        self.flush_every = flush_every
+        self._rows: list[tuple[Any, ...]] = []
+        atexit.register(self._flush_bet_results)
+
+    def log_bet_result(
+        self,
+        result: BetResult,
+        game_state: GameState,
+        strategy_name: str,
+        session_id: str,
+    ) -> None:
+        """Buffer a bet result as a binary record.
+
+        Args:
+            result: The bet result
+            game_state: Updated game state after the bet
+            strategy_name: Name of the strategy (kept in the JSON Lines events)
+            session_id: Current session ID
+        """
+        self._rows.append(
+            (
+                _encode_session_id(session_id),
+                -1 if result.nonce is None else result.nonce,
+                result.roll,
+                result.won,
+                result.bet_type is BetType.OVER,
+                result.target,
+                float(result.amount),
+                float(result.payout),
+                float(result.payout - result.amount if result.won else -result.amount),
+                float(game_state.balance),
+                game_state.bets_count,
+                game_state.consecutive_losses,
+            )
+        )
+        if len(self._rows) >= self.flush_every:
+            self._flush_bet_results()
+
+    def log_bet(
+        self,
+        decision: BetDecision,
+        result: BetResult,
+        game_state: GameState,
+        strategy_name: str,
+        session_id: str,
+    ) -> None:
+        """Log the decision as JSON Lines and buffer the result as a binary record.
+
+        Args:
+            decision: The bet decision that was executed
+            result: The bet result
+            game_state: Updated game state after the bet
+            strategy_name: Name of the strategy
+            session_id: Current session ID
+        """
+        self.log_bet_decision(decision, game_state, strategy_name, session_id)
+        self.log_bet_result(result, game_state, strategy_name, session_id)
+
+    def _flush_bet_results(self) -> None:
+        """Append buffered bet results to the binary stream."""
+        if not self._rows:
+            return
+        records = np.array(self._rows, dtype=BET_RESULT_DTYPE)
+        with open(self.bets_file, "ab") as f:
+            records.tofile(f)
+        self._rows.clear()
+
+    def flush(self) -> None:
+        """Append buffered bet results to the binary stream and flush events."""
+        self._flush_bet_results()
+        super().flush()
+
+    def close(self) -> None:
+        """Flush pending bet results and close the logger."""
+        self._flush_bet_results()
+        atexit.unregister(self._flush_bet_results)
+        super().close()
+
+
+def read_bet_results(bets_file: str | Path) -> np.ndarray:
+    """Load a binary bet result stream written by BinaryBetResultLogger.
+
+    Args:
+        bets_file: Path to the ``.bets.bin`` file
+
+    Returns:
+        Structured array with ``BET_RESULT_DTYPE`` records (empty if missing)
+    """
+    path = Path(bets_file)
+    if not path.exists():
+        return np.empty(0, dtype=BET_RESULT_DTYPE)
+    return np.fromfile(path, dtype=BET_RESULT_DTYPE)
+
+
+def _scan_events(
+    buffer: bytes | mmap.mmap, needle: bytes, key: str, value: str
+) -> Iterator[dict[str, Any]]:
+    """Decode only the lines of ``buffer`` containing ``needle``.
+
+    Args:
+        buffer: JSON Lines content
+        needle: JSON-encoded value to search for
+        key: Top-level event field to filter on
+        value: Expected value of the field
+
+    Yields:
+        Events whose ``key`` field equals ``value``, in buffer order
+    """
+    pos = buffer.find(needle)
+    while pos != -1:
+        start = buffer.rfind(b"\n", 0, pos) + 1
+        end = buffer.find(b"\n", pos)
+        if end == -1:
+            end = len(buffer)
+
+        try:
+            event = json.loads(buffer[start:end])
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            event = None
+        if isinstance(event, dict) and event.get(key) == value:
+            yield event
+
+        pos = buffer.find(needle, end)
 
 
 class LogAnalyzer:
-    """Analyzer for JSON Lines log files."""
+    """Analyzer for JSON Lines log files, plain or gzip-compressed backups."""
 
     def __init__(self, log_file: str | Path):
         """Initialize the log analyzer.
@@ -512,20 +1112,22 @@ class LogAnalyzer:
         Returns:
             List of event dictionaries
         """
+        if event_type is not None:
+            return list(self._iter_events("event_type", event_type))
+
         events: list[dict[str, Any]] = []
 
         try:
-            with open(self.log_file, encoding="utf-8") as f:
+            # Binary read: json.loads decodes UTF-8 bytes and skips surrounding
+            # whitespace itself, so lines need no text decoding or strip() copy
+            with self._open() as f:
                 for line in f:
-                    line = line.strip()
-                    if not line:
+                    if line.isspace():
                         continue
 
                     try:
-                        event = json.loads(line)
-                        if event_type is None or event.get("event_type") == event_type:
-                            events.append(event)
-                    except json.JSONDecodeError:
+                        events.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         continue
         except FileNotFoundError:
             pass
@@ -541,63 +1143,142 @@ class LogAnalyzer:
         Returns:
             List of events for the session
         """
-        events: list[dict[str, Any]] = []
+        return list(self._iter_events("session_id", session_id))
 
-        try:
-            with open(self.log_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+    def _iter_events(self, key: str, value: str) -> Iterator[dict[str, Any]]:
+        """Yield only the events whose ``key`` field equals ``value``.
 
-                    try:
-                        event = json.loads(line)
-                        if event.get("session_id") == session_id:
-                            events.append(event)
-                    except json.JSONDecodeError:
-                        continue
+        The file is memory-mapped and searched for the JSON-encoded value, so
+        lines that cannot match are never decoded.
+
+        Args:
+            key: Top-level event field to filter on
+            value: Expected value of the field
+
+        Yields:
+            Matching events, in file order
+        """
+        needle = json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+        if self.log_file.suffix == ".gz":
+            try:
+                with self._open() as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return
+            yield from _scan_events(data, needle, key, value)
+            return
+
+        try:
+            with (
+                open(self.log_file, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                yield from _scan_events(mm, needle, key, value)
         except FileNotFoundError:
-            pass
+            return
+        except ValueError:
+            # mmap refuses empty files: nothing to read
+            return
 
-        return events
+    def _open(self) -> BinaryIO:
+        """Open the log file for binary reading, decompressing ``.gz`` backups.
 
-    def analyze_session_performance(self, session_id: str) -> dict[str, Any]:
+        Returns:
+            Binary file object over the JSON Lines content
+        """
+        if self.log_file.suffix == ".gz":
+            return gzip.open(self.log_file, "rb")  # type: ignore[return-value]
+        return open(self.log_file, "rb")
+
+    def analyze_session_performance(self, session_id: str, precise: bool = False) -> dict[str, Any]:
         """Analyze performance for a specific session.
 
         Args:
             session_id: The session ID to analyze
+            precise: Sum profits and amounts with Decimal instead of float64
 
         Returns:
-            Dictionary with session analysis
+            Dictionary with session analysis. Totals are in LTC whatever the
+            source events: litoshi from "bet" events are scaled back using
+            ``amount_scale``.
         """
-        events = self.get_session_events(session_id)
-
-        if not events:
+        total_bets = 0
+        wins = 0
+        # bet_result events carry decimal strings, fused bet events integer litoshi
+        profits: list[str] = []
+        amounts: list[str] = []
+        profit_units: list[int] = []
+        amount_units: list[int] = []
+        strategy_name: str | None = None
+        session_start: dict[str, Any] | None = None
+        session_end: dict[str, Any] | None = None
+        found = False
+
+        for event in self._iter_events("session_id", session_id):
+            found = True
+            event_type = event.get("event_type")
+            if event_type == _EV_BET:
+                result = event["result"]
+                if total_bets == 0:
+                    strategy_name = event.get("strategy_name")
+                total_bets += 1
+                wins += result["won"]
+                profit_units.append(result["profit"])
+                amount_units.append(result["amount"])
+            elif event_type == _EV_BET_RESULT:
+                result = event["result"]
+                if total_bets == 0:
+                    strategy_name = event.get("strategy_name")
+                total_bets += 1
+                wins += result["won"]
+                profits.append(result["profit"])
+                amounts.append(result["amount"])
+            elif event_type == _EV_SESSION_START:
+                if session_start is None:
+                    session_start = event
+            elif event_type == _EV_SESSION_END:
+                if session_end is None:
+                    session_end = event
+
+        if not found:
             return {"error": "No events found for session"}
 
-        bet_results = [e for e in events if e.get("event_type") == "bet_result"]
-        session_start = next((e for e in events if e.get("event_type") == "session_start"), None)
-        session_end = next((e for e in events if e.get("event_type") == "session_end"), None)
-
-        if not bet_results:
+        if total_bets == 0:
             return {"error": "No bet results found for session"}
 
-        # Calculate metrics
-        total_bets = len(bet_results)
-        wins = sum(1 for r in bet_results if r["result"]["won"])
-        total_profit = sum(Decimal(r["result"]["profit"]) for r in bet_results)
-        total_wagered = sum(Decimal(r["result"]["amount"]) for r in bet_results)
+        # Integer litoshi sums are exact in int64
+        profit_units_sum = int(np.asarray(profit_units, dtype=np.int64).sum())
+        amount_units_sum = int(np.asarray(amount_units, dtype=np.int64).sum())
+
+        if precise:
+            profit_sum = sum(
+                map(Decimal, profits), Decimal(profit_units_sum).scaleb(-_AMOUNT_SCALE)
+            )
+            wagered_sum = sum(
+                map(Decimal, amounts), Decimal(amount_units_sum).scaleb(-_AMOUNT_SCALE)
+            )
+            total_profit = float(profit_sum)
+            total_wagered = float(wagered_sum)
+            roi = float(profit_sum / wagered_sum) if wagered_sum > 0 else 0
+        else:
+            # Parse the decimal strings and reduce them in C
+            total_profit = float(np.asarray(profits).astype(np.float64).sum())
+            total_wagered = float(np.asarray(amounts).astype(np.float64).sum())
+            total_profit += profit_units_sum / 10**_AMOUNT_SCALE
+            total_wagered += amount_units_sum / 10**_AMOUNT_SCALE
+            roi = total_profit / total_wagered if total_wagered > 0 else 0
 
         analysis = {
             "session_id": session_id,
-            "strategy_name": bet_results[0].get("strategy_name"),
+            "strategy_name": strategy_name,
             "total_bets": total_bets,
             "wins": wins,
             "losses": total_bets - wins,
-            "win_rate": wins / total_bets if total_bets > 0 else 0,
-            "total_profit": float(total_profit),
-            "total_wagered": float(total_wagered),
-            "roi": float(total_profit / total_wagered) if total_wagered > 0 else 0,
+            "win_rate": wins / total_bets,
+            "total_profit": total_profit,
+            "total_wagered": total_wagered,
+            "roi": roi,
             "session_start": session_start["timestamp"] if session_start else None,
             "session_end": session_end["timestamp"] if session_end else None,
             "stop_reason": session_end.get("stop_reason") if session_end else None,
@@ -2,30 +2,148 @@
 Advanced metrics calculator for analyzing dice game performance and strategies.
 """
 
+import copy
+import math
 from datetime import timedelta
-from decimal import Decimal
+from functools import cached_property
+from types import SimpleNamespace
 from typing import Any
 
 import numpy as np  # type: ignore[import-untyped]
-from scipy import stats  # type: ignore[import-untyped]
 
 from ..core.models import BetResult, SessionState
 
 # Type aliases for numpy
 NumpyArray = Any
 
+# Integer units (litoshi) per LTC for exact balance arithmetic
+_LITOSHI_PER_LTC = 10**8
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _bet_columns(bet_history: list[BetResult]) -> SimpleNamespace:
+    """Unpack a bet history into per-bet NumPy columns.
+
+    Each ``Decimal`` is converted once, to float64. The integer litoshi
+    columns are derived from those floats with a vectorized ``np.rint``,
+    which is exact for amounts with at most 8 decimals below ~10 million LTC.
+
+    Args:
+        bet_history: List of bet results
+
+    Returns:
+        Namespace with ``amount``, ``payout`` and ``profit`` (float64),
+        ``won`` (bool), ``amount_units``/``payout_units``/``profit_units``
+        (int64 litoshi) and ``elapsed_us`` (int64, since the first bet)
+        arrays, plus the list of bet ``timestamps``
+    """
+    count = len(bet_history)
+    amount: Any = np.fromiter((float(bet.amount) for bet in bet_history), np.float64, count)
+    payout: Any = np.fromiter((float(bet.payout) for bet in bet_history), np.float64, count)
+    won: Any = np.fromiter((bet.won for bet in bet_history), np.bool_, count)
+    timestamps = [bet.timestamp for bet in bet_history]
+    first = timestamps[0] if timestamps else None
+    elapsed_us: Any = np.fromiter(
+        ((timestamp - first) // _ONE_MICROSECOND for timestamp in timestamps), np.int64, count
+    )
+
+    amount_units: Any = np.rint(amount * _LITOSHI_PER_LTC).astype(np.int64)
+    payout_units: Any = np.rint(payout * _LITOSHI_PER_LTC).astype(np.int64)
+    # Signed per-bet profit, shared by returns, profit factor, drawdown and
+    # time series instead of each recomputing it
+    return SimpleNamespace(
+        amount=amount,
+        payout=payout,
+        won=won,
+        profit=np.where(won, payout - amount, -amount),
+        amount_units=amount_units,
+        payout_units=payout_units,
+        profit_units=np.where(won, payout_units - amount_units, -amount_units),
+        elapsed_us=elapsed_us,
+        timestamps=timestamps,
+    )
+
+
+def _as_float_array(values: list[float] | NumpyArray) -> NumpyArray:
+    """Return floating-point arrays as is, converting anything else to float64.
+
+    Keeps float32 return series in float32 instead of copying them up.
+
+    Args:
+        values: List or array of values
+
+    Returns:
+        Floating-point NumPy array
+    """
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.floating):
+        return values
+    return np.asarray(values, dtype=np.float64)
+
+
+def _central_moments(values: NumpyArray) -> tuple[float, float, float, float]:
+    """Compute mean, variance, skewness and excess kurtosis from shared deviations.
+
+    Matches ``np.var`` and the biased ``scipy.stats.skew``/``kurtosis``
+    defaults; skewness and kurtosis are NaN when all values are equal.
+    Reductions accumulate in float64 whatever the input precision.
+
+    Args:
+        values: Non-empty array of values
+
+    Returns:
+        Tuple of (mean, population variance, skewness, excess kurtosis)
+    """
+    mean = float(values.mean(dtype=np.float64))
+    deviations: Any = values - mean
+    squared: Any = deviations * deviations
+    variance = float(squared.mean(dtype=np.float64))
+    if variance == 0:
+        return mean, 0.0, math.nan, math.nan
+
+    skewness = float((squared * deviations).mean(dtype=np.float64)) / variance**1.5
+    kurtosis = float((squared * squared).mean(dtype=np.float64)) / variance**2 - 3.0
+    return mean, variance, skewness, kurtosis
+
+
+def _drawdown_kernel(profit: NumpyArray, elapsed_us: NumpyArray) -> tuple[int, int]:
+    """Find the longest drawdown of a bet series, in bets and in time.
+
+    A bet sets a new peak when the running balance exceeds every previous
+    balance (and 0); each run of other bets is a drawdown lasting until the
+    next peak, or until the last bet if it is still ongoing.
+
+    Args:
+        profit: Per-bet profit in integer units (int64)
+        elapsed_us: Per-bet timestamps in microseconds (int64)
+
+    Returns:
+        Tuple of (longest drawdown in bets, longest drawdown in microseconds)
+    """
+    count = profit.size
+    balance: Any = profit.cumsum()
+    previous_peak: Any = np.maximum.accumulate(np.concatenate(([0], balance[:-1])))
+    new_peak: Any = balance > previous_peak
+    starts: Any = np.flatnonzero(~new_peak & np.concatenate(([True], new_peak[:-1])))
+    if starts.size == 0:
+        return 0, 0
+
+    ends: Any = np.append(np.flatnonzero(new_peak), count)
+    ends = ends[np.searchsorted(ends[:-1], starts)]
+    durations: Any = elapsed_us[np.minimum(ends, count - 1)] - elapsed_us[starts]
+    return int((ends - starts).max()), int(durations.max())
+
 
 class PerformanceMetrics:
     """Calculator for advanced performance metrics."""
 
     @staticmethod
     def calculate_sharpe_ratio(
-        returns: list[float], risk_free_rate: float = 0.0, periods_per_year: int = 365
+        returns: list[float] | NumpyArray, risk_free_rate: float = 0.0, periods_per_year: int = 365
     ) -> float:
         """Calculate Sharpe ratio.
 
         Args:
-            returns: List of returns (profit/loss per bet as ratio)
+            returns: List or array of returns (profit/loss per bet as ratio)
             risk_free_rate: Risk-free rate (annualized)
             periods_per_year: Number of periods per year for annualization
 
@@ -35,23 +153,21 @@ class PerformanceMetrics:
         if len(returns) < 2:
             return 0.0
 
-        returns_array: NumpyArray = np.array(returns)  # type: ignore[misc]
-        excess_returns: NumpyArray = returns_array - (risk_free_rate / periods_per_year)  # type: ignore[misc]
-
-        if np.std(excess_returns) == 0:
+        excess_returns: NumpyArray = _as_float_array(returns) - risk_free_rate / periods_per_year
+        std = float(excess_returns.std(dtype=np.float64))
+        if std == 0:
             return 0.0
 
-        sharpe: Any = np.mean(excess_returns) / np.std(excess_returns)
-        return float(sharpe * np.sqrt(periods_per_year))
+        return float(excess_returns.mean(dtype=np.float64)) / std * math.sqrt(periods_per_year)
 
     @staticmethod
     def calculate_sortino_ratio(
-        returns: list[float], target_return: float = 0.0, periods_per_year: int = 365
+        returns: list[float] | NumpyArray, target_return: float = 0.0, periods_per_year: int = 365
     ) -> float:
         """Calculate Sortino ratio (only penalizes downside volatility).
 
         Args:
-            returns: List of returns
+            returns: List or array of returns
             target_return: Target return rate
             periods_per_year: Number of periods per year
 
@@ -61,19 +177,19 @@ class PerformanceMetrics:
         if len(returns) < 2:
             return 0.0
 
-        returns_array: Any = np.array(returns)
-        excess_returns: Any = returns_array - target_return
+        excess_returns: Any = _as_float_array(returns) - target_return
         downside_returns: Any = excess_returns[excess_returns < 0]
+        mean_excess = float(excess_returns.mean(dtype=np.float64))
 
         if len(downside_returns) == 0:
-            return float("inf") if np.mean(excess_returns) > 0 else 0.0
+            return float("inf") if mean_excess > 0 else 0.0
 
-        downside_deviation: Any = np.sqrt(np.mean(downside_returns**2))
+        downside_deviation = math.sqrt(float(np.square(downside_returns).mean(dtype=np.float64)))
 
         if downside_deviation == 0:
             return 0.0
 
-        return float(np.mean(excess_returns) / downside_deviation * np.sqrt(periods_per_year))
+        return mean_excess / downside_deviation * math.sqrt(periods_per_year)
 
     @staticmethod
     def calculate_calmar_ratio(
@@ -100,43 +216,73 @@ class PerformanceMetrics:
         return annualized_return / max_drawdown
 
     @staticmethod
-    def calculate_value_at_risk(returns: list[float], confidence_level: float = 0.05) -> float:
+    def calculate_value_at_risk(
+        returns: list[float] | NumpyArray, confidence_level: float = 0.05, interpolate: bool = False
+    ) -> float:
         """Calculate Value at Risk (VaR).
 
+        By default VaR is the return at index ``int(confidence_level * (n - 1))``
+        of the sorted returns, found with ``np.partition`` without a full sort.
+
         Args:
-            returns: List of returns
+            returns: List or array of returns
             confidence_level: Confidence level (e.g., 0.05 for 95% VaR)
+            interpolate: Interpolate between neighbouring returns like
+                ``np.percentile`` instead of taking the lower one
 
         Returns:
             Value at Risk
         """
-        if not returns:
+        if len(returns) == 0:
             return 0.0
 
-        return float(np.percentile(returns, confidence_level * 100))
+        returns_array: Any = _as_float_array(returns)
+        if interpolate:
+            return float(np.percentile(returns_array, confidence_level * 100))
+
+        k = int(confidence_level * (returns_array.size - 1))
+        return float(np.partition(returns_array, k)[k])
 
     @staticmethod
-    def calculate_expected_shortfall(returns: list[float], confidence_level: float = 0.05) -> float:
+    def calculate_expected_shortfall(
+        returns: list[float] | NumpyArray, confidence_level: float = 0.05
+    ) -> float:
         """Calculate Expected Shortfall (Conditional VaR).
 
         Args:
-            returns: List of returns
+            returns: List or array of returns
             confidence_level: Confidence level
 
         Returns:
             Expected Shortfall
         """
-        if not returns:
-            return 0.0
+        return PerformanceMetrics.calculate_var_and_es(returns, confidence_level)[1]
 
-        var = PerformanceMetrics.calculate_value_at_risk(returns, confidence_level)
-        returns_array: Any = np.array(returns)
-        tail_returns: Any = returns_array[returns_array <= var]
+    @staticmethod
+    def calculate_var_and_es(
+        returns: list[float] | NumpyArray, confidence_level: float = 0.05
+    ) -> tuple[float, float]:
+        """Calculate Value at Risk and Expected Shortfall from one partial sort.
 
-        if len(tail_returns) == 0:
-            return var
+        The ``k = ceil(confidence_level * n)`` worst returns are selected with
+        ``np.partition``: VaR is the largest of them and Expected Shortfall
+        their mean.
 
-        return float(np.mean(tail_returns))
+        Args:
+            returns: List or array of returns
+            confidence_level: Confidence level (e.g., 0.05 for 95% VaR)
+
+        Returns:
+            Tuple of (Value at Risk, Expected Shortfall)
+        """
+        if len(returns) == 0:
+            return 0.0, 0.0
+
+        returns_array: Any = _as_float_array(returns)
+        # Rounded first so that e.g. 0.05 * 60 = 3.0000000000000004 gives k = 3
+        k = max(1, math.ceil(round(confidence_level * returns_array.size, 9)))
+        tail: Any = np.partition(returns_array, k - 1)[:k]
+        return float(tail[k - 1]), float(tail.mean(dtype=np.float64))
 
     @staticmethod
     def calculate_maximum_drawdown_duration(
@@ -153,55 +299,10 @@ class PerformanceMetrics:
         if not bet_history:
             return 0, timedelta(0)
 
-        balance = Decimal("0")
-        peak_balance = Decimal("0")
-        max_dd_bets = 0
-        max_dd_duration = timedelta(0)
-        current_dd_start_bet = 0
-        current_dd_start_time: Any = None
-        in_drawdown = False
-
-        for i, bet in enumerate(bet_history):
-            if bet.won:
-                profit = bet.payout - bet.amount
-            else:
-                profit = -bet.amount
-
-            balance += profit
-
-            if balance > peak_balance:
-                # New peak, end of drawdown
-                if in_drawdown and current_dd_start_time:
-                    dd_bets = i - current_dd_start_bet
-                    dd_duration: timedelta = bet.timestamp - current_dd_start_time
-
-                    if dd_bets > max_dd_bets:
-                        max_dd_bets = dd_bets
-                    if dd_duration > max_dd_duration:
-                        max_dd_duration = dd_duration
-
-                peak_balance = balance
-                in_drawdown = False
-                current_dd_start_bet = i
-                current_dd_start_time = bet.timestamp
-            else:
-                # In drawdown
-                if not in_drawdown:
-                    in_drawdown = True
-                    current_dd_start_bet = i
-                    current_dd_start_time = bet.timestamp
-
-        # Check final drawdown if still ongoing
-        if in_drawdown and current_dd_start_time and bet_history:
-            final_dd_bets = len(bet_history) - current_dd_start_bet
-            final_dd_duration: timedelta = bet_history[-1].timestamp - current_dd_start_time
-
-            if final_dd_bets > max_dd_bets:
-                max_dd_bets = final_dd_bets
-            if final_dd_duration > max_dd_duration:
-                max_dd_duration = final_dd_duration
-
-        return max_dd_bets, max_dd_duration
+        # Balance tracked in integer litoshi: no Decimal arithmetic per bet
+        columns = _bet_columns(bet_history)
+        max_dd_bets, max_dd_us = _drawdown_kernel(columns.profit_units, columns.elapsed_us)
+        return max_dd_bets, timedelta(microseconds=max(max_dd_us, 0))
 
     @staticmethod
     def calculate_profit_factor(bet_history: list[BetResult]) -> float:
@@ -213,22 +314,49 @@ class PerformanceMetrics:
         Returns:
             Profit factor
         """
-        if not bet_history:
-            return 0.0
+        # float64 is enough for a ratio: Decimal is only read at the boundary
+        return PerformanceMetrics.calculate_profit_factor_from_profits(
+            _bet_columns(bet_history).profit
+        )
 
-        gross_profit = Decimal("0")
-        gross_loss = Decimal("0")
+    @staticmethod
+    def calculate_profit_factor_from_arrays(
+        amount: NumpyArray, payout: NumpyArray, won: NumpyArray
+    ) -> float:
+        """Calculate profit factor from per-bet arrays.
+
+        Args:
+            amount: Bet amounts (float64)
+            payout: Bet payouts (float64)
+            won: Bet outcomes (bool)
+
+        Returns:
+            Profit factor
+        """
+        return PerformanceMetrics.calculate_profit_factor_from_profits(
+            np.where(won, payout - amount, -amount)
+        )
+
+    @staticmethod
+    def calculate_profit_factor_from_profits(profit: NumpyArray) -> float:
+        """Calculate profit factor from signed per-bet profits.
+
+        Args:
+            profit: Profit of each bet (positive for wins, ``-amount`` for losses)
+
+        Returns:
+            Profit factor
+        """
+        if profit.size == 0:
+            return 0.0
 
-        for bet in bet_history:
-            if bet.won:
-                gross_profit += bet.payout - bet.amount
-            else:
-                gross_loss += bet.amount
+        gross_profit = float(profit[profit > 0].sum())
+        gross_loss = float(-profit[profit < 0].sum())
 
         if gross_loss == 0:
             return float("inf") if gross_profit > 0 else 0.0
 
-        return float(gross_profit / gross_loss)
+        return gross_profit / gross_loss
 
     @staticmethod
     def calculate_kelly_criterion(
@@ -266,6 +394,18 @@ class SessionAnalyzer:
         self.session = session_state
         self.game_state = session_state.game_state
 
+    @cached_property
+    def _arrays(self) -> SimpleNamespace:
+        """Per-bet columns extracted once from ``bet_history``.
+
+        Cached for the lifetime of the analyzer: create a new analyzer to
+        include bets recorded afterwards.
+
+        Returns:
+            Columns built by ``_bet_columns``
+        """
+        return _bet_columns(self.game_state.bet_history)
+
     def get_basic_metrics(self) -> dict[str, Any]:
         """Get basic session metrics.
 
@@ -307,14 +447,12 @@ class SessionAnalyzer:
         if not self.game_state.bet_history:
             return {"error": "No bet history available"}
 
-        # Calculate returns
-        returns: list[float] = []
-        for bet in self.game_state.bet_history:
-            if bet.won:
-                profit = bet.payout - bet.amount
-            else:
-                profit = -bet.amount
-            returns.append(float(profit / bet.amount))
+        # Calculate returns (profit / amount; a lost bet returns -1). Returns
+        # only feed statistical summaries, so they are stored in float32 to
+        # halve the memory traffic; money columns and accumulators stay float64
+        arrays = self._arrays
+        amount, payout, won, profit = arrays.amount, arrays.payout, arrays.won, arrays.profit
+        returns: NumpyArray = (profit / amount).astype(np.float32)
 
         # Advanced metrics
         sortino = PerformanceMetrics.calculate_sortino_ratio(returns)
@@ -323,15 +461,14 @@ class SessionAnalyzer:
             float(self.game_state.max_drawdown),
             len(returns),
         )
-        var_95 = PerformanceMetrics.calculate_value_at_risk(returns, 0.05)
-        expected_shortfall = PerformanceMetrics.calculate_expected_shortfall(returns, 0.05)
-        profit_factor = PerformanceMetrics.calculate_profit_factor(self.game_state.bet_history)
+        var_95, expected_shortfall = PerformanceMetrics.calculate_var_and_es(returns, 0.05)
+        profit_factor = PerformanceMetrics.calculate_profit_factor_from_profits(profit)
 
-        # Drawdown duration
-        max_dd_results = PerformanceMetrics.calculate_maximum_drawdown_duration(
-            self.game_state.bet_history
-        )
-        max_dd_bets, max_dd_duration = max_dd_results
+        mean_return, variance, skewness, kurtosis = _central_moments(returns)
+
+        # Drawdown duration, from the integer columns
+        max_dd_bets, max_dd_us = _drawdown_kernel(arrays.profit_units, arrays.elapsed_us)
+        max_dd_duration = timedelta(microseconds=max(max_dd_us, 0))
 
         return {
             "advanced_ratios": {
@@ -352,41 +489,21 @@ class SessionAnalyzer:
                     if self.game_state.bets_count > 0
                     else 0
                 ),
-                "largest_bet": float(max(bet.amount for bet in self.game_state.bet_history)),
-                "smallest_bet": float(min(bet.amount for bet in self.game_state.bet_history)),
-                "average_win_payout": (
-                    float(
-                        np.mean(
-                            [float(bet.payout) for bet in self.game_state.bet_history if bet.won]
-                        )
-                    )
-                    if any(bet.won for bet in self.game_state.bet_history)
-                    else 0
-                ),
-                "largest_single_loss": (
-                    float(max(bet.amount for bet in self.game_state.bet_history if not bet.won))
-                    if any(not bet.won for bet in self.game_state.bet_history)
-                    else 0
-                ),
-                "largest_single_win": (
-                    float(
-                        max(
-                            bet.payout - bet.amount
-                            for bet in self.game_state.bet_history
-                            if bet.won
-                        )
-                    )
-                    if any(bet.won for bet in self.game_state.bet_history)
-                    else 0
-                ),
+                "largest_bet": float(amount.max()),
+                "smallest_bet": float(amount.min()),
+                # Masked reductions: no boolean-indexed copy of the subsets; the
+                # 0 initial value doubles as the default when a subset is empty
+                "average_win_payout": float(payout.mean(where=won)) if won.any() else 0,
+                "largest_single_loss": float(amount.max(where=~won, initial=0.0)),
+                "largest_single_win": float(profit.max(where=won, initial=0.0)),
             },
             "returns_analysis": {
-                "mean_return": float(np.mean(returns)) if returns else 0,
-                "std_return": float(np.std(returns)) if returns else 0,
-                "skewness": float(stats.skew(returns)) if len(returns) > 2 else 0,
-                "kurtosis": float(stats.kurtosis(returns)) if len(returns) > 3 else 0,
-                "min_return": min(returns) if returns else 0,
-                "max_return": max(returns) if returns else 0,
+                "mean_return": mean_return,
+                "std_return": math.sqrt(variance),
+                "skewness": skewness if len(returns) > 2 else 0,
+                "kurtosis": kurtosis if len(returns) > 3 else 0,
+                "min_return": float(returns.min()),
+                "max_return": float(returns.max()),
             },
         }
 
@@ -399,63 +516,46 @@ class SessionAnalyzer:
         if not self.game_state.bet_history:
             return {"error": "No bet history available"}
 
-        # Calculate cumulative metrics over time
-        cumulative_profit: list[float] = []
-        cumulative_bets: list[int] = []
-        rolling_win_rate: list[float] = []
-        balance_history: list[float] = []
-
-        current_profit = Decimal("0")
-        current_balance: Any = self.game_state.session_start_balance or self.game_state.balance
-        window_size = min(20, len(self.game_state.bet_history))  # 20-bet rolling window
-
-        for i, bet in enumerate(self.game_state.bet_history):
-            if bet.won:
-                profit = bet.payout - bet.amount
-                current_balance += profit
-            else:
-                profit = -bet.amount
-                current_balance -= bet.amount
-
-            current_profit += profit
-            cumulative_profit.append(float(current_profit))
-            cumulative_bets.append(i + 1)
-            balance_history.append(float(current_balance))
-
-            # Rolling win rate
-            if i >= window_size - 1:
-                window_start = max(0, i - window_size + 1)
-                window_wins = sum(
-                    1 for b in self.game_state.bet_history[window_start : i + 1] if b.won
-                )
-                rolling_win_rate.append(window_wins / window_size)
-            else:
-                window_wins = sum(1 for b in self.game_state.bet_history[: i + 1] if b.won)
-                rolling_win_rate.append(window_wins / (i + 1))
+        # Cumulative metrics over time, computed on the cached bet arrays
+        arrays = self._arrays
+        won = arrays.won
+        count = won.size
+        start_balance: Any = self.game_state.session_start_balance or self.game_state.balance
+        cumulative_profit: NumpyArray = arrays.profit.cumsum()
+        balance_history: NumpyArray = float(start_balance) + cumulative_profit
+
+        # Rolling win rate over a 20-bet window, expanding until the window is
+        # full: exact integer window sums as differences of the prefix sums
+        window_size = 20
+        cumulative_wins: NumpyArray = np.concatenate(([0], won.cumsum(dtype=np.int64)))
+        positions: NumpyArray = np.arange(count)
+        window_starts: NumpyArray = np.maximum(positions - window_size + 1, 0)
+        rolling_win_rate: NumpyArray = (
+            cumulative_wins[1:] - cumulative_wins[window_starts]
+        ) / np.minimum(positions + 1, window_size)
 
         return {
             "time_series": {
-                "cumulative_profit": cumulative_profit,
-                "cumulative_bets": cumulative_bets,
-                "balance_history": balance_history,
-                "rolling_win_rate": rolling_win_rate,
+                "cumulative_profit": cumulative_profit.tolist(),
+                "cumulative_bets": list(range(1, count + 1)),
+                "balance_history": balance_history.tolist(),
+                "rolling_win_rate": rolling_win_rate.tolist(),
                 "timestamps": [
-                    bet.timestamp.isoformat() if bet.timestamp else ""
-                    for bet in self.game_state.bet_history
+                    timestamp.isoformat() if timestamp else "" for timestamp in arrays.timestamps
                 ],
             },
             "trend_analysis": {
                 "profit_trend_slope": self._calculate_trend_slope(cumulative_profit),
-                "balance_volatility": float(np.std(balance_history)) if balance_history else 0,
-                "win_rate_stability": float(np.std(rolling_win_rate)) if rolling_win_rate else 0,
+                "balance_volatility": float(balance_history.std()),
+                "win_rate_stability": float(rolling_win_rate.std()),
             },
         }
 
-    def _calculate_trend_slope(self, values: list[float]) -> float:
+    def _calculate_trend_slope(self, values: list[float] | NumpyArray) -> float:
         """Calculate trend slope using linear regression.
 
         Args:
-            values: List of values
+            values: List or array of values
 
         Returns:
             Slope of the trend line
@@ -463,9 +563,12 @@ class SessionAnalyzer:
         if len(values) < 2:
             return 0.0
 
-        x: Any = np.arange(len(values))
-        slope: Any = stats.linregress(x, values)[0]
-        return float(slope)
+        # Least-squares slope against x = 0..n-1, whose centered sum of squares
+        # is n(n^2 - 1)/12; y needs no centering since sum(x - x_mean) = 0
+        y: Any = np.asarray(values, dtype=np.float64)
+        n = y.size
+        x_centered: Any = np.arange(n, dtype=np.float64) - (n - 1) / 2
+        return float(x_centered @ y / (n * (n * n - 1) / 12))
 
 
 class MultiSessionAnalyzer:
@@ -478,71 +581,105 @@ class MultiSessionAnalyzer:
             sessions: List of session states to analyze
         """
         self.sessions = sessions
+        # Analyzers reused by compare_strategies, keyed by the identity of
+        # their sessions (kept alive by the analyzer, so ids are not reused)
+        self._group_analyzers: dict[tuple[int, ...], MultiSessionAnalyzer] = {}
 
     def get_aggregate_metrics(self) -> dict[str, Any]:
         """Get aggregate metrics across all sessions.
 
+        Computed once per analyzer, see ``aggregate_metrics``. Each call returns
+        a copy, so callers may modify it without affecting later calls.
+
         Returns:
             Dictionary of aggregate metrics
         """
-        if not self.sessions:
-            return {"error": "No sessions provided"}
+        return copy.deepcopy(self.aggregate_metrics)
 
-        total_bets = sum(s.game_state.bets_count for s in self.sessions)
-        total_wins = sum(s.game_state.wins_count for s in self.sessions)
-        total_profit = sum(s.game_state.total_profit for s in self.sessions)
-        total_wagered = sum(s.game_state.total_wagered for s in self.sessions)
-        total_duration = sum(s.total_session_time for s in self.sessions)
+    @cached_property
+    def aggregate_metrics(self) -> dict[str, Any]:
+        """Aggregate metrics across all sessions, cached on first access.
 
-        profitable_sessions = sum(1 for s in self.sessions if s.game_state.total_profit > 0)
+        Create a new analyzer to include sessions or bets added afterwards.
+
+        Returns:
+            Dictionary of aggregate metrics
+        """
+        if not self.sessions:
+            return {"error": "No sessions provided"}
 
-        # Session-level metrics
-        session_profits: list[float] = [float(s.game_state.total_profit) for s in self.sessions]
-        session_rois: list[float] = [s.game_state.session_roi for s in self.sessions]
-        session_durations: list[float] = [s.total_session_time for s in self.sessions]
+        # One pass over the sessions, then native reductions per column
+        columns: Any = np.array(
+            [
+                (
+                    s.game_state.bets_count,
+                    s.game_state.wins_count,
+                    float(s.game_state.total_profit),
+                    float(s.game_state.total_wagered),
+                    s.total_session_time,
+                    s.game_state.session_roi,
+                    float(s.game_state.max_drawdown),
+                    s.game_state.max_consecutive_losses,
+                )
+                for s in self.sessions
+            ],
+            dtype=np.float64,
+        )
+        (
+            bets_counts,
+            wins_counts,
+            session_profits,
+            session_wagered,
+            session_durations,
+            session_rois,
+            session_drawdowns,
+            session_max_losses,
+        ) = columns.T
+
+        session_count = len(self.sessions)
+        total_bets = int(bets_counts.sum())
+        total_wins = int(wins_counts.sum())
+        total_profit = float(session_profits.sum())
+        total_wagered = float(session_wagered.sum())
+        total_duration = float(session_durations.sum())
+        profitable_sessions = int((session_profits > 0).sum())
+        profit_std = float(session_profits.std())
+        roi_std = float(session_rois.std())
 
         return {
             "aggregate_performance": {
-                "total_sessions": len(self.sessions),
+                "total_sessions": session_count,
                 "total_bets": total_bets,
                 "total_wins": total_wins,
                 "total_losses": total_bets - total_wins,
                 "overall_win_rate": total_wins / total_bets if total_bets > 0 else 0,
-                "total_profit": float(total_profit),
-                "total_wagered": float(total_wagered),
-                "overall_roi": float(total_profit / total_wagered) if total_wagered > 0 else 0,
+                "total_profit": total_profit,
+                "total_wagered": total_wagered,
+                "overall_roi": total_profit / total_wagered if total_wagered > 0 else 0,
                 "total_duration_hours": total_duration / 3600,
-                "average_bets_per_session": total_bets / len(self.sessions),
+                "average_bets_per_session": total_bets / session_count,
                 "profitable_sessions": profitable_sessions,
-                "profitability_rate": profitable_sessions / len(self.sessions),
+                "profitability_rate": profitable_sessions / session_count,
             },
             "session_statistics": {
-                "average_session_profit": float(np.mean(session_profits)),
+                "average_session_profit": float(session_profits.mean()),
                 "median_session_profit": float(np.median(session_profits)),
-                "std_session_profit": float(np.std(session_profits)),
-                "best_session_profit": max(session_profits),
-                "worst_session_profit": min(session_profits),
-                "average_session_roi": float(np.mean(session_rois)),
+                "std_session_profit": profit_std,
+                "best_session_profit": float(session_profits.max()),
+                "worst_session_profit": float(session_profits.min()),
+                "average_session_roi": float(session_rois.mean()),
                 "median_session_roi": float(np.median(session_rois)),
-                "std_session_roi": float(np.std(session_rois)),
-                "average_session_duration_minutes": float(np.mean(session_durations)) / 60,
+                "std_session_roi": roi_std,
+                "average_session_duration_minutes": float(session_durations.mean()) / 60,
                 "median_session_duration_minutes": float(np.median(session_durations)) / 60,
             },
             "risk_analysis": {
-                "profit_volatility": float(np.std(session_profits)),
-                "roi_volatility": float(np.std(session_rois)),
-                "max_session_drawdown": max(
-                    float(s.game_state.max_drawdown) for s in self.sessions
-                ),
-                "average_session_drawdown": float(
-                    np.mean([float(s.game_state.max_drawdown) for s in self.sessions])
-                ),
-                "sessions_with_significant_loss": sum(
-                    1 for s in self.sessions if s.game_state.session_roi < -0.1
-                ),
-                "worst_consecutive_losses": max(
-                    s.game_state.max_consecutive_losses for s in self.sessions
-                ),
+                "profit_volatility": profit_std,
+                "roi_volatility": roi_std,
+                "max_session_drawdown": float(session_drawdowns.max()),
+                "average_session_drawdown": float(session_drawdowns.mean()),
+                "sessions_with_significant_loss": int((session_rois < -0.1).sum()),
+                "worst_consecutive_losses": int(session_max_losses.max()),
             },
         }
 
@@ -564,7 +701,10 @@ class MultiSessionAnalyzer:
             if not sessions:
                 continue
 
-            analyzer = MultiSessionAnalyzer(sessions)
+            key = tuple(map(id, sessions))
+            analyzer = self._group_analyzers.get(key)
+            if analyzer is None:
+                analyzer = self._group_analyzers[key] = MultiSessionAnalyzer(sessions)
             metrics = analyzer.get_aggregate_metrics()
             strategy_metrics[strategy_name] = metrics
 
@@ -613,8 +753,10 @@ class MultiSessionAnalyzer:
             ),
             "by_risk_adjusted": sorted(
                 strategies,
-                key=lambda s: strategy_metrics[s]["aggregate_performance"]["overall_roi"]
-                / max(0.01, strategy_metrics[s]["risk_analysis"]["roi_volatility"]),
+                key=lambda s: (
+                    strategy_metrics[s]["aggregate_performance"]["overall_roi"]
+                    / max(0.01, strategy_metrics[s]["risk_analysis"]["roi_volatility"])
+                ),
                 reverse=True,
             ),
         }
@@ -4,6 +4,8 @@ Progress tracking utilities for DiceBot simulations.
 
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
+from time import monotonic
 from typing import Any
 
 from rich.console import Console  # type: ignore[import-untyped]
@@ -18,21 +20,58 @@ from rich.progress import (  # type: ignore[import-untyped]
 )
 
 
+def _progress_columns() -> tuple[Any, ...]:
+    """Build the column stack of a simulation progress bar.
+
+    Columns cache their renders by task id, and task ids restart at 0 in every
+    Progress, so each Progress needs its own column instances.
+
+    Returns:
+        Fresh column instances
+    """
+    return (
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+    )
+
+
+# Minimum delay in seconds between two rebuilds of the live statistics line
+_DESCRIPTION_INTERVAL = 0.5
+
+
+# Console prefix of each message level
+_MESSAGE_PREFIXES = {
+    "warning": "⚠️  [yellow]Warning:[/yellow] ",
+    "error": "❌ [red]Error:[/red] ",
+    "success": "✅ [green]Success:[/green] ",
+    "info": "ℹ️  [blue]Info:[/blue] ",
+}
+
+
+@dataclass(slots=True)
+class _SimulationStats:
+    """Live statistics of a tracked simulation."""
+
+    profitable_sessions: int = 0
+    total_profit: float = 0.0
+    total_roi: float = 0.0
+    sessions_completed: int = 0
+
+
 class SimulationProgress:
     """Enhanced progress tracking for simulations."""
 
     def __init__(self, console: Any = None):
         self.console: Any = console or Console()
         self.progress: Any = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
+            *_progress_columns(),
             console=self.console,
-            refresh_per_second=10,
+            refresh_per_second=4,
         )
 
     @contextmanager
@@ -52,50 +91,72 @@ class SimulationProgress:
         with self.progress:
             task_id: Any = self.progress.add_task(description, total=total_sessions)
 
+            if not show_stats:
+                # Headless runs: no statistics code at all on the per-session path
+                def advance_progress(session_result: Any = None, advance: int = 1) -> None:
+                    """Update progress only."""
+                    self.progress.advance(task_id, advance)
+
+                yield task_id, advance_progress
+                return
+
             # Statistics tracking
-            stats: dict[str, Any] = {
-                "profitable_sessions": 0,
-                "total_profit": 0.0,
-                "avg_roi": 0.0,
-                "sessions_completed": 0,
-            }
+            stats = _SimulationStats()
+            last_description_update = float("-inf")
+            profit_prefix = f"{description} | Profit: "
+
+            def update_description() -> None:
+                """Show the live statistics in the task description."""
+                sessions_completed = stats.sessions_completed
+                profitable_rate = (
+                    stats.profitable_sessions / sessions_completed * 100
+                    if sessions_completed > 0
+                    else 0
+                )
+                avg_roi = stats.total_roi / sessions_completed if sessions_completed > 0 else 0
+
+                new_description = (
+                    f"{profit_prefix}{stats.total_profit:.4f} LTC | "
+                    f"Profitable: {profitable_rate:.1f}% | "
+                    f"Avg ROI: {avg_roi:.2%}"
+                )
+                self.progress.update(task_id, description=new_description)
 
             def update_progress(session_result: Any = None, advance: int = 1) -> None:
                 """Update progress and optionally show live stats."""
+                nonlocal last_description_update
                 self.progress.advance(task_id, advance)
 
-                if session_result and show_stats:
+                if session_result:
                     # Update statistics
-                    stats["sessions_completed"] += 1
-                    if hasattr(session_result, "game_state"):
-                        profit = float(session_result.game_state.total_profit)
-                        stats["total_profit"] += profit
+                    stats.sessions_completed += 1
+                    # One attribute lookup instead of hasattr() plus two more reads
+                    try:
+                        game_state = session_result.game_state
+                    except AttributeError:
+                        pass
+                    else:
+                        profit = float(game_state.total_profit)
+                        stats.total_profit += profit
                         if profit > 0:
-                            stats["profitable_sessions"] += 1
-
-                        # Update running average ROI
-                        roi = session_result.game_state.session_roi
-                        stats["avg_roi"] = (
-                            stats["avg_roi"] * (stats["sessions_completed"] - 1) + roi
-                        ) / stats["sessions_completed"]
-
-                    # Update task description with live stats
-                    profitable_rate = (
-                        stats["profitable_sessions"] / stats["sessions_completed"] * 100
-                        if stats["sessions_completed"] > 0
-                        else 0
-                    )
+                            stats.profitable_sessions += 1
 
-                    new_description = (
-                        f"{description} | "
-                        f"Profit: {stats['total_profit']:.4f} LTC | "
-                        f"Profitable: {profitable_rate:.1f}% | "
-                        f"Avg ROI: {stats['avg_roi']:.2%}"
-                    )
-                    self.progress.update(task_id, description=new_description)
+                        # Running ROI sum: the average is only divided out when shown
+                        stats.total_roi += game_state.session_roi
+
+                    # Update task description with live stats, at most every
+                    # _DESCRIPTION_INTERVAL seconds: faster than that is unreadable
+                    now = monotonic()
+                    if now - last_description_update >= _DESCRIPTION_INTERVAL:
+                        last_description_update = now
+                        update_description()
 
             yield task_id, update_progress
 
+            # Final statistics, in case the last updates were throttled
+            if stats.sessions_completed:
+                update_description()
+
     @contextmanager
     def track_comparison(
         self, strategies: list[str], sessions_per_strategy: int
@@ -109,8 +170,9 @@ class SimulationProgress:
         Yields:
             Tuple of (task_id, update_function)
         """
-        total_sessions = len(strategies) * sessions_per_strategy
-        description = f"Comparing {len(strategies)} strategies"
+        strategy_count = len(strategies)
+        total_sessions = strategy_count * sessions_per_strategy
+        description = f"Comparing {strategy_count} strategies"
 
         with self.progress:
             task_id: Any = self.progress.add_task(description, total=total_sessions)
@@ -127,14 +189,14 @@ class SimulationProgress:
                     current_strategy = strategy_name
                     strategy_index += 1
 
-                self.progress.advance(task_id, advance)
+                    # Update description with current strategy, only when it changes
+                    new_description = (
+                        f"Comparing strategies ({strategy_index}/{strategy_count}) | "
+                        f"Current: {current_strategy}"
+                    )
+                    self.progress.update(task_id, description=new_description)
 
-                # Update description with current strategy
-                new_description = (
-                    f"Comparing strategies ({strategy_index}/{len(strategies)}) | "
-                    f"Current: {current_strategy}"
-                )
-                self.progress.update(task_id, description=new_description)
+                self.progress.advance(task_id, advance)
 
             yield task_id, update_comparison
 
@@ -142,16 +204,9 @@ class SimulationProgress:
 class ProgressManager:
     """Global progress manager for DiceBot operations."""
 
-    _instance: "ProgressManager | None" = None
-    console: Any
-    simulation_progress: Any
-
-    def __new__(cls) -> "ProgressManager":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.console = Console()
-            cls._instance.simulation_progress = SimulationProgress(cls._instance.console)
-        return cls._instance
+    def __init__(self) -> None:
+        self.console: Any = Console()
+        self.simulation_progress: Any = SimulationProgress(self.console)
 
     @property
     def progress(self) -> Any:
@@ -163,20 +218,37 @@ class ProgressManager:
 
     def print_warning(self, message: str) -> None:
         """Print warning message."""
-        self.console.print(f"⚠️  [yellow]Warning:[/yellow] {message}")
+        self.console.print(_MESSAGE_PREFIXES["warning"] + message)
 
     def print_error(self, message: str) -> None:
         """Print error message."""
-        self.console.print(f"❌ [red]Error:[/red] {message}")
+        self.console.print(_MESSAGE_PREFIXES["error"] + message)
 
     def print_success(self, message: str) -> None:
         """Print success message."""
-        self.console.print(f"✅ [green]Success:[/green] {message}")
+        self.console.print(_MESSAGE_PREFIXES["success"] + message)
 
     def print_info(self, message: str) -> None:
         """Print info message."""
-        self.console.print(f"ℹ️  [blue]Info:[/blue] {message}")
+        self.console.print(_MESSAGE_PREFIXES["info"] + message)
+
+    def print_batch(self, entries: list[tuple[str, str]]) -> None:
+        """Print several messages with a single console write.
+
+        Args:
+            entries: (level, message) pairs, level being one of "warning",
+                "error", "success" or "info"
+        """
+        if entries:
+            self.console.print(
+                "\n".join(_MESSAGE_PREFIXES[level] + message for level, message in entries)
+            )
 
 
 # Global progress manager instance
 progress_manager = ProgressManager()
+
+
+def get_progress_manager() -> ProgressManager:
+    """Return the global progress manager."""
+    return progress_manager
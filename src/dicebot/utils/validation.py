@@ -3,27 +3,73 @@ Parameter validation utilities for DiceBot.
 """
 
 import math
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from enum import Enum, auto
 from typing import Any
 
+import numpy as np
+
 from ..core.constants import MAX_BET_LTC, MIN_BET_LTC
+from ._validation_core import (
+    RiskLevel,
+    assess_risk_level,
+    assess_risk_levels,
+    fibonacci_max_bet,
+    martingale_max_bet,
+    safer_bet_suggestion,
+)
 from .progress import progress_manager
 
+# Row layout returned by ParameterValidator.validate_many
+VALIDATION_DTYPE = np.dtype(
+    [
+        ("capital_ratio", np.float64),
+        ("martingale_max_bet", np.float64),
+        ("risk_level", np.int8),
+        ("very_risky", np.bool_),
+        ("exceeds_capital", np.bool_),
+    ]
+)
 
-class ValidationError(Exception):
-    """Custom exception for validation errors."""
+# Decimal thresholds parsed once at import rather than on every validation
+_SMALL_CAPITAL_LTC = Decimal("1")
+_FIBONACCI_MAX_SHARE = Decimal("0.5")  # 50% of capital
 
-    pass
 
+# Messages collected instead of printed inside quiet_validation() (None: print)
+_QUIET: ContextVar[list[tuple[str, str]] | None] = ContextVar("_QUIET", default=None)
 
-class RiskLevel(Enum):
-    """Niveaux de risque pour les configurations."""
 
-    LOW = auto()
-    MEDIUM = auto()
-    HIGH = auto()
-    EXTREME = auto()
+@contextmanager
+def quiet_validation() -> Iterator[list[tuple[str, str]]]:
+    """Silence validation console output, e.g. for batch sweeps.
+
+    Yields:
+        List receiving the (level, message) pairs that would have been printed
+    """
+    collected: list[tuple[str, str]] = []
+    token = _QUIET.set(collected)
+    try:
+        yield collected
+    finally:
+        _QUIET.reset(token)
+
+
+def _report(entries: list[tuple[str, str]]) -> None:
+    """Print validation messages, or collect them inside quiet_validation()."""
+    collected = _QUIET.get()
+    if collected is None:
+        progress_manager.print_batch(entries)
+    else:
+        collected.extend(entries)
+
+
+class ValidationError(Exception):
+    """Custom exception for validation errors."""
+
+    pass
 
 
 class ParameterValidator:
@@ -54,10 +100,15 @@ class ParameterValidator:
             raise ValidationError(f"Capital must be at least {MIN_BET_LTC} LTC")
 
         # Warn for very small capitals
-        if capital_decimal < Decimal("1.0"):
-            progress_manager.print_warning(
-                f"Capital is very small ({capital_decimal} LTC). "
-                "Consider using at least 1 LTC for meaningful simulations."
+        if capital_decimal < _SMALL_CAPITAL_LTC:
+            _report(
+                [
+                    (
+                        "warning",
+                        f"Capital is very small ({capital_decimal} LTC). "
+                        "Consider using at least 1 LTC for meaningful simulations.",
+                    )
+                ]
             )
 
         return capital_decimal
@@ -84,12 +135,16 @@ class ParameterValidator:
 
         strategy_name = strategy_config.get("strategy")
         if not strategy_name:
-            errors.append("Strategy name is required")
+            # Nothing below can make the configuration valid: fail before the
+            # Decimal work
+            raise ValidationError("Validation failed: Strategy name is required")
 
         # Validate base_bet
         base_bet_str = strategy_config.get("base_bet", "0.001")
         try:
-            base_bet = Decimal(str(base_bet_str))
+            base_bet = (
+                base_bet_str if isinstance(base_bet_str, Decimal) else Decimal(str(base_bet_str))
+            )
         except (ValueError, TypeError):
             errors.append(f"Invalid base_bet format: {base_bet_str}")
             return {"errors": errors, "warnings": warnings, "suggestions": suggestions}
@@ -107,11 +162,12 @@ class ParameterValidator:
             errors.append(f"base_bet ({base_bet}) cannot exceed capital ({capital})")
 
         # Capital ratio validation
-        capital_ratio = float(base_bet / capital)
+        # Float ratio: the risk thresholds are coarse, no need for a Decimal division
+        capital_float = float(capital)
+        capital_ratio = float(base_bet) / capital_float
         if capital_ratio > 0.1:  # More than 10% of capital
             warnings.append(f"base_bet is {capital_ratio:.1%} of capital - very risky")
-            safer_bet = capital * Decimal("0.01")  # 1% of capital
-            suggestions.append(f"Consider reducing base_bet to {safer_bet:.6f} LTC (1% of capital)")
+            suggestions.append(safer_bet_suggestion(capital))
 
         # Validate max_losses
         max_losses = strategy_config.get("max_losses", 10)
@@ -121,31 +177,15 @@ class ParameterValidator:
         if max_losses > 50:
             warnings.append(f"max_losses ({max_losses}) is very high - extreme risk")
 
-        # Strategy-specific validation
-        if strategy_name == "martingale":
-            max_possible_bet = ParameterValidator._calculate_martingale_max_bet(
-                base_bet, max_losses, strategy_config.get("multiplier", 2.0)
+        # Strategy-specific validation, dispatched on the strategy name
+        check_strategy = ParameterValidator._STRATEGY_CHECKS.get(strategy_name)
+        if check_strategy is not None:
+            check_strategy(
+                strategy_config, base_bet, max_losses, capital, errors, suggestions, warnings
             )
-            if max_possible_bet > capital:
-                errors.append(
-                    f"Martingale strategy would require {max_possible_bet:.6f} LTC "
-                    f"but capital is only {capital:.6f} LTC"
-                )
-                suggested_max_losses = ParameterValidator._suggest_martingale_max_losses(
-                    base_bet, capital, strategy_config.get("multiplier", 2.0)
-                )
-                suggestions.append(f"Reduce max_losses to {suggested_max_losses} or less")
-
-        elif strategy_name == "fibonacci":
-            max_fib_bet = ParameterValidator._calculate_fibonacci_max_bet(base_bet, max_losses)
-            if max_fib_bet > capital * Decimal("0.5"):  # More than 50% of capital
-                warnings.append(
-                    f"Fibonacci sequence could reach {max_fib_bet:.6f} LTC "
-                    f"({float(max_fib_bet / capital):.1%} of capital)"
-                )
 
         # Risk level assessment
-        risk_level = ParameterValidator.assess_risk_level(strategy_config, capital)
+        risk_level = ParameterValidator.assess_risk_level(strategy_config, capital, capital_float)
 
         if risk_level == RiskLevel.EXTREME:
             warnings.append("Risk level: EXTREME - not recommended")
@@ -163,6 +203,100 @@ class ParameterValidator:
             "risk_level": risk_level,
         }
 
+    @staticmethod
+    def validate_many(
+        strategies: list[str],
+        base_bets: Any,
+        capitals: Any,
+        max_losses: Any,
+        multipliers: Any = 2.0,
+    ) -> Any:
+        """Screen many strategy configurations at once, for parameter sweeps.
+
+        Vectorized float64 counterpart of the capital-ratio, Martingale and
+        risk-level checks of ``validate_strategy_config``; configurations it
+        flags can then be validated one by one for the full messages.
+
+        Args:
+            strategies: Strategy name of each configuration
+            base_bets: Base bet of each configuration
+            capitals: Capital of each configuration (or one for all)
+            max_losses: max_losses of each configuration (or one for all)
+            multipliers: Martingale multiplier of each configuration (or one for all)
+
+        Returns:
+            Structured array with ``VALIDATION_DTYPE`` fields, one row per
+            configuration; ``risk_level`` holds ``RiskLevel`` values
+        """
+        base_bet: Any = np.asarray(base_bets, dtype=np.float64)
+        capital: Any = np.broadcast_to(np.asarray(capitals, dtype=np.float64), base_bet.shape)
+        losses: Any = np.broadcast_to(np.asarray(max_losses, dtype=np.int64), base_bet.shape)
+        multiplier: Any = np.asarray(multipliers, dtype=np.float64)
+        names: Any = np.asarray(strategies, dtype=object)
+
+        # A non-positive capital gives an infinite ratio, hence EXTREME risk
+        capital_ratio: Any = np.divide(
+            base_bet, capital, out=np.full(base_bet.shape, np.inf), where=capital > 0
+        )
+        martingale_max_bet = base_bet * np.power(multiplier, losses)
+
+        results: Any = np.empty(base_bet.shape, dtype=VALIDATION_DTYPE)
+        results["capital_ratio"] = capital_ratio
+        results["martingale_max_bet"] = martingale_max_bet
+        results["risk_level"] = assess_risk_levels(strategies, capital_ratio, losses)
+        results["very_risky"] = capital_ratio > 0.1
+        results["exceeds_capital"] = (names == "martingale") & (martingale_max_bet > capital)
+        return results
+
+    @staticmethod
+    def _check_martingale(
+        strategy_config: dict[str, Any],
+        base_bet: Decimal,
+        max_losses: int,
+        capital: Decimal,
+        errors: list[str],
+        suggestions: list[str],
+        warnings: list[str],
+    ) -> None:
+        """Check that the Martingale progression fits in the capital."""
+        multiplier = strategy_config.get("multiplier", 2.0)
+        max_possible_bet = ParameterValidator._calculate_martingale_max_bet(
+            base_bet, max_losses, multiplier
+        )
+        if max_possible_bet > capital:
+            errors.append(
+                f"Martingale strategy would require {max_possible_bet:.6f} LTC "
+                f"but capital is only {capital:.6f} LTC"
+            )
+            suggested_max_losses = ParameterValidator._suggest_martingale_max_losses(
+                base_bet, capital, multiplier
+            )
+            suggestions.append(f"Reduce max_losses to {suggested_max_losses} or less")
+
+    @staticmethod
+    def _check_fibonacci(
+        strategy_config: dict[str, Any],
+        base_bet: Decimal,
+        max_losses: int,
+        capital: Decimal,
+        errors: list[str],
+        suggestions: list[str],
+        warnings: list[str],
+    ) -> None:
+        """Warn when the Fibonacci progression can reach half of the capital."""
+        max_fib_bet = ParameterValidator._calculate_fibonacci_max_bet(base_bet, max_losses)
+        if max_fib_bet > capital * _FIBONACCI_MAX_SHARE:
+            warnings.append(
+                f"Fibonacci sequence could reach {max_fib_bet:.6f} LTC "
+                f"({float(max_fib_bet / capital):.1%} of capital)"
+            )
+
+    # Strategy-specific checks of validate_strategy_config, by strategy name
+    _STRATEGY_CHECKS: dict[str, Callable[..., None]] = {
+        "martingale": _check_martingale,
+        "fibonacci": _check_fibonacci,
+    }
+
     @staticmethod
     def validate_session_config(session_config: dict[str, Any]) -> dict[str, Any]:
         """Validate session configuration.
@@ -254,7 +388,7 @@ class ParameterValidator:
         base_bet: Decimal, max_losses: int, multiplier: float
     ) -> Decimal:
         """Calculate maximum bet for Martingale strategy."""
-        return base_bet * (Decimal(str(multiplier)) ** max_losses)
+        return martingale_max_bet(base_bet, max_losses, multiplier)
 
     @staticmethod
     def _suggest_martingale_max_losses(
@@ -270,66 +404,24 @@ class ParameterValidator:
     @staticmethod
     def _calculate_fibonacci_max_bet(base_bet: Decimal, max_losses: int) -> Decimal:
         """Calculate maximum bet for Fibonacci strategy."""
-        # Generate fibonacci sequence up to max_losses
-        if max_losses <= 0:
-            return base_bet
-
-        fib = [1, 1]
-        for i in range(2, max_losses):
-            fib.append(fib[i - 1] + fib[i - 2])
-
-        max_multiplier = fib[min(len(fib) - 1, max_losses - 1)]
-        return base_bet * Decimal(str(max_multiplier))
+        return fibonacci_max_bet(base_bet, max_losses)
 
     @staticmethod
-    def assess_risk_level(config: dict[str, Any], capital: Decimal) -> RiskLevel:
+    def assess_risk_level(
+        config: dict[str, Any], capital: Decimal, capital_float: float | None = None
+    ) -> RiskLevel:
         """
         Évalue le niveau de risque d'une configuration.
 
         Args:
             config: Configuration de la stratégie
             capital: Capital total
+            capital_float: float(capital), si l'appelant l'a déjà calculé
 
         Returns:
             Niveau de risque
         """
-        try:
-            strategy_name = config.get("strategy", "flat")
-            base_bet = Decimal(str(config.get("base_bet", "0.001")))
-            max_losses = int(config.get("max_losses", 10))
-
-            if capital <= 0:
-                return RiskLevel.EXTREME
-
-            capital_ratio = float(base_bet / capital)
-
-            # Risque basé sur le ratio capital
-            if capital_ratio > 0.1:  # Plus de 10%
-                return RiskLevel.EXTREME
-            elif capital_ratio > 0.05:  # Plus de 5%
-                return RiskLevel.HIGH
-            elif capital_ratio > 0.02:  # Plus de 2%
-                return RiskLevel.MEDIUM
-
-            # Risque basé sur la stratégie
-            if strategy_name == "martingale":
-                if max_losses > 15:
-                    return RiskLevel.EXTREME
-                elif max_losses > 10:
-                    return RiskLevel.HIGH
-                elif max_losses > 5:
-                    return RiskLevel.MEDIUM
-
-            elif strategy_name in ["fibonacci", "dalembert"]:
-                if max_losses > 20:
-                    return RiskLevel.HIGH
-                elif max_losses > 15:
-                    return RiskLevel.MEDIUM
-
-            return RiskLevel.LOW
-
-        except (ValueError, TypeError):
-            return RiskLevel.EXTREME
+        return assess_risk_level(config, capital, capital_float)
 
 
 def validate_and_suggest(
@@ -358,29 +450,33 @@ def validate_and_suggest(
         if session_config:
             session_results = ParameterValidator.validate_session_config(session_config)
 
-        # Show results
+        # Show results, in one console write
         if show_output:
-            # Show warnings
-            all_warnings = strategy_results["warnings"] + session_results["warnings"]
-            for warning in all_warnings:
-                progress_manager.print_warning(warning)
-
-            # Show suggestions
-            all_suggestions = strategy_results["suggestions"] + session_results["suggestions"]
-            for suggestion in all_suggestions:
-                progress_manager.print_info(f"💡 {suggestion}")
+            # Warnings
+            entries = [
+                ("warning", warning)
+                for warning in strategy_results["warnings"] + session_results["warnings"]
+            ]
+
+            # Suggestions
+            entries.extend(
+                ("info", f"💡 {suggestion}")
+                for suggestion in strategy_results["suggestions"] + session_results["suggestions"]
+            )
 
-            # Show risk level
+            # Risk level
             if "risk_level" in strategy_results:
                 risk_level = strategy_results["risk_level"]
                 if risk_level in [RiskLevel.HIGH, RiskLevel.EXTREME]:
-                    progress_manager.print_warning(f"Risk level: {risk_level.name}")
+                    entries.append(("warning", f"Risk level: {risk_level.name}"))
                 else:
-                    progress_manager.print_info(f"Risk level: {risk_level.name}")
+                    entries.append(("info", f"Risk level: {risk_level.name}"))
+
+            _report(entries)
 
         return True
 
     except ValidationError as e:
         if show_output:
-            progress_manager.print_error(str(e))
+            _report([("error", str(e))])
         return False
@@ -4,19 +4,19 @@ Simplified parameter validation utilities for DiceBot.
 
 import math
 from decimal import Decimal
-from enum import Enum, auto
 from typing import Any
 
 from ..core.constants import MIN_BET_LTC
+from ._validation_core import (
+    RiskLevel,
+    assess_risk_level,
+    decimal_from_float,
+    fibonacci,
+    safer_bet_suggestion,
+)
 
-
-class RiskLevel(Enum):
-    """Niveaux de risque pour les configurations."""
-
-    LOW = auto()
-    MEDIUM = auto()
-    HIGH = auto()
-    EXTREME = auto()
+# Constantes Decimal analysées une seule fois à l'import
+_MARTINGALE_MAX_SHARE = Decimal("0.5")  # 50% du capital
 
 
 class ParameterValidator:
@@ -46,13 +46,13 @@ class ParameterValidator:
                 warnings["base_bet"] = "base_bet must be positive"
                 return warnings
 
-            capital_ratio = float(base_bet / capital) if capital > 0 else 1.0
+            capital_float = float(capital)
+            capital_ratio = float(base_bet) / capital_float if capital > 0 else 1.0
 
             if capital_ratio > 0.1:  # Plus de 10% du capital
-                safer_bet = capital * Decimal("0.01")  # 1% du capital
                 warnings["base_bet"] = (
                     f"base_bet is {capital_ratio:.1%} of capital - very risky. "
-                    f"Consider reducing base_bet to {safer_bet:.6f} LTC (1% of capital)"
+                    f"{safer_bet_suggestion(capital)}"
                 )
             elif capital_ratio > 0.05:  # Plus de 5% du capital
                 warnings["base_bet"] = f"base_bet is {capital_ratio:.1%} of capital - risky"
@@ -75,7 +75,7 @@ class ParameterValidator:
                     )
 
             # Assessment du risque global
-            risk_level = ParameterValidator.assess_risk_level(config, capital)
+            risk_level = ParameterValidator.assess_risk_level(config, capital, capital_float)
             if risk_level == RiskLevel.EXTREME:
                 warnings["risk"] = "Risk level: EXTREME - not recommended"
             elif risk_level == RiskLevel.HIGH:
@@ -87,54 +87,21 @@ class ParameterValidator:
         return warnings
 
     @staticmethod
-    def assess_risk_level(config: dict[str, Any], capital: Decimal) -> RiskLevel:
+    def assess_risk_level(
+        config: dict[str, Any], capital: Decimal, capital_float: float | None = None
+    ) -> RiskLevel:
         """
         Évalue le niveau de risque d'une configuration.
 
         Args:
             config: Configuration de la stratégie
             capital: Capital total
+            capital_float: float(capital), si l'appelant l'a déjà calculé
 
         Returns:
             Niveau de risque
         """
-        try:
-            strategy_name = config.get("strategy", "flat")
-            base_bet = Decimal(str(config.get("base_bet", "0.001")))
-            max_losses = int(config.get("max_losses", 10))
-
-            if capital <= 0:
-                return RiskLevel.EXTREME
-
-            capital_ratio = float(base_bet / capital)
-
-            # Risque basé sur le ratio capital
-            if capital_ratio > 0.1:  # Plus de 10%
-                return RiskLevel.EXTREME
-            elif capital_ratio > 0.05:  # Plus de 5%
-                return RiskLevel.HIGH
-            elif capital_ratio > 0.02:  # Plus de 2%
-                return RiskLevel.MEDIUM
-
-            # Risque basé sur la stratégie
-            if strategy_name == "martingale":
-                if max_losses > 15:
-                    return RiskLevel.EXTREME
-                elif max_losses > 10:
-                    return RiskLevel.HIGH
-                elif max_losses > 5:
-                    return RiskLevel.MEDIUM
-
-            elif strategy_name in ["fibonacci", "dalembert"]:
-                if max_losses > 20:
-                    return RiskLevel.HIGH
-                elif max_losses > 15:
-                    return RiskLevel.MEDIUM
-
-            return RiskLevel.LOW
-
-        except (ValueError, TypeError):
-            return RiskLevel.EXTREME
+        return assess_risk_level(config, capital, capital_float)
 
     @staticmethod
     def calculate_martingale_max_safe_losses(capital: Decimal, base_bet: Decimal) -> int:
@@ -152,18 +119,17 @@ class ParameterValidator:
             return 0
 
         # Calculer pour que le total des mises ne dépasse pas 50% du capital
-        max_total = capital * Decimal("0.5")
+        max_total = capital * _MARTINGALE_MAX_SHARE
 
-        max_losses = 0
-        total_risk = Decimal("0")
+        # Mises cumulées après n pertes : base_bet * (2**n - 1), d'où
+        # n = floor(log2(max_total / base_bet + 1)), limité à 20
+        max_losses = min(int(math.log2(float(max_total / base_bet) + 1.0)), 20)
 
-        while total_risk + base_bet * (2**max_losses) <= max_total:
-            total_risk += base_bet * (2**max_losses)
+        # L'arrondi flottant peut décaler n d'une unité à la frontière exacte
+        if max_losses < 20 and base_bet * (2 ** (max_losses + 1) - 1) <= max_total:
             max_losses += 1
-
-            # Limiter à un maximum raisonnable
-            if max_losses >= 20:
-                break
+        elif max_losses > 0 and base_bet * (2**max_losses - 1) > max_total:
+            max_losses -= 1
 
         return max(1, max_losses - 1)
 
@@ -182,15 +148,8 @@ class ParameterValidator:
         if max_losses <= 0:
             return base_bet
 
-        # Séquence de Fibonacci limitée à max_losses
-        fib_sequence = [1, 1]
-        for i in range(2, max_losses + 1):
-            fib_sequence.append(fib_sequence[i - 1] + fib_sequence[i - 2])
-
-        # Somme de toutes les mises possibles
-        total_requirement = sum(fib_sequence[:max_losses]) * base_bet
-
-        return total_requirement
+        # Somme de toutes les mises possibles : F(1) + ... + F(n) = F(n + 2) - 1
+        return (fibonacci(max_losses + 2) - 1) * base_bet
 
     @staticmethod
     def suggest_safer_base_bet(capital: Decimal, percentage: float = 0.01) -> Decimal:
@@ -207,7 +166,7 @@ class ParameterValidator:
         if capital <= 0:
             return MIN_BET_LTC
 
-        suggested = capital * Decimal(str(percentage))
+        suggested = capital * decimal_from_float(percentage)
 
         # Respecter les limites minimales
         return max(suggested, MIN_BET_LTC)
@@ -0,0 +1,17 @@
+"""Fixtures partagées par les tests du cœur."""
+
+import pytest
+
+from dicebot.core import DiceGame
+
+
+@pytest.fixture(scope="module")
+def game_legacy() -> DiceGame:
+    """Jeu legacy partagé par les tests d'un module qui ne font que des calculs."""
+    return DiceGame(use_provably_fair=False)
+
+
+@pytest.fixture
+def game_seeded() -> DiceGame:
+    """Jeu legacy neuf avec un seed fixe, pour des rolls reproductibles."""
+    return DiceGame(use_provably_fair=False, seed=42)
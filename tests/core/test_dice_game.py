@@ -1,37 +1,33 @@
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
-from dicebot.core import BetResult, DiceGame, GameConfig
+from dicebot.core import BetResult, BetResultBatch, BetType, DiceGame, GameConfig
 
 
 class TestDiceGame:
-    def test_initialization(self) -> None:
-        game = DiceGame(use_provably_fair=False)  # Mode legacy pour tests
-        assert game.house_edge == 0.01
-        assert isinstance(game.config, GameConfig)
-
-    def test_calculate_win_chance(self) -> None:
-        game = DiceGame(use_provably_fair=False)
+    def test_initialization(self, game_legacy: DiceGame) -> None:
+        assert game_legacy.house_edge == 0.01
+        assert isinstance(game_legacy.config, GameConfig)
 
+    def test_calculate_win_chance(self, game_legacy: DiceGame) -> None:
         # Test 2x multiplier (utiliser méthode legacy)
-        chance = game.calculate_win_chance_from_multiplier(2.0)
+        chance = game_legacy.calculate_win_chance_from_multiplier(2.0)
         expected = 50.0 * (1 - 0.01)  # 49.5%
         assert abs(chance - expected) < 0.001
 
         # Test 10x multiplier
-        chance = game.calculate_win_chance_from_multiplier(10.0)
+        chance = game_legacy.calculate_win_chance_from_multiplier(10.0)
         expected = 10.0 * (1 - 0.01)  # 9.9%
         assert abs(chance - expected) < 0.001
 
-    def test_invalid_multiplier(self) -> None:
-        game = DiceGame(use_provably_fair=False)
-
+    def test_invalid_multiplier(self, game_legacy: DiceGame) -> None:
         with pytest.raises(ValueError):
-            game.calculate_win_chance_from_multiplier(0.5)  # Too low
+            game_legacy.calculate_win_chance_from_multiplier(0.5)  # Too low
 
         with pytest.raises(ValueError):
-            game.calculate_win_chance_from_multiplier(100.0)  # Too high
+            game_legacy.calculate_win_chance_from_multiplier(100.0)  # Too high
 
     def test_roll_win(self) -> None:
         game = DiceGame(seed=42)  # Fixed seed for reproducibility
@@ -46,43 +42,162 @@ class TestDiceGame:
         else:
             assert result.payout == Decimal("0")
 
-    def test_bet_limits(self) -> None:
-        game = DiceGame(use_provably_fair=False)
-
+    def test_bet_limits(self, game_legacy: DiceGame) -> None:
         # Test minimum bet
         with pytest.raises(ValueError, match="Minimum bet"):
-            game.roll(Decimal("0.00001"), 2.0)
+            game_legacy.roll(Decimal("0.00001"), 2.0)
 
         # Test maximum bet
         with pytest.raises(ValueError, match="Maximum bet"):
-            game.roll(Decimal("10000"), 2.0)
-
-    def test_expected_value(self) -> None:
-        game = DiceGame(use_provably_fair=False)
+            game_legacy.roll(Decimal("10000"), 2.0)
 
+    def test_expected_value(self, game_legacy: DiceGame) -> None:
         # EV should be negative due to house edge
-        ev = game.expected_value_legacy(Decimal("1"), 2.0)
+        ev = game_legacy.expected_value_legacy(Decimal("1"), 2.0)
         assert ev < 0
 
         # With constant house edge, all bets have same EV (-1% of bet)
-        ev_2x = game.expected_value_legacy(Decimal("1"), 2.0)
-        ev_10x = game.expected_value_legacy(Decimal("1"), 10.0)
+        ev_2x = game_legacy.expected_value_legacy(Decimal("1"), 2.0)
+        ev_10x = game_legacy.expected_value_legacy(Decimal("1"), 10.0)
         # Both should be -0.01 (1% of bet)
         assert abs(ev_2x - Decimal("-0.01")) < Decimal("0.001")
         assert abs(ev_10x - Decimal("-0.01")) < Decimal("0.001")
 
-    def test_kelly_criterion(self) -> None:
-        game = DiceGame(use_provably_fair=False)
-
+    @pytest.mark.parametrize(
+        ("amount", "target", "bet_type", "expected"),
+        [
+            ("1", 50.0, BetType.UNDER, "-0.01"),
+            ("1", 75.0, BetType.OVER, "-0.01"),
+            ("0.001", 25.0, BetType.OVER, "-0.00001"),
+            ("0.00015", 90.0, BetType.UNDER, "-0.0000015"),
+        ],
+    )
+    def test_expected_value_exact(
+        self, game_legacy: DiceGame, amount: str, target: float, bet_type: BetType, expected: str
+    ) -> None:
+        """L'EV ne porte pas le bruit binaire du calcul float (ex. -0.010000000000000009)."""
+        ev = game_legacy.expected_value(Decimal(amount), target, bet_type)
+
+        assert ev == Decimal(expected)
+        assert str(ev) == expected
+
+    def test_expected_value_legacy_exact(self, game_legacy: DiceGame) -> None:
+        """L'EV legacy est arrondie de la même façon."""
+        assert str(game_legacy.expected_value_legacy(Decimal("1"), 2.0)) == "-0.01"
+
+    def test_kelly_criterion(self, game_legacy: DiceGame, monkeypatch: pytest.MonkeyPatch) -> None:
         bankroll = Decimal("100")
 
         # Kelly should return 0 for negative EV bets
-        kelly_bet = game.kelly_criterion_legacy(bankroll, 2.0)
+        kelly_bet = game_legacy.kelly_criterion_legacy(bankroll, 2.0)
         assert kelly_bet == Decimal("0")
 
         # If we had positive EV (impossible with house edge), kelly would be positive
         # This is just to test the math works
-        game.house_edge = -0.01  # Negative house edge for testing
-        kelly_bet = game.kelly_criterion_legacy(bankroll, 2.0)
+        # Negative house edge for testing, restored by monkeypatch
+        monkeypatch.setattr(game_legacy, "house_edge", -0.01)
+        kelly_bet = game_legacy.kelly_criterion_legacy(bankroll, 2.0)
         assert kelly_bet > Decimal("0")
         assert kelly_bet < bankroll * Decimal("0.1")  # Safety cap at 10%
+
+
+class TestRollBatch:
+    """Tests du lancer vectorisé."""
+
+    def test_scalar_arguments_with_size(self, game_seeded: DiceGame) -> None:
+        """Des arguments scalaires sont diffusés sur n paris."""
+        batch = game_seeded.roll_batch(Decimal("1"), 50.0, BetType.UNDER, n=1000)
+
+        assert isinstance(batch, BetResultBatch)
+        assert len(batch) == 1000
+        assert ((batch.rolls >= 0) & (batch.rolls < 100)).all()
+        np.testing.assert_array_equal(batch.won, batch.rolls < 50.0)
+        np.testing.assert_array_equal(batch.payouts, np.where(batch.won, 2.0, 0.0))
+        np.testing.assert_array_equal(batch.profits, batch.payouts - 1.0)
+
+    def test_mixed_bet_types(self) -> None:
+        """Chaque pari suit sa propre condition UNDER/OVER."""
+        game = DiceGame(use_provably_fair=False, seed=7)
+        targets = np.array([25.0, 25.0, 90.0, 10.0] * 50)
+        bet_types = np.array([BetType.UNDER, BetType.OVER] * 100)
+
+        batch = game.roll_batch(1.0, targets, bet_types)
+
+        under = bet_types == BetType.UNDER
+        expected = np.where(under, batch.rolls < targets, batch.rolls > targets)
+        np.testing.assert_array_equal(batch.won, expected)
+        for i in range(4):
+            multiplier = game.multiplier_from_target(targets[i], bet_types[i])
+            assert batch.multipliers[i] == pytest.approx(multiplier)
+
+    def test_seed_reproducible(self) -> None:
+        """Le même seed produit le même lot."""
+        first = DiceGame(use_provably_fair=False, seed=3).roll_batch(1.0, 50.0, n=100)
+        second = DiceGame(use_provably_fair=False, seed=3).roll_batch(1.0, 50.0, n=100)
+
+        np.testing.assert_array_equal(first.rolls, second.rolls)
+
+    def test_win_rate(self) -> None:
+        """Le taux de victoire converge vers la probabilité brute."""
+        game = DiceGame(use_provably_fair=False, seed=1)
+
+        batch = game.roll_batch(1.0, 25.0, BetType.UNDER, n=100_000)
+
+        assert abs(batch.won.mean() - 0.25) < 0.01
+
+    def test_provably_fair_rolls(self) -> None:
+        """En mode provably fair, chaque roll consomme un nonce."""
+        game = DiceGame(server_seed="server", client_seed="client")
+
+        batch = game.roll_batch(1.0, 50.0, n=5)
+
+        assert game.provably_fair is not None
+        assert game.provably_fair.current_seeds.nonce == 5
+        assert ((batch.rolls >= 0) & (batch.rolls <= 100)).all()
+
+    def test_limits(self, game_legacy: DiceGame) -> None:
+        """Les limites de mise et de target sont vérifiées sur tout le lot."""
+        with pytest.raises(ValueError, match="Minimum bet"):
+            game_legacy.roll_batch([1.0, 0.00001], 50.0)
+
+        with pytest.raises(ValueError, match="Maximum bet"):
+            game_legacy.roll_batch([1.0, 10000.0], 50.0)
+
+        with pytest.raises(ValueError, match="Target"):
+            game_legacy.roll_batch(1.0, [50.0, 100.0])
+
+
+class TestRollScalar:
+    """Tests du lancer sans BetResult."""
+
+    def test_matches_roll(self) -> None:
+        """Même seed, même suite de rolls et mêmes payouts que roll."""
+        scalar_game = DiceGame(use_provably_fair=False, seed=5)
+        full_game = DiceGame(use_provably_fair=False, seed=5)
+
+        for target, bet_type in [(50.0, BetType.UNDER), (30.0, BetType.OVER)] * 10:
+            roll, won, payout = scalar_game.roll_scalar(Decimal("1"), target, bet_type)
+            result = full_game.roll(Decimal("1"), target, bet_type)
+
+            assert (roll, won, payout) == (result.roll, result.won, result.payout)
+
+    def test_provably_fair_matches_roll(self) -> None:
+        """En mode provably fair, le roll suit la même séquence de nonces."""
+        scalar_game = DiceGame(server_seed="server", client_seed="client")
+        full_game = DiceGame(server_seed="server", client_seed="client")
+
+        roll, won, payout = scalar_game.roll_scalar(Decimal("1"), 50.0)
+        result = full_game.roll(Decimal("1"), 50.0)
+
+        assert (roll, won, payout) == (result.roll, result.won, result.payout)
+
+    def test_limits(self, game_legacy: DiceGame) -> None:
+        """Les limites sont les mêmes que pour roll."""
+        with pytest.raises(ValueError, match="Minimum bet"):
+            game_legacy.roll_scalar(Decimal("0.00001"), 50.0)
+
+        with pytest.raises(ValueError, match="Maximum bet"):
+            game_legacy.roll_scalar(Decimal("10000"), 50.0)
+
+        with pytest.raises(ValueError, match="Target"):
+            game_legacy.roll_scalar(Decimal("1"), 100.0)
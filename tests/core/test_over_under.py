@@ -11,12 +11,10 @@ from dicebot.strategies import StrategyConfig, StrategyFactory
 class TestDiceGameOverUnder:
     """Test le support OVER/UNDER dans DiceGame."""
 
-    def test_roll_under(self) -> None:
+    def test_roll_under(self, game_seeded: DiceGame) -> None:
         """Test d'un pari UNDER."""
-        game = DiceGame(use_provably_fair=False, seed=42)
-
         # Pari UNDER avec target 50
-        result = game.roll(Decimal("1"), 50.0, BetType.UNDER)
+        result = game_seeded.roll(Decimal("1"), 50.0, BetType.UNDER)
 
         assert result.bet_type == BetType.UNDER
         assert result.target == 50.0
@@ -30,12 +28,10 @@ class TestDiceGameOverUnder:
             assert not result.won
             assert result.payout == Decimal("0")
 
-    def test_roll_over(self) -> None:
+    def test_roll_over(self, game_seeded: DiceGame) -> None:
         """Test d'un pari OVER."""
-        game = DiceGame(use_provably_fair=False, seed=42)
-
         # Pari OVER avec target 50
-        result = game.roll(Decimal("1"), 50.0, BetType.OVER)
+        result = game_seeded.roll(Decimal("1"), 50.0, BetType.OVER)
 
         assert result.bet_type == BetType.OVER
         assert result.target == 50.0
@@ -48,72 +44,57 @@ class TestDiceGameOverUnder:
             assert not result.won
             assert result.payout == Decimal("0")
 
-    def test_win_chance_calculation(self) -> None:
+    @pytest.mark.parametrize(
+        ("target", "bet_type", "expected"),
+        [
+            (50.0, BetType.UNDER, 50.0 * (1 - 0.01)),  # 49.5% avec house edge 1%
+            (50.0, BetType.OVER, 50.0 * (1 - 0.01)),  # 49.5%
+            (25.0, BetType.UNDER, 25.0 * (1 - 0.01)),  # 24.75%
+            (75.0, BetType.OVER, 25.0 * (1 - 0.01)),  # 24.75%
+        ],
+    )
+    def test_win_chance_calculation(
+        self, game_legacy: DiceGame, target: float, bet_type: BetType, expected: float
+    ) -> None:
         """Test du calcul des probabilités OVER/UNDER."""
-        game = DiceGame(use_provably_fair=False)
-
-        # UNDER 50 devrait avoir ~49.5% (avec house edge 1%)
-        under_chance = game.calculate_win_chance(50.0, BetType.UNDER)
-        expected_under = 50.0 * (1 - 0.01)  # 49.5%
-        assert abs(under_chance - expected_under) < 0.001
-
-        # OVER 50 devrait avoir ~49.5% (avec house edge 1%)
-        over_chance = game.calculate_win_chance(50.0, BetType.OVER)
-        expected_over = 50.0 * (1 - 0.01)  # 49.5%
-        assert abs(over_chance - expected_over) < 0.001
-
-        # UNDER 25 devrait avoir ~24.75%
-        under_25_chance = game.calculate_win_chance(25.0, BetType.UNDER)
-        expected_under_25 = 25.0 * (1 - 0.01)  # 24.75%
-        assert abs(under_25_chance - expected_under_25) < 0.001
-
-        # OVER 75 devrait avoir ~24.75%
-        over_75_chance = game.calculate_win_chance(75.0, BetType.OVER)
-        expected_over_75 = 25.0 * (1 - 0.01)  # 24.75%
-        assert abs(over_75_chance - expected_over_75) < 0.001
+        assert abs(game_legacy.calculate_win_chance(target, bet_type) - expected) < 0.001
 
-    def test_multiplier_conversion(self) -> None:
+    def test_multiplier_conversion(self, game_legacy: DiceGame) -> None:
         """Test de la conversion target <-> multiplier."""
-        game = DiceGame(use_provably_fair=False)
-
         # Test UNDER - pour multiplier 2x, target devrait être 50
-        target_from_2x = game.target_from_multiplier(2.0, BetType.UNDER)
+        target_from_2x = game_legacy.target_from_multiplier(2.0, BetType.UNDER)
         assert abs(target_from_2x - 50.0) < 0.1  # Devrait être 50.0
 
         # Test OVER - pour multiplier 2x, target devrait être 50
-        target_from_2x_over = game.target_from_multiplier(2.0, BetType.OVER)
+        target_from_2x_over = game_legacy.target_from_multiplier(2.0, BetType.OVER)
         assert abs(target_from_2x_over - 50.0) < 0.1  # Devrait être 50.0
 
         # Test conversion inverse - UNDER 50 avec house edge
-        multiplier_from_50 = game.multiplier_from_target(50.0, BetType.UNDER)
+        multiplier_from_50 = game_legacy.multiplier_from_target(50.0, BetType.UNDER)
         # Avec house edge 1%, win_chance = 50 * 0.99 = 49.5%, donc multiplier ≈ 100/49.5 ≈ 2.02
         assert abs(multiplier_from_50 - 2.02) < 0.1
 
-    def test_edge_cases(self) -> None:
+    def test_edge_cases(self, game_legacy: DiceGame) -> None:
         """Test des cas limites."""
-        game = DiceGame(use_provably_fair=False)
-
         # Target très bas
-        result_low = game.roll(Decimal("1"), 1.0, BetType.UNDER)
+        result_low = game_legacy.roll(Decimal("1"), 1.0, BetType.UNDER)
         assert result_low.target == 1.0
 
         # Target très haut
-        result_high = game.roll(Decimal("1"), 99.0, BetType.OVER)
+        result_high = game_legacy.roll(Decimal("1"), 99.0, BetType.OVER)
         assert result_high.target == 99.0
 
         # Target invalide
         with pytest.raises(ValueError):
-            game.roll(Decimal("1"), 0.0, BetType.UNDER)
+            game_legacy.roll(Decimal("1"), 0.0, BetType.UNDER)
 
         with pytest.raises(ValueError):
-            game.roll(Decimal("1"), 100.0, BetType.UNDER)
+            game_legacy.roll(Decimal("1"), 100.0, BetType.UNDER)
 
-    def test_legacy_compatibility(self) -> None:
+    def test_legacy_compatibility(self, game_seeded: DiceGame) -> None:
         """Test que l'ancienne interface fonctionne encore."""
-        game = DiceGame(use_provably_fair=False, seed=42)
-
         # Utiliser la méthode legacy
-        result = game.roll_legacy(Decimal("1"), 2.0)
+        result = game_seeded.roll_legacy(Decimal("1"), 2.0)
 
         assert result.bet_type == BetType.UNDER
         assert (
@@ -122,7 +103,7 @@ class TestDiceGameOverUnder:
         assert result.target > 0
 
         # Expected value legacy
-        ev = game.expected_value_legacy(Decimal("1"), 2.0)
+        ev = game_seeded.expected_value_legacy(Decimal("1"), 2.0)
         assert ev < 0  # Négatif à cause du house edge
 
 
@@ -232,50 +213,37 @@ class TestStrategyOverUnder:
 class TestOverUnderMath:
     """Test des calculs mathématiques OVER/UNDER."""
 
-    def test_probability_symmetry(self) -> None:
+    def test_probability_symmetry(self, game_legacy: DiceGame) -> None:
         """Test que OVER et UNDER sont symétriques."""
-        game = DiceGame(use_provably_fair=False)
-
         # UNDER 30 et OVER 70 devraient avoir la même probabilité
-        under_30 = game.calculate_win_chance(30.0, BetType.UNDER)
-        over_70 = game.calculate_win_chance(70.0, BetType.OVER)
+        under_30 = game_legacy.calculate_win_chance(30.0, BetType.UNDER)
+        over_70 = game_legacy.calculate_win_chance(70.0, BetType.OVER)
 
         assert abs(under_30 - over_70) < 0.001
 
         # UNDER 25 et OVER 75 devraient avoir la même probabilité
-        under_25 = game.calculate_win_chance(25.0, BetType.UNDER)
-        over_75 = game.calculate_win_chance(75.0, BetType.OVER)
+        under_25 = game_legacy.calculate_win_chance(25.0, BetType.UNDER)
+        over_75 = game_legacy.calculate_win_chance(75.0, BetType.OVER)
 
         assert abs(under_25 - over_75) < 0.001
 
-    def test_total_probability(self) -> None:
+    def test_total_probability(self, game_legacy: DiceGame) -> None:
         """Test que UNDER + OVER pour un même point ≈ 99% (avec house edge)."""
-        game = DiceGame(use_provably_fair=False)
-
         # Pour target 50
-        under_50 = game.calculate_win_chance(50.0, BetType.UNDER)
-        over_50 = game.calculate_win_chance(50.0, BetType.OVER)
+        under_50 = game_legacy.calculate_win_chance(50.0, BetType.UNDER)
+        over_50 = game_legacy.calculate_win_chance(50.0, BetType.OVER)
 
         # Total devrait être ≈ 99% (100% - 1% house edge)
         total = under_50 + over_50
         assert abs(total - 99.0) < 0.1
 
-    def test_expected_value_negative(self) -> None:
+    @pytest.mark.parametrize("bet_type", [BetType.UNDER, BetType.OVER])
+    @pytest.mark.parametrize("target", [25.0, 50.0, 75.0])
+    def test_expected_value_negative(
+        self, game_legacy: DiceGame, target: float, bet_type: BetType
+    ) -> None:
         """Test que toutes les EV sont négatives (house edge)."""
-        game = DiceGame(use_provably_fair=False)
-
-        # Test différentes configurations
-        test_cases = [
-            (25.0, BetType.UNDER),
-            (50.0, BetType.UNDER),
-            (75.0, BetType.UNDER),
-            (25.0, BetType.OVER),
-            (50.0, BetType.OVER),
-            (75.0, BetType.OVER),
-        ]
-
-        for target, bet_type in test_cases:
-            ev = game.expected_value(Decimal("1"), target, bet_type)
-            assert ev < 0, f"EV should be negative for {target} {bet_type.value}"
-            # EV devrait être environ -1% du pari
-            assert abs(ev + Decimal("0.01")) < Decimal("0.005")
+        ev = game_legacy.expected_value(Decimal("1"), target, bet_type)
+        assert ev < 0, f"EV should be negative for {target} {bet_type.value}"
+        # EV devrait être environ -1% du pari
+        assert abs(ev + Decimal("0.01")) < Decimal("0.005")
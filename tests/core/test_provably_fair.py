@@ -8,7 +8,12 @@ from typing import Any
 import pytest
 
 from dicebot.core.dice_game import DiceGame
-from dicebot.core.provably_fair import BitslerVerifier, ProvablyFairGenerator
+from dicebot.core.provably_fair import (
+    BitslerVerifier,
+    ProvablyFairGenerator,
+    _compute_bitsler_roll,
+    _extract_bitsler_number,
+)
 
 
 class TestProvablyFairGenerator:
@@ -88,6 +93,35 @@ class TestProvablyFairGenerator:
 
         assert results1 == results2
 
+    def test_generate_dice_results_batch(self) -> None:
+        """Test qu'un lot reproduit la séquence des appels unitaires."""
+        single: ProvablyFairGenerator = ProvablyFairGenerator("server123", "client456")
+        batch: ProvablyFairGenerator = ProvablyFairGenerator("server123", "client456")
+        single.generate_dice_result()
+        batch.generate_dice_result()
+
+        expected: list[float] = [single.generate_dice_result() for _ in range(20)]
+
+        assert batch.generate_dice_results(20) == expected
+        assert batch.current_seeds.nonce == single.current_seeds.nonce == 21
+
+    def test_results_follow_server_seed_changes(self) -> None:
+        """Test que les états HMAC mis en cache suivent la rotation du server seed."""
+
+        def reference(server_seed: str, client_seed: str, nonce: int) -> float:
+            message: str = f"{client_seed},{nonce}"
+            seed_hash: str = hmac.new(
+                server_seed.encode(), message.encode(), hashlib.sha512
+            ).hexdigest()
+            return (generator._extract_valid_number(seed_hash) % 10000) / 100
+
+        generator: ProvablyFairGenerator = ProvablyFairGenerator("server123", "client456")
+        assert generator.generate_dice_result() == reference("server123", "client456", 0)
+
+        generator.rotate_seeds()
+        new_server: str = generator.current_seeds.server_seed
+        assert generator.generate_dice_result() == reference(new_server, "client456", 0)
+
     def test_rotate_seeds(self) -> None:
         """Test la rotation des seeds."""
         generator: ProvablyFairGenerator = ProvablyFairGenerator("server123", "client456")
@@ -164,6 +198,25 @@ class TestProvablyFairGenerator:
         assert abs(actual_result - expected_result) < 0.005
 
 
+class TestExtractBitslerNumber:
+    """Test l'extraction du nombre Bitsler depuis le digest binaire."""
+
+    @pytest.mark.parametrize(
+        "digest",
+        [
+            hashlib.sha512(b"premier chunk accepte").digest(),
+            bytes.fromhex("fffff" + "f423f" + "0" * 118),  # deuxième chunk = 999999
+            bytes.fromhex("f4240" * 3 + "12345" + "0" * 108),  # 1000000 rejeté 3 fois
+            bytes.fromhex("f" * 125 + "000"),  # aucun chunk valide : fallback
+        ],
+    )
+    def test_matches_hex_extraction(self, digest: bytes) -> None:
+        """Test que l'extraction binaire donne le même nombre que la version hexadécimale."""
+        generator: ProvablyFairGenerator = ProvablyFairGenerator()
+
+        assert _extract_bitsler_number(digest) == generator._extract_valid_number(digest.hex())
+
+
 class TestBitslerVerifier:
     """Test le vérificateur Bitsler."""
 
@@ -200,6 +253,18 @@ class TestBitslerVerifier:
         # Très improbable que ce soit valide
         assert not verification["is_valid"]
 
+    def test_repeated_verification_uses_cache(self) -> None:
+        """Test qu'une re-vérification réutilise le calcul mis en cache."""
+        first: dict[str, Any] = BitslerVerifier.verify_dice_result("cache_srv", "cache_cli", 7, 1.0)
+        hits: int = _compute_bitsler_roll.cache_info().hits
+
+        second: dict[str, Any] = BitslerVerifier.verify_dice_result(
+            "cache_srv", "cache_cli", 7, 1.0
+        )
+
+        assert second == first
+        assert _compute_bitsler_roll.cache_info().hits == hits + 1
+
     def test_batch_verify(self) -> None:
         """Test la vérification en batch."""
         server_seed: str = "batch_server"
@@ -238,6 +303,39 @@ class TestBitslerVerifier:
         assert batch_result["invalid_results"] == 1
         assert batch_result["success_rate"] == 5 / 6
 
+    def test_batch_verify_mixed_seeds(self) -> None:
+        """Test le batch avec plusieurs paires de seeds entremêlées."""
+        generators: list[ProvablyFairGenerator] = [
+            ProvablyFairGenerator("server_a", "client_a"),
+            ProvablyFairGenerator("server_b", "client_b"),
+        ]
+        results: list[dict[str, Any]] = []
+        for nonce in range(4):
+            for generator in generators:
+                results.append(
+                    {
+                        "server_seed": generator.current_seeds.server_seed,
+                        "client_seed": generator.current_seeds.client_seed,
+                        "nonce": nonce,
+                        "result": generator.generate_dice_result(),
+                    }
+                )
+        results[3]["result"] = (results[3]["result"] + 50) % 100  # Falsifié
+
+        batch_result: dict[str, Any] = BitslerVerifier.batch_verify(results)
+
+        assert batch_result["valid_results"] == 7
+        assert batch_result["invalid_results"] == 1
+        assert batch_result["invalid_details"][0]["index"] == 3
+        assert not batch_result["invalid_details"][0]["verification"]["is_valid"]
+
+    def test_batch_verify_empty(self) -> None:
+        """Test le batch sur une liste vide."""
+        batch_result: dict[str, Any] = BitslerVerifier.batch_verify([])
+
+        assert batch_result["total_results"] == 0
+        assert batch_result["success_rate"] == 0
+
 
 class TestDiceGameProvablyFair:
     """Test l'intégration provably fair dans DiceGame."""
@@ -7,7 +7,8 @@ doit être utilisé séquentiellement et ne peut pas être skippé.
 
 from decimal import Decimal
 from typing import Any
-from unittest.mock import Mock, patch
+
+import pytest
 
 from dicebot.core.dice_game import DiceGame
 from dicebot.core.models import BetDecision, BetType, GameState
@@ -17,6 +18,26 @@ from dicebot.strategies.martingale import MartingaleStrategy
 from dicebot.strategies.parking import ParkingConfig, ParkingStrategy
 
 
+class _StubStrategy:
+    """Stratégie minimale qui rejoue une séquence de décisions."""
+
+    def __init__(self, decisions: list[BetDecision]) -> None:
+        self._decisions = iter(decisions)
+        self.results_count = 0
+
+    def get_name(self) -> str:
+        return "stub"
+
+    def decide_bet(self, game_state: GameState) -> BetDecision:
+        return next(self._decisions)
+
+    def update_after_result(self, result: Any) -> None:
+        self.results_count += 1
+
+    def reset_state(self) -> None:
+        pass
+
+
 class TestProvablyFairConstraints:
     """Test les contraintes du système Provably Fair."""
 
@@ -153,18 +174,13 @@ class TestProvablyFairConstraints:
         assert game_state.parking_bets_count == 1
         assert game_state.parking_losses == decision.amount
 
-    def test_simulation_engine_handles_actions(self) -> None:
+    def test_simulation_engine_handles_actions(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Vérifie que SimulationEngine gère correctement les actions."""
         from dicebot.money.vault import VaultConfig
 
         vault_config: VaultConfig = VaultConfig(total_capital=Decimal("100"))
         engine: SimulationEngine = SimulationEngine(vault_config)
 
-        # Mock strategy qui demande des actions
-        mock_strategy: Mock = Mock()
-        mock_strategy.reset_state = Mock()
-        mock_strategy.update_after_result = Mock()
-
         # Séquence d'actions
         actions: list[BetDecision] = [
             BetDecision(
@@ -178,19 +194,21 @@ class TestProvablyFairConstraints:
             BetDecision(amount=Decimal("0.001"), multiplier=2.0, skip=False, action=None),
         ]
 
-        mock_strategy.decide_bet = Mock(side_effect=actions)
+        strategy: _StubStrategy = _StubStrategy(actions)
 
         # Run session (limité)
         session_config: dict[str, Any] = {"max_bets": 1}
-        with patch.object(engine.dice_game, "rotate_seeds") as mock_rotate:
-            session = engine.run_session(mock_strategy, session_config)
+        rotate_calls: list[None] = []
+        monkeypatch.setattr(engine.dice_game, "rotate_seeds", lambda: rotate_calls.append(None))
+        session = engine.run_session(strategy, session_config)  # type: ignore[arg-type]
 
-            # Vérifier que rotate_seeds a été appelé
-            mock_rotate.assert_called_once()
+        # Vérifier que rotate_seeds a été appelé une seule fois
+        assert len(rotate_calls) == 1
 
         # Vérifier les métriques
         assert session.game_state.bet_type_toggles == 1
         assert session.game_state.seed_rotations_count == 1
+        assert strategy.results_count == 1
 
     def test_no_skip_nonce_constraint(self) -> None:
         """Vérifie qu'on ne peut pas skip de nonce dans une vraie session."""
@@ -1,14 +1,43 @@
 """Tests d'intégration pour la compatibilité Bitsler complète OVER/UNDER."""
 
+from collections.abc import Iterator
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pytest
 
 from dicebot.core import BetType, DiceGame
 from dicebot.core.models import BetResult, GameState
 from dicebot.strategies import StrategyConfig, StrategyFactory
 
+BITSLER_SERVER_SEED = "bitsler_compatible_seed_123"
+BITSLER_CLIENT_SEED = "player_seed_456"
+
+# Série de paris UNDER et OVER comme sur Bitsler
+BITSLER_TEST_CASES: list[tuple[Decimal, float, BetType, str]] = [
+    # (bet_amount, target, bet_type, description)
+    (Decimal("0.001"), 50.0, BetType.UNDER, "2x UNDER classic"),
+    (Decimal("0.001"), 50.0, BetType.OVER, "2x OVER classic"),
+    (Decimal("0.002"), 25.0, BetType.UNDER, "4x UNDER aggressive"),
+    (Decimal("0.002"), 75.0, BetType.OVER, "4x OVER aggressive"),
+    (Decimal("0.0005"), 90.0, BetType.UNDER, "11x UNDER high risk"),
+    (Decimal("0.0005"), 10.0, BetType.OVER, "11x OVER high risk"),
+]
+
+
+@pytest.fixture(scope="class")
+def shared_game() -> DiceGame:
+    """Jeu provably fair partagé par les tests d'une classe qui n'imposent pas de seeds."""
+    return DiceGame(use_provably_fair=True)
+
+
+@pytest.fixture
+def pf_game(shared_game: DiceGame) -> Iterator[DiceGame]:
+    """Jeu partagé, avec rotation des seeds après chaque test (nonce remis à zéro)."""
+    yield shared_game
+    shared_game.rotate_seeds()
+
 
 class TestBitslerCompatibility:
     """Tests d'intégration vérifiant la compatibilité 100% avec Bitsler."""
@@ -18,24 +47,13 @@ class TestBitslerCompatibility:
         # Configuration identique à Bitsler
         game = DiceGame(
             use_provably_fair=True,
-            server_seed="bitsler_compatible_seed_123",
-            client_seed="player_seed_456",
+            server_seed=BITSLER_SERVER_SEED,
+            client_seed=BITSLER_CLIENT_SEED,
         )
 
-        # Série de paris UNDER et OVER comme sur Bitsler
-        test_cases = [
-            # (bet_amount, target, bet_type, description)
-            (Decimal("0.001"), 50.0, BetType.UNDER, "2x UNDER classic"),
-            (Decimal("0.001"), 50.0, BetType.OVER, "2x OVER classic"),
-            (Decimal("0.002"), 25.0, BetType.UNDER, "4x UNDER aggressive"),
-            (Decimal("0.002"), 75.0, BetType.OVER, "4x OVER aggressive"),
-            (Decimal("0.0005"), 90.0, BetType.UNDER, "11x UNDER high risk"),
-            (Decimal("0.0005"), 10.0, BetType.OVER, "11x OVER high risk"),
-        ]
-
         results: list[tuple[BetResult, str]] = []
 
-        for amount, target, bet_type, description in test_cases:
+        for amount, target, bet_type, description in BITSLER_TEST_CASES:
             result = game.roll(amount, target, bet_type)
             results.append((result, description))
 
@@ -69,12 +87,40 @@ class TestBitslerCompatibility:
         # Vérifier la distribution des seeds
         seed_info = game.get_current_seed_info()
         assert seed_info is not None
-        assert seed_info["client_seed"] == "player_seed_456"
+        assert seed_info["client_seed"] == BITSLER_CLIENT_SEED
         server_seed_hash = seed_info["server_seed_hash"]
         assert isinstance(server_seed_hash, str)
         assert len(server_seed_hash) == 64  # SHA256 hex
 
-    def test_strategy_over_under_integration(self) -> None:
+    def test_complete_bitsler_simulation_batch(self) -> None:
+        """Même série de paris en un seul appel roll_batch, identique aux rolls unitaires."""
+        seeds = {"server_seed": BITSLER_SERVER_SEED, "client_seed": BITSLER_CLIENT_SEED}
+        game = DiceGame(use_provably_fair=True, **seeds)
+        reference = DiceGame(use_provably_fair=True, **seeds)
+
+        amounts, targets, bet_types, _ = zip(*BITSLER_TEST_CASES, strict=True)
+        batch = game.roll_batch(
+            np.array(amounts, dtype=np.float64), np.array(targets), np.array(bet_types)
+        )
+
+        assert len(batch) == len(BITSLER_TEST_CASES)
+        assert ((batch.rolls >= 0.0) & (batch.rolls <= 100.0)).all()
+
+        # Logique de victoire correcte, vectorisée
+        expected_won = np.where(
+            batch.under, batch.rolls < batch.targets, batch.rolls > batch.targets
+        )
+        assert (batch.won == expected_won).all()
+
+        for i, (amount, target, bet_type, description) in enumerate(BITSLER_TEST_CASES):
+            # Le lot consomme les nonces dans le même ordre que roll()
+            result = reference.roll(amount, target, bet_type)
+            assert batch.rolls[i] == result.roll, description
+            assert bool(batch.won[i]) == result.won, description
+            assert batch.multipliers[i] == pytest.approx(result.multiplier)
+            assert batch.payouts[i] == pytest.approx(float(result.payout))
+
+    def test_strategy_over_under_integration(self, pf_game: DiceGame) -> None:
         """Test intégration complète d'une stratégie avec OVER/UNDER."""
         # Stratégie mixte intelligent
         config = StrategyConfig(
@@ -87,7 +133,7 @@ class TestBitslerCompatibility:
 
         # Utiliser une stratégie existante avec adaptations
         strategy: Any = StrategyFactory.create("flat", config)
-        game = DiceGame(use_provably_fair=True)
+        game = pf_game
 
         # Simuler plusieurs paris avec changements de stratégie
         game_state: GameState = GameState(balance=Decimal("100"))
@@ -189,9 +235,9 @@ class TestBitslerCompatibility:
 
             print(f"{description}: Win chance={win_chance:.2f}%, EV={ev:.4f}")
 
-    def test_bitsler_edge_cases(self) -> None:
+    def test_bitsler_edge_cases(self, pf_game: DiceGame) -> None:
         """Test des cas limites spécifiques à Bitsler."""
-        game = DiceGame(use_provably_fair=True)
+        game = pf_game
 
         # Cas limites de targets
         edge_cases: list[tuple[float, BetType, str]] = [
@@ -230,13 +276,13 @@ class TestBitslerCompatibility:
             f"Extreme multipliers: UNDER 0.01 = {extreme_under:.2f}x, OVER 99.99 = {extreme_over:.2f}x"
         )
 
-    def test_complete_workflow_demonstration(self) -> None:
+    def test_complete_workflow_demonstration(self, pf_game: DiceGame) -> None:
         """Démonstration complète du workflow OVER/UNDER."""
         print("\n🎲 === DÉMONSTRATION COMPLÈTE DICEBOT OVER/UNDER ===")
         print("📊 Compatible 100% avec Bitsler.com")
 
         # Configuration du jeu
-        game: DiceGame = DiceGame(use_provably_fair=True)
+        game: DiceGame = pf_game
         initial_balance: Decimal = Decimal("100")
 
         # Stratégie adaptative
@@ -304,4 +350,4 @@ class TestBitslerCompatibility:
 if __name__ == "__main__":
     # Exécution directe pour démonstration
     test: TestBitslerCompatibility = TestBitslerCompatibility()
-    test.test_complete_workflow_demonstration()
+    test.test_complete_workflow_demonstration(DiceGame(use_provably_fair=True))
@@ -18,15 +18,16 @@ class TestSession:
         config = SessionConfig(initial_bankroll=Decimal("10"), max_bets=5)
         session = Session("test", config)
 
+        result = BetResult(
+            roll=50.0,
+            won=True,
+            threshold=49.5,
+            amount=Decimal("1"),
+            payout=Decimal("2"),
+        )
+
         # Simulate 5 bets
         for _ in range(5):
-            result = BetResult(
-                roll=50.0,
-                won=True,
-                threshold=49.5,
-                amount=Decimal("1"),
-                payout=Decimal("2"),
-            )
             session.process_bet(result)
 
         assert not session.state.is_active
@@ -39,20 +40,24 @@ class TestSession:
         )
         session = Session("test", config)
 
+        result = BetResult(
+            roll=60.0,
+            won=False,
+            threshold=49.5,
+            amount=Decimal("1"),
+            payout=Decimal("0"),
+        )
+
         # Simulate losses
         for _ in range(5):
-            result = BetResult(
-                roll=60.0,
-                won=False,
-                threshold=49.5,
-                amount=Decimal("1"),
-                payout=Decimal("0"),
-            )
             session.process_bet(result)
 
         assert not session.state.is_active
         assert session.state.stop_reason is not None
         assert "Stop loss triggered" in session.state.stop_reason
+        # The threshold is hit exactly on the 5th bet
+        assert session.state.stop_reason == "Stop loss triggered (-50.00%)"
+        assert session.state.game_state.bets_count == 5
 
     def test_should_stop_take_profit(self) -> None:
         config = SessionConfig(
@@ -61,34 +66,59 @@ class TestSession:
         )
         session = Session("test", config)
 
+        result = BetResult(
+            roll=40.0,
+            won=True,
+            threshold=49.5,
+            amount=Decimal("1"),
+            payout=Decimal("2"),
+        )
+
         # Simulate wins
         for _ in range(5):
-            result = BetResult(
-                roll=40.0,
-                won=True,
-                threshold=49.5,
-                amount=Decimal("1"),
-                payout=Decimal("2"),
-            )
             session.process_bet(result)
 
         assert not session.state.is_active
         assert session.state.stop_reason is not None
         assert "Take profit triggered" in session.state.stop_reason
+        assert session.state.stop_reason == "Take profit triggered (50.00%)"
+        assert session.state.game_state.bets_count == 5
+
+    def test_stop_thresholds_follow_config_changes(self) -> None:
+        config = SessionConfig(initial_bankroll=Decimal("10"), stop_loss=-0.5, take_profit=0.5)
+        session = Session("test", config)
+        result = BetResult(
+            roll=60.0,
+            won=False,
+            threshold=49.5,
+            amount=Decimal("1"),
+            payout=Decimal("0"),
+        )
+        session.process_bet(result)
+        assert session.state.is_active
+
+        # Thresholds changed after creation are applied on the next check
+        session.config.stop_loss = -0.1
+        assert session.should_stop() == (True, "Stop loss triggered (-10.00%)")
+
+        session.config.stop_loss = -0.5
+        session.config.take_profit = -0.2
+        assert session.should_stop() == (True, "Take profit triggered (-10.00%)")
 
     def test_should_stop_consecutive_losses(self) -> None:
         config = SessionConfig(initial_bankroll=Decimal("10"), max_consecutive_losses=3)
         session = Session("test", config)
 
+        result = BetResult(
+            roll=60.0,
+            won=False,
+            threshold=49.5,
+            amount=Decimal("1"),
+            payout=Decimal("0"),
+        )
+
         # Simulate 3 consecutive losses
         for _ in range(3):
-            result = BetResult(
-                roll=60.0,
-                won=False,
-                threshold=49.5,
-                amount=Decimal("1"),
-                payout=Decimal("0"),
-            )
             session.process_bet(result)
 
         assert not session.state.is_active
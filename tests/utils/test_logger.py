@@ -0,0 +1,698 @@
+"""Tests pour le logger JSON Lines."""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dicebot.core.models import BetDecision, BetResult, BetType, GameState, SessionState
+from dicebot.utils import logger as logger_module
+from dicebot.utils.logger import (
+    BinaryBetResultLogger,
+    JSONLinesFormatter,
+    JSONLinesLogger,
+    LogAnalyzer,
+    LogType,
+    _dec_to_units,
+    _gamestate_to_dict,
+    _iso_now,
+    get_log_path,
+    read_bet_results,
+)
+
+# 2024-01-01T12:00:00 local time, en nanosecondes depuis l'epoch
+BASE_SECONDS = int(datetime(2024, 1, 1, 12, 0, 0).timestamp())
+BASE_NS = BASE_SECONDS * 1_000_000_000
+
+
+@pytest.fixture
+def jsonl_logger(tmp_path: Path) -> Iterator[JSONLinesLogger]:
+    """Logger JSON Lines écrivant dans un répertoire temporaire."""
+    logger = JSONLinesLogger(tmp_path / "test.jsonl")
+    yield logger
+    logger.close()
+
+
+def read_lines(logger: JSONLinesLogger) -> list[dict[str, Any]]:
+    """Relit toutes les lignes JSON écrites par le logger."""
+    return [json.loads(line) for line in logger.log_file.read_text(encoding="utf-8").splitlines()]
+
+
+class TestGetLogPath:
+    """Test la classification automatique des fichiers de log."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected_dir"),
+        [
+            ("martingale_run.jsonl", "strategies/basic"),
+            ("composite_martingale.jsonl", "strategies/composite"),
+            ("test_adaptive.jsonl", "strategies/adaptive"),
+            ("benchmark_simulation.jsonl", "analysis/performance"),
+            ("debug_session.jsonl", "analysis/validation"),
+            ("comparison_test.jsonl", "simulations/comparison"),
+            ("parameter_sweep.jsonl", "simulations/parameter_sweep"),
+            ("simulation_automated.jsonl", "simulations/single"),
+            ("automated.jsonl", "sessions/automated"),
+            ("FLAT.JSONL", "strategies/basic"),
+            ("unknown.jsonl", "sessions/manual"),
+        ],
+    )
+    def test_auto_detection(self, filename: str, expected_dir: str) -> None:
+        """Test que le mot-clé de plus haute priorité détermine le répertoire."""
+        assert get_log_path("betlog", filename) == Path("betlog") / expected_dir / filename
+
+    def test_explicit_log_type_wins(self) -> None:
+        """Test qu'un log_type explicite l'emporte sur le nom de fichier."""
+        path = get_log_path("betlog", "martingale.jsonl", LogType.ANALYSIS_VALIDATION)
+
+        assert path == Path("betlog/analysis/validation/martingale.jsonl")
+
+
+class TestTimestamps:
+    """Test la génération des timestamps."""
+
+    def test_iso_now_is_parseable(self) -> None:
+        """Test que le timestamp est un ISO 8601 valide et proche de maintenant."""
+        parsed = datetime.fromisoformat(_iso_now())
+
+        assert abs((datetime.now() - parsed).total_seconds()) < 2
+
+    def test_iso_now_is_monotonic(self) -> None:
+        """Test que les timestamps successifs sont ordonnés."""
+        first = _iso_now()
+        second = _iso_now()
+
+        assert first <= second
+
+    def test_iso_now_reuses_prefix_within_second(self) -> None:
+        """Test que le préfixe est réutilisé dans la même seconde et reconstruit ensuite."""
+        samples = [BASE_NS + 123_456_000, BASE_NS + 999_999_000, BASE_NS + 1_000_000_000 + 42_000]
+
+        with (
+            patch.object(logger_module, "_TS_CACHE", (-1, "")),
+            patch.object(logger_module.time, "time_ns", side_effect=samples),
+            patch.object(logger_module, "datetime", wraps=datetime) as datetime_mock,
+        ):
+            first = _iso_now()
+            second = _iso_now()
+            assert datetime_mock.fromtimestamp.call_count == 1
+            third = _iso_now()
+            assert datetime_mock.fromtimestamp.call_count == 2
+
+        assert first == "2024-01-01T12:00:00.123456"
+        assert second == "2024-01-01T12:00:00.999999"
+        assert third == "2024-01-01T12:00:01.000042"
+
+    def test_iso_now_matches_isoformat_on_whole_second(self) -> None:
+        """Test que la partie fractionnaire est omise comme isoformat()."""
+        with (
+            patch.object(logger_module, "_TS_CACHE", (-1, "")),
+            patch.object(logger_module.time, "time_ns", return_value=BASE_NS),
+        ):
+            assert _iso_now() == datetime.fromtimestamp(BASE_SECONDS).isoformat()
+
+    def test_log_method_uses_iso_now(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test qu'un événement log_* porte le timestamp de _iso_now()."""
+        with (
+            patch.object(logger_module, "_TS_CACHE", (-1, "")),
+            patch.object(logger_module.time, "time_ns", return_value=BASE_NS + 500_000_000),
+        ):
+            jsonl_logger.log_simulation_summary({"sessions": 1}, "flat", 1)
+
+        (event,) = read_lines(jsonl_logger)
+        assert event["timestamp"] == "2024-01-01T12:00:00.500000"
+
+
+class TestBetEvents:
+    """Test la sérialisation des événements de pari."""
+
+    def make_state(self) -> GameState:
+        """Construit un GameState après un pari perdant."""
+        game_state = GameState(balance=Decimal("10"))
+        game_state.update(
+            BetResult(
+                roll=75.0,
+                won=False,
+                threshold=49.5,
+                amount=Decimal("0.5"),
+                payout=Decimal("0"),
+            )
+        )
+        return game_state
+
+    def test_gamestate_to_dict(self) -> None:
+        """Test que les champs Decimal sont convertis en chaînes."""
+        snapshot = _gamestate_to_dict(self.make_state())
+
+        assert snapshot == {
+            "balance": "9.5",
+            "bets_count": 1,
+            "wins_count": 0,
+            "losses_count": 1,
+            "consecutive_wins": 0,
+            "consecutive_losses": 1,
+            "total_profit": "-0.5",
+            "total_wagered": "0.5",
+            "win_rate": 0.0,
+            "roi": -1.0,
+            "current_drawdown": "0.05",
+            "max_drawdown": "0.05",
+        }
+
+    def test_decision_and_result_share_snapshot_format(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test que décision et résultat embarquent le même snapshot."""
+        game_state = self.make_state()
+        decision = BetDecision(amount=Decimal("1"), multiplier=2.0)
+        result = game_state.bet_history[-1]
+
+        jsonl_logger.log_bet_decision(decision, game_state, "flat", "s1")
+        jsonl_logger.log_bet_result(result, game_state, "flat", "s1")
+
+        decision_event, result_event = read_lines(jsonl_logger)
+        expected = _gamestate_to_dict(game_state)
+        assert decision_event["game_state"] == expected
+        assert result_event["game_state_after"] == expected
+        assert result_event["result"]["profit"] == "-0.5"
+
+    def test_bet_result_line_matches_json_dumps(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test que la ligne générée par gabarit est identique à json.dumps."""
+        game_state = self.make_state()
+        result = BetResult(
+            roll=12.34,
+            won=True,
+            threshold=49.5,
+            amount=Decimal("0.001"),
+            payout=Decimal("0.00198"),
+            bet_type=BetType.OVER,
+            target=10.0,
+            server_seed_hash='ab"cd',
+            client_seed="clïent",
+            nonce=7,
+            multiplier=1.98,
+        )
+
+        jsonl_logger.log_bet_result(result, game_state, "flat", "s1")
+
+        expected = {
+            "event_type": "bet_result",
+            "timestamp": result.timestamp.isoformat() if result.timestamp else None,
+            "session_id": "s1",
+            "strategy_name": "flat",
+            "result": {
+                "roll": 12.34,
+                "won": True,
+                "threshold": 49.5,
+                "amount": "0.001",
+                "payout": "0.00198",
+                "profit": "0.00098",
+                "bet_type": "over",
+                "target": 10.0,
+                "multiplier": 1.98,
+            },
+            "provably_fair": {
+                "server_seed_hash": 'ab"cd',
+                "client_seed": "clïent",
+                "nonce": 7,
+                "verification_data": result.to_verification_dict(),
+            },
+            "game_state_after": _gamestate_to_dict(game_state),
+            "level": "INFO",
+        }
+        line = jsonl_logger.log_file.read_text(encoding="utf-8").rstrip("\n")
+        assert line == json.dumps(expected, ensure_ascii=False)
+
+    def test_bet_result_accepts_numpy_scalars(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test que des scalaires NumPy (ex. issus de roll_batch) s'écrivent comme des natifs."""
+        game_state = self.make_state()
+        fields: dict[str, Any] = {
+            "amount": Decimal("0.001"),
+            "payout": Decimal("0.00198"),
+            "bet_type": BetType.UNDER,
+            "server_seed_hash": "abcd",
+            "client_seed": "client",
+        }
+        native = BetResult(
+            roll=12.5, won=True, threshold=49.5, target=49.5, nonce=7, multiplier=1.98, **fields
+        )
+        numpy_result = BetResult(
+            roll=np.float64(12.5),
+            won=np.bool_(True),
+            threshold=np.float32(49.5),
+            target=np.float64(49.5),
+            nonce=np.int64(7),
+            multiplier=np.float64(1.98),
+            **fields,
+        )
+        numpy_result.timestamp = native.timestamp
+
+        jsonl_logger.log_bet_result(native, game_state, "flat", "s1")
+        jsonl_logger.log_bet_result(numpy_result, game_state, "flat", "s1")
+        jsonl_logger.log_bet(
+            BetDecision(amount=Decimal("0.001"), multiplier=1.98),
+            numpy_result,
+            game_state,
+            "flat",
+            "s1",
+        )
+
+        native_event, numpy_event, bet_event = read_lines(jsonl_logger)
+        assert numpy_event == native_event
+        assert numpy_event["result"]["won"] is True
+        assert numpy_event["provably_fair"]["verification_data"]["won"] is True
+        assert numpy_event["provably_fair"]["nonce"] == 7
+        assert bet_event["result"]["won"] is True
+
+    def test_log_bet_fuses_decision_and_result(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test que log_bet écrit un seul événement avec décision et résultat."""
+        game_state = self.make_state()
+        decision = BetDecision(amount=Decimal("0.5"), multiplier=2.0, reason="flat")
+        result = game_state.bet_history[-1]
+
+        jsonl_logger.log_bet(decision, result, game_state, "flat", "s1")
+
+        (event,) = read_lines(jsonl_logger)
+        assert event["event_type"] == "bet"
+        assert event["decision"]["amount"] == 50_000_000
+        assert event["decision"]["reason"] == "flat"
+        assert event["result"]["profit"] == -50_000_000
+        # Même unité que le reste de l'événement : balance 9.5 LTC en litoshi
+        assert event["game_state_after"] == {
+            **_gamestate_to_dict(game_state),
+            "balance": 950_000_000,
+            "total_profit": -50_000_000,
+            "total_wagered": 50_000_000,
+        }
+        assert "game_state" not in event
+
+        analysis = LogAnalyzer(jsonl_logger.log_file).analyze_session_performance("s1")
+        assert analysis["total_bets"] == 1
+        assert analysis["total_profit"] == -0.5
+
+    @pytest.mark.parametrize(
+        ("amount", "units"),
+        [
+            (Decimal("0.00015"), 15_000),
+            (Decimal("-1.5"), -150_000_000),
+            (Decimal("0.000000015"), 2),
+            (Decimal("0.000000025"), 2),
+            (Decimal("0"), 0),
+        ],
+    )
+    def test_dec_to_units(self, amount: Decimal, units: int) -> None:
+        """Test la conversion en litoshi avec arrondi au pair le plus proche."""
+        assert _dec_to_units(amount) == units
+
+    def test_analyzer_mixes_units_and_strings(self, tmp_path: Path) -> None:
+        """Test que l'analyse additionne les litoshi et les montants décimaux."""
+        log_file = tmp_path / "mixed.jsonl"
+        log_file.write_text(
+            '{"event_type": "bet_result", "session_id": "s1", '
+            '"result": {"won": true, "profit": "0.98", "amount": "1"}}\n'
+            '{"event_type": "bet", "session_id": "s1", '
+            '"result": {"won": false, "profit": -50000000, "amount": 50000000}}\n',
+            encoding="utf-8",
+        )
+        analyzer = LogAnalyzer(log_file)
+
+        fast = analyzer.analyze_session_performance("s1")
+        precise = analyzer.analyze_session_performance("s1", precise=True)
+
+        assert fast["total_bets"] == precise["total_bets"] == 2
+        assert fast["total_profit"] == pytest.approx(0.48)
+        assert precise["total_profit"] == 0.48
+        assert precise["total_wagered"] == 1.5
+
+
+class TestBinaryBetResultLogger:
+    """Test le flux binaire des résultats de paris."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test que les résultats relus correspondent aux paris loggés."""
+        logger = BinaryBetResultLogger(tmp_path / "bets.jsonl", flush_every=2)
+        game_state = GameState(balance=Decimal("10"))
+        for won in (True, False, True):
+            result = BetResult(
+                roll=25.0 if won else 75.0,
+                won=won,
+                threshold=49.5,
+                amount=Decimal("1"),
+                payout=Decimal("2") if won else Decimal("0"),
+                nonce=game_state.bets_count,
+            )
+            game_state.update(result)
+            logger.log_bet_result(result, game_state, "flat", "session-1")
+        logger.close()
+
+        records = read_bet_results(logger.bets_file)
+
+        assert len(records) == 3
+        assert records["won"].tolist() == [True, False, True]
+        assert records["profit"].tolist() == [1.0, -1.0, 1.0]
+        assert records["balance"][-1] == 11.0
+        assert records["nonce"].tolist() == [0, 1, 2]
+        assert records["session_id"][0] == b"session-1"
+        # Les résultats ne sont pas dupliqués dans le fichier JSON Lines
+        assert logger.log_file.read_text(encoding="utf-8") == ""
+
+    def test_log_bet_keeps_decision_as_json(self, tmp_path: Path) -> None:
+        """Test que log_bet garde la décision en JSON et le résultat en binaire."""
+        logger = BinaryBetResultLogger(tmp_path / "fused.jsonl")
+        game_state = GameState(balance=Decimal("10"))
+        result = BetResult(
+            roll=75.0, won=False, threshold=49.5, amount=Decimal("1"), payout=Decimal("0")
+        )
+        game_state.update(result)
+
+        logger.log_bet(
+            BetDecision(amount=Decimal("1"), multiplier=2.0), result, game_state, "flat", "s1"
+        )
+        logger.close()
+
+        events = [json.loads(line) for line in logger.log_file.read_text().splitlines()]
+        assert [e["event_type"] for e in events] == ["bet_decision"]
+        assert read_bet_results(logger.bets_file)["profit"].tolist() == [-1.0]
+
+    @pytest.mark.parametrize(
+        "session_id",
+        ["s" * 37, "session-é"],
+        ids=["too_long", "non_ascii"],
+    )
+    def test_rejects_unstorable_session_id(self, tmp_path: Path, session_id: str) -> None:
+        """Test qu'un ID de session tronqué ou non ASCII est refusé au lieu d'être altéré."""
+        logger = BinaryBetResultLogger(tmp_path / "ids.jsonl")
+        result = BetResult(
+            roll=75.0, won=False, threshold=49.5, amount=Decimal("1"), payout=Decimal("0")
+        )
+
+        with pytest.raises(ValueError, match="session ID"):
+            logger.log_bet_result(result, GameState(balance=Decimal("10")), "flat", session_id)
+        logger.close()
+
+        assert len(read_bet_results(logger.bets_file)) == 0
+
+    def test_full_width_session_id_round_trips(self, tmp_path: Path) -> None:
+        """Test qu'un UUID de 36 caractères est stocké sans perte."""
+        session_id = "123e4567-e89b-12d3-a456-426614174000"
+        logger = BinaryBetResultLogger(tmp_path / "uuid.jsonl")
+        result = BetResult(
+            roll=75.0, won=False, threshold=49.5, amount=Decimal("1"), payout=Decimal("0")
+        )
+        logger.log_bet_result(result, GameState(balance=Decimal("10")), "flat", session_id)
+        logger.close()
+
+        assert read_bet_results(logger.bets_file)["session_id"].tolist() == [session_id.encode()]
+
+    def test_pending_results_written_at_exit(self, tmp_path: Path) -> None:
+        """Test que les résultats en tampon sont écrits à la sortie sans close()."""
+        script = (
+            "from decimal import Decimal\n"
+            "from dicebot.core.models import BetResult, GameState\n"
+            "from dicebot.utils.logger import BinaryBetResultLogger\n"
+            f"logger = BinaryBetResultLogger({str(tmp_path / 'exit.jsonl')!r})\n"
+            "result = BetResult(roll=75.0, won=False, threshold=49.5,"
+            " amount=Decimal('1'), payout=Decimal('0'))\n"
+            "logger.log_bet_result(result, GameState(balance=Decimal('10')), 'flat', 's1')\n"
+        )
+        src_dir = Path(logger_module.__file__).parents[2]
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src_dir)},
+        )
+
+        records = read_bet_results(tmp_path / "exit.jsonl.bets.bin")
+        assert records["profit"].tolist() == [-1.0]
+
+    def test_read_missing_file(self, tmp_path: Path) -> None:
+        """Test qu'un flux absent donne un tableau vide."""
+        assert len(read_bet_results(tmp_path / "missing.bets.bin")) == 0
+
+
+class TestLogAnalyzer:
+    """Test la relecture des fichiers JSON Lines."""
+
+    def write_events(self, log_file: Path, events: list[dict[str, Any]]) -> None:
+        """Écrit des événements bruts, un par ligne."""
+        log_file.write_text("".join(json.dumps(event) + "\n" for event in events), encoding="utf-8")
+
+    def test_get_session_events_filters_by_session(self, tmp_path: Path) -> None:
+        """Test que seuls les événements de la session demandée sont décodés."""
+        log_file = tmp_path / "sessions.jsonl"
+        self.write_events(
+            log_file,
+            [
+                {"event_type": "session_start", "session_id": "a"},
+                {"event_type": "session_start", "session_id": "b"},
+                # La valeur apparaît ailleurs que dans session_id
+                {"event_type": "error", "session_id": None, "error": {"message": "a"}},
+                {"event_type": "session_end", "session_id": "a"},
+            ],
+        )
+
+        events = LogAnalyzer(log_file).get_session_events("a")
+
+        assert [e["event_type"] for e in events] == ["session_start", "session_end"]
+
+    def test_read_events_by_type(self, tmp_path: Path) -> None:
+        """Test le filtrage par type d'événement, avec ligne invalide."""
+        log_file = tmp_path / "types.jsonl"
+        log_file.write_text(
+            '{"event_type": "bet_result", "n": 1}\n'
+            "not json\n"
+            '{"event_type": "bet_decision", "reason": "bet_result"}\n'
+            '{"event_type": "bet_result", "n": 2}',
+            encoding="utf-8",
+        )
+        analyzer = LogAnalyzer(log_file)
+
+        assert [e["n"] for e in analyzer.read_events("bet_result")] == [1, 2]
+        assert len(analyzer.read_events()) == 3
+
+    def test_read_all_events_skips_blank_and_invalid_lines(self, tmp_path: Path) -> None:
+        """Test la lecture complète : lignes vides, CRLF, UTF-8 et octets invalides."""
+        log_file = tmp_path / "raw.jsonl"
+        log_file.write_bytes(
+            '{"message": "café"}\r\n'.encode() + b"\n   \n" + b'{"message": "\xff"}\n' + b'{"n": 2}'
+        )
+
+        events = LogAnalyzer(log_file).read_events()
+
+        assert events == [{"message": "café"}, {"n": 2}]
+        assert LogAnalyzer(tmp_path / "missing.jsonl").read_events() == []
+
+    def test_missing_and_empty_files(self, tmp_path: Path) -> None:
+        """Test qu'un fichier absent ou vide ne produit aucun événement."""
+        empty = tmp_path / "empty.jsonl"
+        empty.touch()
+
+        assert LogAnalyzer(tmp_path / "missing.jsonl").get_session_events("a") == []
+        assert LogAnalyzer(empty).get_session_events("a") == []
+        assert LogAnalyzer(empty).read_events("bet_result") == []
+
+    def test_analyze_session_performance(self, tmp_path: Path) -> None:
+        """Test l'analyse d'une session écrite par le logger."""
+        logger = JSONLinesLogger(tmp_path / "perf.jsonl")
+        game_state = GameState(balance=Decimal("10"))
+        for won in (True, False, False, True):
+            result = BetResult(
+                roll=25.0 if won else 75.0,
+                won=won,
+                threshold=49.5,
+                amount=Decimal("0.5"),
+                payout=Decimal("0.99") if won else Decimal("0"),
+            )
+            game_state.update(result)
+            logger.log_bet_result(result, game_state, "flat", "s1")
+            logger.log_bet_result(result, game_state, "flat", "other")
+        logger.close()
+
+        analysis = LogAnalyzer(logger.log_file).analyze_session_performance("s1")
+
+        assert analysis["strategy_name"] == "flat"
+        assert analysis["total_bets"] == 4
+        assert analysis["wins"] == 2
+        assert analysis["losses"] == 2
+        assert analysis["total_profit"] == pytest.approx(-0.02)
+        assert analysis["total_wagered"] == pytest.approx(2.0)
+        assert analysis["roi"] == pytest.approx(-0.01)
+
+        precise = LogAnalyzer(logger.log_file).analyze_session_performance("s1", precise=True)
+        assert precise["total_profit"] == -0.02
+        assert precise["roi"] == -0.01
+
+    def test_analyze_session_without_bets(self, tmp_path: Path) -> None:
+        """Test les messages d'erreur sans événement ou sans pari."""
+        log_file = tmp_path / "nobets.jsonl"
+        self.write_events(log_file, [{"event_type": "session_start", "session_id": "a"}])
+        analyzer = LogAnalyzer(log_file)
+
+        assert analyzer.analyze_session_performance("a") == {
+            "error": "No bet results found for session"
+        }
+        assert analyzer.analyze_session_performance("b") == {"error": "No events found for session"}
+
+
+class TestNativePayloads:
+    """Test que les événements marqués natifs ne contiennent que des types JSON."""
+
+    def test_session_events_are_json_native(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test que session_start/session_end s'encodent sans sérialiseur de secours."""
+        game_state = GameState(balance=Decimal("10"))
+        session_state = SessionState(
+            game_state=game_state,
+            session_id="s1",
+            stop_loss=Decimal("-0.1"),
+            max_bets=5,
+        )
+        session_state.end_session("max_bets")
+
+        with patch.object(JSONLinesFormatter, "_json_serializer") as serializer:
+            jsonl_logger.log_session_start(session_state)
+            jsonl_logger.log_session_end(session_state)
+            jsonl_logger.log_streak_event("loss", 3, "flat", "s1", game_state)
+            jsonl_logger.log_error(ValueError("boom"), "test", "s1", "flat")
+
+        serializer.assert_not_called()
+        events = read_lines(jsonl_logger)
+        assert [e["event_type"] for e in events] == [
+            "session_start",
+            "session_end",
+            "loss_streak",
+            "error",
+        ]
+        assert [e["level"] for e in events] == ["INFO", "INFO", "INFO", "ERROR"]
+        assert events[0]["session_config"]["stop_loss"] == "-0.1"
+
+    def test_opaque_payload_uses_serializer(self, jsonl_logger: JSONLinesLogger) -> None:
+        """Test que les données libres passent toujours par le sérialiseur."""
+        jsonl_logger.log_strategy_event("custom", "flat", "s1", {"amount": Decimal("1.5")})
+
+        (event,) = read_lines(jsonl_logger)
+        assert event["data"] == {"amount": "1.5"}
+
+
+class TestRotation:
+    """Test l'écriture directe et la rotation des fichiers."""
+
+    def test_rotation_keeps_backup_count(self, tmp_path: Path) -> None:
+        """Test que les sauvegardes sont décalées et limitées à backup_count."""
+        logger = JSONLinesLogger(tmp_path / "rot.jsonl", max_file_size=300, backup_count=2)
+        for index in range(20):
+            logger.log_simulation_summary({"index": index}, "flat", 1)
+        logger.close()
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["rot.jsonl", "rot.jsonl.1", "rot.jsonl.2"]
+        assert all(p.stat().st_size < 300 for p in tmp_path.iterdir())
+        last = json.loads((tmp_path / "rot.jsonl").read_text(encoding="utf-8").splitlines()[-1])
+        assert last["summary"] == {"index": 19}
+
+    def test_no_rotation_without_backups(self, tmp_path: Path) -> None:
+        """Test que backup_count=0 désactive la rotation, comme RotatingFileHandler."""
+        logger = JSONLinesLogger(tmp_path / "norot.jsonl", max_file_size=300, backup_count=0)
+        with patch.object(logger, "_rotate") as rotate:
+            for index in range(20):
+                logger.log_simulation_summary({"index": index}, "flat", 1)
+        logger.close()
+
+        rotate.assert_not_called()
+        assert [p.name for p in tmp_path.iterdir()] == ["norot.jsonl"]
+        assert len(LogAnalyzer(logger.log_file).read_events()) == 20
+
+    def test_rotation_does_not_wait_for_compression(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test que la compression gzip ne bloque pas les écritures suivantes."""
+        release = threading.Event()
+        logged_first: list[bool] = []
+        compress = logger_module._gzip_compress
+
+        def slow_compress(source: Path, target: Path) -> None:
+            release.wait(timeout=2)
+            logged_first.append(release.is_set())
+            compress(source, target)
+
+        monkeypatch.setattr(logger_module, "_gzip_compress", slow_compress)
+        logger = JSONLinesLogger(
+            tmp_path / "slow.jsonl", max_file_size=300, backup_count=2, compress_backups=True
+        )
+        for index in range(20):
+            logger.log_simulation_summary({"index": index}, "flat", 1)
+        release.set()
+        logger.close()
+
+        # Aucune compression n'a bloqué les écritures : toutes ont attendu la fin des logs
+        assert logged_first and all(logged_first)
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["slow.jsonl", "slow.jsonl.1.gz", "slow.jsonl.2.gz"]
+
+    def test_level_filters_events(self, tmp_path: Path) -> None:
+        """Test que le niveau configuré filtre les événements INFO."""
+        logger = JSONLinesLogger(tmp_path / "err.jsonl", level=logging.ERROR)
+        logger.log_simulation_summary({}, "flat", 1)
+        logger.log_error(RuntimeError("x"), "ctx")
+
+        events = read_lines(logger)
+        logger.close()
+
+        assert [e["event_type"] for e in events] == ["error"]
+
+    def test_events_reach_disk_before_close(self, tmp_path: Path) -> None:
+        """Test que chaque événement est écrit sur disque sans flush() ni close()."""
+        logger = JSONLinesLogger(tmp_path / "live.jsonl")
+        logger.log_simulation_summary({"index": 0}, "flat", 1)
+
+        events = LogAnalyzer(logger.log_file).read_events()
+        logger.close()
+
+        assert [e["summary"] for e in events] == [{"index": 0}]
+
+    def test_close_is_idempotent(self, tmp_path: Path) -> None:
+        """Test que close() peut être appelé deux fois et ignore les écritures tardives."""
+        logger = JSONLinesLogger(tmp_path / "closed.jsonl")
+        logger.close()
+        logger.close()
+        logger.log_simulation_summary({}, "flat", 1)
+
+        assert (tmp_path / "closed.jsonl").read_text(encoding="utf-8") == ""
+
+    def test_existing_file_size_counts_toward_rotation(self, tmp_path: Path) -> None:
+        """Test que la taille d'un fichier existant est reprise au démarrage."""
+        log_file = tmp_path / "resume.jsonl"
+        log_file.write_bytes(b"x" * 250 + b"\n")
+
+        logger = JSONLinesLogger(log_file, max_file_size=300, backup_count=1)
+        assert logger._bytes_written == 251
+        logger.log_simulation_summary({"index": 0}, "flat", 1)
+        logger.close()
+
+        assert (tmp_path / "resume.jsonl.1").read_bytes() == b"x" * 250 + b"\n"
+
+    def test_compressed_backups_are_readable(self, tmp_path: Path) -> None:
+        """Test que les sauvegardes compressées restent lisibles par LogAnalyzer."""
+        logger = JSONLinesLogger(
+            tmp_path / "gz.jsonl", max_file_size=300, backup_count=2, compress_backups=True
+        )
+        for index in range(20):
+            logger.log_simulation_summary({"index": index}, "flat", 1)
+        logger.close()
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["gz.jsonl", "gz.jsonl.1.gz", "gz.jsonl.2.gz"]
+
+        backups = [LogAnalyzer(tmp_path / f"gz.jsonl.{n}.gz") for n in (2, 1)]
+        indexes = [e["summary"]["index"] for a in backups for e in a.read_events()]
+        current = [e["summary"]["index"] for e in LogAnalyzer(logger.log_file).read_events()]
+        assert indexes + current == list(range(indexes[0], 20))
+        assert len(backups[1].read_events("simulation_summary")) == len(backups[1].read_events())
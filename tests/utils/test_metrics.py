@@ -0,0 +1,379 @@
+"""Tests pour le calcul des métriques de performance."""
+
+import math
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from dicebot.core.models import BetResult, GameState, SessionState
+from dicebot.utils.metrics import (
+    MultiSessionAnalyzer,
+    PerformanceMetrics,
+    SessionAnalyzer,
+    _as_float_array,
+    _central_moments,
+    _drawdown_kernel,
+)
+
+START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_session(
+    bets: list[tuple[str, float, bool]], session_id: str = "s1", history_limit: int = 20
+) -> SessionState:
+    """Construit une session à partir de (montant, multiplicateur, gagné), un pari par minute."""
+    game_state = GameState(balance=Decimal("100"), history_limit=history_limit)
+    session = SessionState(game_state=game_state, session_id=session_id)
+    for index, (amount, multiplier, won) in enumerate(bets):
+        stake = Decimal(amount)
+        session.update(
+            BetResult(
+                roll=25.0 if won else 75.0,
+                won=won,
+                threshold=49.5,
+                amount=stake,
+                payout=stake * Decimal(str(multiplier)) if won else Decimal("0"),
+                timestamp=START + timedelta(minutes=index),
+            )
+        )
+    return session
+
+
+# +1, -2, +1, -1
+MIXED_BETS = [("1", 2.0, True), ("2", 2.0, False), ("0.5", 3.0, True), ("1", 2.0, False)]
+
+
+class TestPerformanceMetrics:
+    """Test les métriques calculées sur des séries de rendements."""
+
+    def test_sharpe_ratio(self) -> None:
+        """Test le ratio de Sharpe annualisé et les cas dégénérés."""
+        returns = [0.1, -0.05, 0.2, 0.0]
+        excess = np.array(returns) - 0.365 / 365
+
+        sharpe = PerformanceMetrics.calculate_sharpe_ratio(returns, risk_free_rate=0.365)
+
+        assert sharpe == pytest.approx(excess.mean() / excess.std() * np.sqrt(365))
+        assert PerformanceMetrics.calculate_sharpe_ratio([0.5, 0.5, 0.5]) == 0.0
+        assert PerformanceMetrics.calculate_sharpe_ratio([0.1]) == 0.0
+
+    def test_var_and_es_from_partial_sort(self) -> None:
+        """Test que VaR et ES portent sur les k pires rendements."""
+        returns = [float(x) for x in (7, 3, 0, 19, 1, 12, 5, 2, 18, 4)] * 2
+
+        var, es = PerformanceMetrics.calculate_var_and_es(returns, 0.1)
+
+        assert (var, es) == (0.0, 0.0)
+        assert PerformanceMetrics.calculate_var_and_es(returns, 0.2) == (1.0, 0.5)
+        assert PerformanceMetrics.calculate_expected_shortfall(returns, 0.2) == 0.5
+
+    def test_var_and_es_cutoff_rounding(self) -> None:
+        """Test que k = ceil(0.05 * 60) vaut 3 malgré l'erreur d'arrondi flottant."""
+        returns = [float(x) for x in range(60)]
+
+        assert PerformanceMetrics.calculate_var_and_es(returns, 0.05) == (2.0, 1.0)
+
+    def test_maximum_drawdown_duration(self) -> None:
+        """Test la durée d'un drawdown en cours jusqu'au dernier pari."""
+        history = make_session(MIXED_BETS).game_state.bet_history
+
+        result = PerformanceMetrics.calculate_maximum_drawdown_duration(history)
+
+        assert result == (3, timedelta(minutes=2))
+
+    def test_maximum_drawdown_duration_recovered(self) -> None:
+        """Test qu'un drawdown se termine au pari qui dépasse le pic précédent."""
+        bets = [
+            ("1", 2.0, True),
+            ("1", 2.0, False),
+            ("1", 2.0, False),
+            ("1", 4.0, True),
+            ("1", 2.0, False),
+        ]
+        history = make_session(bets).game_state.bet_history
+
+        result = PerformanceMetrics.calculate_maximum_drawdown_duration(history)
+
+        assert result == (2, timedelta(minutes=2))
+
+    def test_maximum_drawdown_duration_without_drawdown(self) -> None:
+        """Test qu'une série de gains ne produit aucun drawdown."""
+        history = make_session([("1", 2.0, True)] * 3).game_state.bet_history
+
+        assert PerformanceMetrics.calculate_maximum_drawdown_duration(history) == (0, timedelta(0))
+        assert PerformanceMetrics.calculate_maximum_drawdown_duration([]) == (0, timedelta(0))
+
+    def test_profit_factor_from_arrays(self) -> None:
+        """Test que le profit factor sur tableaux égale celui de l'historique."""
+        history = make_session(MIXED_BETS).game_state.bet_history
+        amount = np.array([1.0, 2.0, 0.5, 1.0])
+        payout = np.array([2.0, 0.0, 1.5, 0.0])
+        won = np.array([True, False, True, False])
+
+        factor = PerformanceMetrics.calculate_profit_factor_from_arrays(amount, payout, won)
+
+        assert factor == pytest.approx(2 / 3)
+        assert factor == pytest.approx(PerformanceMetrics.calculate_profit_factor(history))
+
+    def test_profit_factor_from_arrays_edge_cases(self) -> None:
+        """Test les cas sans perte et sans pari."""
+        amount = np.array([1.0])
+        empty = np.array([])
+
+        assert PerformanceMetrics.calculate_profit_factor_from_arrays(
+            amount, np.array([2.0]), np.array([True])
+        ) == float("inf")
+        assert (
+            PerformanceMetrics.calculate_profit_factor_from_arrays(empty, empty, empty.astype(bool))
+            == 0.0
+        )
+
+    def test_profit_factor_from_profits(self) -> None:
+        """Test le profit factor calculé sur les profits signés."""
+        profit = np.array([1.0, -2.0, 1.0, -1.0])
+
+        assert PerformanceMetrics.calculate_profit_factor_from_profits(profit) == pytest.approx(
+            2 / 3
+        )
+        assert PerformanceMetrics.calculate_profit_factor_from_profits(profit[:1]) == float("inf")
+        assert PerformanceMetrics.calculate_profit_factor_from_profits(np.array([])) == 0.0
+
+    def test_central_moments_match_scipy(self) -> None:
+        """Test que les moments partagés égalent numpy et scipy.stats."""
+        values = np.random.default_rng(1).exponential(size=200) - 1
+
+        mean, variance, skewness, kurtosis = _central_moments(values)
+
+        assert mean == pytest.approx(values.mean())
+        assert variance == pytest.approx(values.var())
+        assert skewness == pytest.approx(stats.skew(values))
+        assert kurtosis == pytest.approx(stats.kurtosis(values))
+
+    def test_float32_returns(self) -> None:
+        """Test que des rendements float32 sont conservés et donnent les mêmes statistiques."""
+        values = np.random.default_rng(2).exponential(size=500) - 1
+        single = values.astype(np.float32)
+
+        assert _as_float_array(single) is single
+        assert _as_float_array([1, 2]).dtype == np.float64
+        for expected, actual in zip(
+            _central_moments(values), _central_moments(single), strict=True
+        ):
+            assert actual == pytest.approx(expected, rel=1e-5)
+        assert PerformanceMetrics.calculate_sharpe_ratio(single) == pytest.approx(
+            PerformanceMetrics.calculate_sharpe_ratio(values), rel=1e-5
+        )
+        assert PerformanceMetrics.calculate_sortino_ratio(single) == pytest.approx(
+            PerformanceMetrics.calculate_sortino_ratio(values), rel=1e-5
+        )
+
+    def test_drawdown_kernel(self) -> None:
+        """Test le noyau sur des profits entiers et des temps en microsecondes."""
+        profit = np.array([1, -2, 1, -1, 5, -1], dtype=np.int64)
+        elapsed_us = np.array([0, 10, 20, 35, 40, 90], dtype=np.int64)
+
+        assert _drawdown_kernel(profit, elapsed_us) == (3, 30)
+        assert _drawdown_kernel(profit[:1], elapsed_us[:1]) == (0, 0)
+
+    def test_value_at_risk(self) -> None:
+        """Test la VaR par sélection et sa variante interpolée."""
+        returns = [float(x) for x in range(99, -1, -1)]
+
+        assert PerformanceMetrics.calculate_value_at_risk(returns, 0.05) == 4.0
+        assert PerformanceMetrics.calculate_value_at_risk(
+            returns, 0.05, interpolate=True
+        ) == pytest.approx(np.percentile(returns, 5))
+        assert PerformanceMetrics.calculate_value_at_risk([], 0.05) == 0.0
+
+    def test_var_and_es_empty(self) -> None:
+        """Test qu'une série vide donne des valeurs nulles."""
+        assert PerformanceMetrics.calculate_var_and_es([], 0.05) == (0.0, 0.0)
+        assert PerformanceMetrics.calculate_expected_shortfall([], 0.05) == 0.0
+
+
+class TestSessionAnalyzer:
+    """Test les métriques d'une session."""
+
+    def test_advanced_metrics_bet_analysis(self) -> None:
+        """Test les statistiques par pari calculées sur les tableaux NumPy."""
+        metrics = SessionAnalyzer(make_session(MIXED_BETS)).get_advanced_metrics()
+
+        assert metrics["bet_analysis"] == {
+            "average_bet_size": pytest.approx(1.125),
+            "largest_bet": 2.0,
+            "smallest_bet": 0.5,
+            "average_win_payout": pytest.approx(1.75),
+            "largest_single_loss": 2.0,
+            "largest_single_win": 1.0,
+        }
+        returns = metrics["returns_analysis"]
+        assert returns["mean_return"] == pytest.approx(0.25)
+        assert returns["min_return"] == -1.0
+        assert returns["max_return"] == 2.0
+
+    def test_advanced_metrics_without_wins(self) -> None:
+        """Test qu'une session sans gain donne des valeurs nulles par défaut."""
+        session = make_session([("1", 2.0, False), ("0.5", 2.0, False), ("2", 2.0, False)])
+
+        metrics = SessionAnalyzer(session).get_advanced_metrics()
+        bet_analysis = metrics["bet_analysis"]
+
+        assert bet_analysis["average_win_payout"] == 0
+        assert bet_analysis["largest_single_win"] == 0
+        assert bet_analysis["largest_single_loss"] == 2.0
+        # Rendements tous égaux à -1 : moments d'ordre 3 et 4 indéfinis
+        assert metrics["returns_analysis"]["std_return"] == 0.0
+        assert math.isnan(metrics["returns_analysis"]["skewness"])
+
+    def test_advanced_metrics_drawdown(self) -> None:
+        """Test que la durée de drawdown de l'analyseur égale celle de PerformanceMetrics."""
+        session = make_session(MIXED_BETS)
+
+        risk = SessionAnalyzer(session).get_advanced_metrics()["risk_metrics"]
+
+        assert risk["max_drawdown_bets"] == 3
+        assert risk["max_drawdown_duration_seconds"] == 120.0
+
+    def test_advanced_metrics_without_history(self) -> None:
+        """Test le message d'erreur sans historique de paris."""
+        analyzer = SessionAnalyzer(make_session([]))
+
+        assert analyzer.get_advanced_metrics() == {"error": "No bet history available"}
+
+    def test_time_series_analysis(self) -> None:
+        """Test les séries cumulées et le taux de gain glissant."""
+        series = SessionAnalyzer(make_session(MIXED_BETS)).get_time_series_analysis()
+
+        time_series = series["time_series"]
+        assert time_series["cumulative_profit"] == [1.0, -1.0, 0.0, -1.0]
+        assert time_series["cumulative_bets"] == [1, 2, 3, 4]
+        assert time_series["balance_history"] == [101.0, 99.0, 100.0, 99.0]
+        assert time_series["rolling_win_rate"] == pytest.approx([1.0, 0.5, 2 / 3, 0.5])
+        assert time_series["timestamps"][1] == "2024-01-01T12:01:00"
+
+    def test_rolling_win_rate_full_window(self) -> None:
+        """Test la fenêtre de 20 paris une fois remplie."""
+        bets = [("1", 2.0, index % 4 == 0) for index in range(30)]
+
+        session = make_session(bets, history_limit=100)
+
+        series = SessionAnalyzer(session).get_time_series_analysis()["time_series"]
+        rolling = series["rolling_win_rate"]
+
+        assert len(rolling) == 30
+        assert rolling[:4] == pytest.approx([1.0, 0.5, 1 / 3, 0.25])
+        assert rolling[19:] == pytest.approx([0.25] * 11)
+
+    def test_trend_slope_matches_linregress(self) -> None:
+        """Test que la pente en forme fermée égale celle de scipy.stats.linregress."""
+        analyzer = SessionAnalyzer(make_session(MIXED_BETS))
+        values = np.random.default_rng(0).normal(size=50).cumsum()
+
+        assert analyzer._calculate_trend_slope([1.0, 3.0, 5.0, 7.0]) == pytest.approx(2.0)
+        assert analyzer._calculate_trend_slope(values) == pytest.approx(
+            stats.linregress(np.arange(50), values).slope
+        )
+        assert analyzer._calculate_trend_slope([4.0]) == 0.0
+
+    def test_arrays_are_cached(self) -> None:
+        """Test que les colonnes par pari sont extraites une seule fois."""
+        session = make_session(MIXED_BETS)
+        analyzer = SessionAnalyzer(session)
+
+        arrays = analyzer._arrays
+        analyzer.get_advanced_metrics()
+        analyzer.get_time_series_analysis()
+
+        assert analyzer._arrays is arrays
+        assert arrays.won.tolist() == [True, False, True, False]
+        assert arrays.amount_units.tolist() == [100_000_000, 200_000_000, 50_000_000, 100_000_000]
+        assert arrays.payout_units.tolist() == [200_000_000, 0, 150_000_000, 0]
+        assert arrays.elapsed_us.tolist() == [0, 60_000_000, 120_000_000, 180_000_000]
+        assert arrays.profit.tolist() == [1.0, -2.0, 1.0, -1.0]
+        assert arrays.profit_units.tolist() == [
+            100_000_000,
+            -200_000_000,
+            100_000_000,
+            -100_000_000,
+        ]
+        assert arrays.timestamps == [bet.timestamp for bet in session.game_state.bet_history]
+
+
+class TestMultiSessionAnalyzer:
+    """Test l'agrégation de plusieurs sessions."""
+
+    def make_sessions(self) -> list[SessionState]:
+        """Trois sessions : mixte (-1), gagnante (+1) et perdante (-2)."""
+        return [
+            make_session(MIXED_BETS, "a"),
+            make_session([("1", 2.0, True)], "b"),
+            make_session([("2", 2.0, False)], "c"),
+        ]
+
+    def test_aggregate_metrics(self) -> None:
+        """Test les totaux et statistiques par session."""
+        metrics = MultiSessionAnalyzer(self.make_sessions()).get_aggregate_metrics()
+
+        aggregate = metrics["aggregate_performance"]
+        assert aggregate["total_sessions"] == 3
+        assert aggregate["total_bets"] == 6
+        assert aggregate["total_losses"] == 3
+        assert aggregate["total_profit"] == pytest.approx(-2.0)
+        assert aggregate["total_wagered"] == pytest.approx(7.5)
+        assert aggregate["overall_roi"] == pytest.approx(-2.0 / 7.5)
+        assert aggregate["profitable_sessions"] == 1
+
+        statistics = metrics["session_statistics"]
+        assert statistics["median_session_profit"] == pytest.approx(-1.0)
+        assert statistics["best_session_profit"] == pytest.approx(1.0)
+        assert statistics["worst_session_profit"] == pytest.approx(-2.0)
+
+        risk = metrics["risk_analysis"]
+        assert risk["worst_consecutive_losses"] == 1
+        assert isinstance(risk["sessions_with_significant_loss"], int)
+
+    def test_aggregate_metrics_returns_copy(self) -> None:
+        """Test que modifier le résultat n'altère pas les appels suivants."""
+        analyzer = MultiSessionAnalyzer(self.make_sessions())
+
+        metrics = analyzer.get_aggregate_metrics()
+        metrics["exported_at"] = "now"
+        metrics["aggregate_performance"]["total_bets"] = 0
+
+        again = analyzer.get_aggregate_metrics()
+        assert "exported_at" not in again
+        assert again["aggregate_performance"]["total_bets"] == 6
+
+    def test_profitable_sessions_counts_smallest_profit(self) -> None:
+        """Test qu'un gain d'un litoshi compte comme session rentable."""
+        sessions = [
+            make_session([("0.00000001", 2.0, True)], "tiny"),
+            make_session([("1", 2.0, False)], "loss"),
+        ]
+
+        metrics = MultiSessionAnalyzer(sessions).get_aggregate_metrics()
+
+        assert metrics["aggregate_performance"]["profitable_sessions"] == 1
+
+    def test_aggregate_metrics_without_sessions(self) -> None:
+        """Test le message d'erreur sans session."""
+        assert MultiSessionAnalyzer([]).get_aggregate_metrics() == {"error": "No sessions provided"}
+
+    def test_compare_strategies_reuses_group_analyzers(self) -> None:
+        """Test que les métriques d'un même groupe de sessions ne sont calculées qu'une fois."""
+        sessions = self.make_sessions()
+        groups = {"mixed": sessions[:1], "others": sessions[1:]}
+        analyzer = MultiSessionAnalyzer([])
+
+        first = analyzer.compare_strategies(groups)
+        second = analyzer.compare_strategies(dict(groups))
+
+        # Mêmes valeurs, copies distinctes d'un calcul mis en cache une seule fois
+        assert second["strategy_metrics"]["mixed"] == first["strategy_metrics"]["mixed"]
+        assert second["strategy_metrics"]["mixed"] is not first["strategy_metrics"]["mixed"]
+        assert first["rankings"]["by_total_profit"] == ["mixed", "others"]
+        assert len(analyzer._group_analyzers) == 2
+        assert all("aggregate_metrics" in a.__dict__ for a in analyzer._group_analyzers.values())
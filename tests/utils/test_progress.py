@@ -0,0 +1,164 @@
+"""Tests pour le suivi de progression des simulations."""
+
+from decimal import Decimal
+from io import StringIO
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from rich.console import Console
+
+from dicebot.utils import progress as progress_module
+from dicebot.utils.progress import (
+    ProgressManager,
+    SimulationProgress,
+    get_progress_manager,
+    progress_manager,
+)
+
+
+def make_progress() -> SimulationProgress:
+    """Crée un suivi de progression écrivant dans un tampon."""
+    return SimulationProgress(Console(file=StringIO(), force_terminal=False))
+
+
+def make_result(profit: str, roi: float) -> Any:
+    """Crée un résultat de session minimal."""
+    return SimpleNamespace(
+        game_state=SimpleNamespace(total_profit=Decimal(profit), session_roi=roi)
+    )
+
+
+class TestSimulationProgress:
+    """Test du suivi de progression."""
+
+    def test_columns_not_shared_between_instances(self) -> None:
+        """Test que chaque barre a ses propres colonnes (cache de rendu par task id)."""
+        first = make_progress()
+        second = make_progress()
+
+        pairs = list(zip(first.progress.columns, second.progress.columns, strict=True))
+        assert [type(a) for a, _ in pairs] == [type(b) for _, b in pairs]
+        assert all(a is not b for a, b in pairs)
+
+    def test_manager_shares_console(self) -> None:
+        """Test que le gestionnaire global réutilise sa console."""
+        assert get_progress_manager() is progress_manager
+        assert progress_manager.simulation_progress.console is progress_manager.console
+
+        manager = ProgressManager()
+        assert manager is not progress_manager
+        assert manager.simulation_progress.console is manager.console
+
+    def test_description_updates_are_throttled(self) -> None:
+        """Test que la description n'est reconstruite qu'au plus toutes les 0,5 s."""
+        tracker = make_progress()
+        clock = iter([10.0, 10.2, 10.4, 10.6])
+
+        with (
+            patch.object(progress_module, "monotonic", lambda: next(clock)),
+            tracker.track_simulation("Sim", 4) as (task_id, update),
+        ):
+            task = tracker.progress.tasks[0]
+            update(make_result("1", 0.1))
+            assert task.description.startswith("Sim | Profit: 1.0000 LTC")
+            update(make_result("1", 0.1))
+            update(make_result("-1", -0.1))
+            assert task.description.startswith("Sim | Profit: 1.0000 LTC")
+            update(make_result("1", 0.1))
+            assert task.description.startswith("Sim | Profit: 2.0000 LTC")
+
+        assert task.completed == 4
+
+    def test_final_description_after_throttled_updates(self) -> None:
+        """Test que les statistiques finales sont affichées en fin de suivi."""
+        tracker = make_progress()
+
+        with (
+            patch.object(progress_module, "monotonic", lambda: 10.0),
+            tracker.track_simulation("Sim", 2) as (task_id, update),
+        ):
+            update(make_result("1", 0.1))
+            update(make_result("2", 0.2))
+
+        assert tracker.progress.tasks[0].description == (
+            "Sim | Profit: 3.0000 LTC | Profitable: 100.0% | Avg ROI: 15.00%"
+        )
+
+    def test_average_roi_is_exact_mean(self) -> None:
+        """Test que le ROI moyen affiché est la moyenne exacte des sessions."""
+        tracker = make_progress()
+        rois = [0.1, -0.3, 0.05, 0.2, -0.15]
+
+        with tracker.track_simulation("Sim", len(rois)) as (task_id, update):
+            for roi in rois:
+                update(make_result("0", roi))
+
+        assert tracker.progress.tasks[0].description.endswith(f"Avg ROI: {sum(rois) / 5:.2%}")
+
+    def test_comparison_description_follows_strategy(self) -> None:
+        """Test que la description de comparaison suit la stratégie courante."""
+        tracker = make_progress()
+
+        with tracker.track_comparison(["a", "b"], 2) as (task_id, update):
+            task = tracker.progress.tasks[0]
+            assert task.description == "Comparing 2 strategies"
+            update("a")
+            update("a")
+            assert task.description == "Comparing strategies (1/2) | Current: a"
+            update("b")
+            assert task.description == "Comparing strategies (2/2) | Current: b"
+            update(None)
+
+        assert task.completed == 4
+
+    def test_track_simulation_without_stats(self) -> None:
+        """Test que sans statistiques seule la barre avance."""
+        tracker = make_progress()
+
+        with tracker.track_simulation("Sim", 2, show_stats=False) as (task_id, update):
+            update(make_result("1", 0.1))
+            update(make_result("1", 0.1))
+
+        task = tracker.progress.tasks[0]
+        assert task.description == "Sim"
+        assert task.completed == 2
+
+    def test_results_without_game_state_only_count_sessions(self) -> None:
+        """Test qu'un résultat sans game_state est compté sans statistiques."""
+        tracker = make_progress()
+
+        with tracker.track_simulation("Sim", 2) as (task_id, update):
+            update(make_result("2", 0.4))
+            update(SimpleNamespace(status="failed"))
+
+        assert tracker.progress.tasks[0].description == (
+            "Sim | Profit: 2.0000 LTC | Profitable: 50.0% | Avg ROI: 20.00%"
+        )
+
+
+class TestProgressManager:
+    """Test du gestionnaire global."""
+
+    def capture(self, action: Any) -> str:
+        """Exécute une action d'affichage et retourne la sortie de la console."""
+        buffer = StringIO()
+        console = Console(file=buffer, force_terminal=False, width=200)
+        with patch.object(progress_manager, "console", console):
+            action()
+        return buffer.getvalue()
+
+    def test_print_batch_matches_individual_prints(self) -> None:
+        """Test qu'un affichage groupé produit la même sortie que des appels successifs."""
+        entries = [("warning", "w1"), ("info", "💡 tip"), ("error", "e1"), ("success", "ok")]
+
+        batched = self.capture(lambda: progress_manager.print_batch(entries))
+
+        def print_each() -> None:
+            progress_manager.print_warning("w1")
+            progress_manager.print_info("💡 tip")
+            progress_manager.print_error("e1")
+            progress_manager.print_success("ok")
+
+        assert batched == self.capture(print_each)
+        assert self.capture(lambda: progress_manager.print_batch([])) == ""
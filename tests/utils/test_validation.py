@@ -1,11 +1,22 @@
 """Tests pour le système de validation."""
 
 from decimal import Decimal
+from io import StringIO
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 
-from dicebot.utils.validation import ParameterValidator, RiskLevel, ValidationError
+from dicebot.utils._validation_core import martingale_max_bet
+from dicebot.utils.progress import progress_manager
+from dicebot.utils.validation import (
+    ParameterValidator,
+    RiskLevel,
+    ValidationError,
+    quiet_validation,
+    validate_and_suggest,
+)
 
 
 class TestParameterValidator:
@@ -139,6 +150,43 @@ class TestParameterValidator:
         suggestion_min = max(small_capital * Decimal("0.01"), Decimal("0.00015"))
         assert suggestion_min >= Decimal("0.00015")  # Minimum Bitsler
 
+    def test_calculate_martingale_max_bet_is_exact(self) -> None:
+        """Test que la mise maximale Martingale est exacte (pas d'arrondi flottant)."""
+        max_bet = ParameterValidator._calculate_martingale_max_bet(Decimal("1"), 5, 3.3)
+
+        assert max_bet == Decimal("391.35393")
+        assert ParameterValidator._calculate_martingale_max_bet(Decimal("0.1"), 7, 1.1) == Decimal(
+            "0.19487171"
+        )
+
+    def test_max_bet_calculations_are_memoized(self) -> None:
+        """Test que les mises maximales répétées viennent du cache."""
+        base_bet = Decimal("0.0042")
+        hits = martingale_max_bet.cache_info().hits
+
+        first = ParameterValidator._calculate_martingale_max_bet(base_bet, 12, 2.5)
+        second = ParameterValidator._calculate_martingale_max_bet(base_bet, 12, 2.5)
+
+        assert first == second == base_bet * Decimal("2.5") ** 12
+        assert martingale_max_bet.cache_info().hits == hits + 1
+
+    @pytest.mark.parametrize(
+        ("max_losses", "expected"),
+        [(0, "0.001"), (1, "0.001"), (2, "0.001"), (3, "0.002"), (10, "0.055"), (70, None)],
+    )
+    def test_calculate_fibonacci_max_bet(self, max_losses: int, expected: str | None) -> None:
+        """Test la mise maximale Fibonacci, y compris au-delà de la table précalculée."""
+        base_bet = Decimal("0.001")
+        if expected is None:
+            fib = [1, 1]
+            while len(fib) < max_losses:
+                fib.append(fib[-1] + fib[-2])
+            expected = str(base_bet * fib[-1])
+
+        result = ParameterValidator._calculate_fibonacci_max_bet(base_bet, max_losses)
+
+        assert result == Decimal(expected)
+
     def test_assess_risk_level_low(self) -> None:
         """Test évaluation risque faible."""
         config: dict[str, Any] = {"strategy": "flat", "base_bet": "0.001", "max_losses": 5}
@@ -187,6 +235,79 @@ class TestParameterValidator:
 
         assert risk == RiskLevel.EXTREME
 
+    @pytest.mark.parametrize(
+        ("strategy", "base_bet", "max_losses", "expected"),
+        [
+            ("flat", "2", 50, RiskLevel.LOW),
+            ("flat", "2.01", 5, RiskLevel.MEDIUM),
+            ("flat", "5", 5, RiskLevel.MEDIUM),
+            ("flat", "5.01", 5, RiskLevel.HIGH),
+            ("flat", "10", 5, RiskLevel.HIGH),
+            ("flat", "10.01", 5, RiskLevel.EXTREME),
+            ("martingale", "1", 5, RiskLevel.LOW),
+            ("martingale", "1", 6, RiskLevel.MEDIUM),
+            ("martingale", "1", 11, RiskLevel.HIGH),
+            ("martingale", "1", 16, RiskLevel.EXTREME),
+            ("fibonacci", "1", 15, RiskLevel.LOW),
+            ("dalembert", "1", 16, RiskLevel.MEDIUM),
+            ("fibonacci", "1", 21, RiskLevel.HIGH),
+        ],
+    )
+    def test_assess_risk_level_thresholds(
+        self, strategy: str, base_bet: str, max_losses: int, expected: RiskLevel
+    ) -> None:
+        """Test les seuils stricts du ratio de capital et de max_losses."""
+        config: dict[str, Any] = {
+            "strategy": strategy,
+            "base_bet": base_bet,
+            "max_losses": max_losses,
+        }
+
+        assert ParameterValidator.assess_risk_level(config, Decimal("100")) == expected
+
+    def test_assess_risk_level_with_precomputed_capital_float(self) -> None:
+        """Test que le capital flottant fourni par l'appelant donne le même niveau."""
+        capital = Decimal("100")
+        for base_bet in ("1", "2", "3", "6", "11"):
+            config: dict[str, Any] = {"strategy": "martingale", "base_bet": base_bet}
+
+            assert ParameterValidator.assess_risk_level(
+                config, capital, float(capital)
+            ) == ParameterValidator.assess_risk_level(config, capital)
+
+    def test_validate_many_matches_single_assessment(self) -> None:
+        """Test que la validation groupée donne les mêmes niveaux de risque."""
+        configs = [
+            (strategy, base_bet, max_losses)
+            for strategy in ("flat", "martingale", "fibonacci", "dalembert")
+            for base_bet in ("0.001", "1", "2.5", "5", "7", "10", "12")
+            for max_losses in (5, 6, 11, 16, 21)
+        ]
+        capital = Decimal("100")
+
+        results = ParameterValidator.validate_many(
+            [strategy for strategy, _, _ in configs],
+            [float(base_bet) for _, base_bet, _ in configs],
+            float(capital),
+            [max_losses for _, _, max_losses in configs],
+        )
+
+        for (strategy, base_bet, max_losses), row in zip(configs, results, strict=True):
+            config = {"strategy": strategy, "base_bet": base_bet, "max_losses": max_losses}
+            risk = ParameterValidator.assess_risk_level(config, capital)
+            assert RiskLevel(row["risk_level"]) == risk
+            assert row["very_risky"] == (Decimal(base_bet) / capital > Decimal("0.1"))
+
+    def test_validate_many_flags_martingale_and_capital(self) -> None:
+        """Test les indicateurs Martingale et le capital nul de la validation groupée."""
+        results = ParameterValidator.validate_many(
+            ["martingale", "fibonacci", "flat"], [1.0, 1.0, 1.0], [100.0, 100.0, 0.0], 7
+        )
+
+        assert results["martingale_max_bet"][0] == 128.0
+        assert results["exceeds_capital"].tolist() == [True, False, False]
+        assert RiskLevel(results["risk_level"][2]) == RiskLevel.EXTREME
+
     def test_validate_with_suggestions(self) -> None:
         """Test que la validation inclut des suggestions."""
         config: dict[str, Any] = {"strategy": "martingale", "base_bet": "5.0", "max_losses": 15}
@@ -206,6 +327,25 @@ class TestParameterValidator:
 
         assert suggestion_found
 
+    def test_missing_strategy_name_fails_fast(self) -> None:
+        """Test qu'une configuration sans stratégie échoue avant tout autre contrôle."""
+        config: dict[str, Any] = {"base_bet": "-1", "max_losses": 5}
+
+        with pytest.raises(ValidationError, match="^Validation failed: Strategy name is required$"):
+            ParameterValidator.validate_strategy_config(config, Decimal("100"))
+
+    def test_decimal_base_bet_accepted_as_is(self) -> None:
+        """Test qu'une mise de base déjà Decimal est acceptée telle quelle."""
+        config: dict[str, Any] = {
+            "strategy": "fibonacci",
+            "base_bet": Decimal("0.001"),
+            "max_losses": 8,
+        }
+
+        result = ParameterValidator.validate_strategy_config(config, Decimal("100"))
+
+        assert result["errors"] == []
+
     def test_edge_case_zero_capital(self) -> None:
         """Test cas limite avec capital zéro."""
         config: dict[str, Any] = {"strategy": "flat", "base_bet": "0.001"}
@@ -265,3 +405,35 @@ class TestParameterValidator:
         assert RiskLevel.LOW.value < RiskLevel.MEDIUM.value
         assert RiskLevel.MEDIUM.value < RiskLevel.HIGH.value
         assert RiskLevel.HIGH.value < RiskLevel.EXTREME.value
+
+
+class TestQuietValidation:
+    """Test la validation silencieuse pour les balayages de paramètres."""
+
+    def test_quiet_validation_collects_instead_of_printing(self) -> None:
+        """Test que les messages sont collectés et non affichés."""
+        buffer = StringIO()
+        config: dict[str, Any] = {"strategy": "flat", "base_bet": "0.2", "max_losses": 5}
+
+        with (
+            patch.object(progress_manager, "console", Console(file=buffer)),
+            quiet_validation() as messages,
+        ):
+            ParameterValidator.validate_capital("0.5")
+            assert validate_and_suggest(config, Decimal("1"))
+
+        assert buffer.getvalue() == ""
+        assert messages[0][0] == "warning"
+        assert messages[0][1].startswith("Capital is very small (0.5 LTC)")
+        assert ("warning", "Risk level: EXTREME") in messages
+
+    def test_messages_printed_outside_quiet_validation(self) -> None:
+        """Test qu'en dehors du contexte les messages sont affichés."""
+        buffer = StringIO()
+
+        with patch.object(progress_manager, "console", Console(file=buffer, width=200)):
+            with quiet_validation():
+                pass
+            ParameterValidator.validate_capital("0.5")
+
+        assert "Capital is very small (0.5 LTC)" in buffer.getvalue()
@@ -0,0 +1,65 @@
+"""Tests pour la validation simplifiée."""
+
+from decimal import Decimal
+
+import pytest
+
+from dicebot.utils.validation_simple import ParameterValidator
+
+
+class TestParameterValidator:
+    """Test le validateur simplifié."""
+
+    @pytest.mark.parametrize(
+        ("max_losses", "expected"),
+        [(0, "0.001"), (1, "0.001"), (2, "0.002"), (5, "0.012"), (10, "0.143")],
+    )
+    def test_estimate_fibonacci_requirement(self, max_losses: int, expected: str) -> None:
+        """Test le capital requis : somme des mises de la suite de Fibonacci."""
+        result = ParameterValidator.estimate_fibonacci_requirement(Decimal("0.001"), max_losses)
+
+        assert result == Decimal(expected)
+
+    def test_estimate_fibonacci_requirement_beyond_table(self) -> None:
+        """Test que le calcul reste exact au-delà de la table précalculée."""
+        fib = [1, 1]
+        while len(fib) < 80:
+            fib.append(fib[-1] + fib[-2])
+
+        result = ParameterValidator.estimate_fibonacci_requirement(Decimal("1"), 80)
+
+        assert result == sum(fib)
+
+    def test_validate_strategy_config_suggests_safer_bet(self) -> None:
+        """Test la suggestion d'une mise de base à 1 % du capital."""
+        config = {"strategy": "flat", "base_bet": "20", "max_losses": 5}
+
+        warnings = ParameterValidator.validate_strategy_config(config, Decimal("100"))
+
+        assert warnings["base_bet"] == (
+            "base_bet is 20.0% of capital - very risky. "
+            "Consider reducing base_bet to 1.000000 LTC (1% of capital)"
+        )
+
+    @pytest.mark.parametrize(
+        ("capital", "base_bet", "expected"),
+        [
+            ("0", "1", 0),
+            ("100", "0", 0),
+            ("1", "1", 1),
+            ("14", "1", 2),  # 1 + 2 + 4 = 7 = 50 % du capital, exactement
+            ("13.99", "1", 1),
+            ("0.6", "0.1", 1),  # 0.1 + 0.2 = 0.3, frontière non représentable en flottant
+            ("100", "0.001", 14),
+            ("100000", "0.00015", 19),
+        ],
+    )
+    def test_calculate_martingale_max_safe_losses(
+        self, capital: str, base_bet: str, expected: int
+    ) -> None:
+        """Test les pertes sûres Martingale, y compris aux frontières exactes."""
+        result = ParameterValidator.calculate_martingale_max_safe_losses(
+            Decimal(capital), Decimal(base_bet)
+        )
+
+        assert result == expected